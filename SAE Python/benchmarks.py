@@ -0,0 +1,1186 @@
+# benchmarks.py - Mesures de performance pour BZZZ
+"""
+Mesures de performance des fonctions critiques du modèle BZZZ.
+
+Ce fichier chronomètre les fonctions les plus appelées pendant une partie
+sur des plateaux fixés par une graine (résultats comparables d'un lancement
+à l'autre).
+
+La suite de référence (bench_fonctions, bench_parties) mesure toujours les
+mêmes choses : fonctions du modèle et de l'IA sur des plateaux fixés, puis
+parties complètes 4 IA sans interface. Ses résultats s'écrivent en JSON
+pour comparer deux lancements (avant / après une optimisation).
+
+Pour lancer les mesures:
+    python benchmarks.py                            # toutes les mesures
+    python benchmarks.py --suite --sortie avant.json
+    python benchmarks.py --suite --sortie apres.json
+    python benchmarks.py --comparer avant.json apres.json
+"""
+import argparse
+import json
+import math
+import platform
+import random
+import time
+import tracemalloc
+from model import *
+
+
+# ============================================================================
+# PLATEAUX DE TEST
+# ============================================================================
+
+def creer_plateau_encombre(nb_abeilles_par_ruche, graine=0):
+    """
+    Crée un plateau avec fleurs et abeilles placées au hasard.
+
+    Chaque ruche reçoit nb_abeilles_par_ruche abeilles (types tirés au hasard)
+    sur des cases libres hors des zones ennemies.
+
+    Args:
+        nb_abeilles_par_ruche (int): Nombre d'abeilles de chaque ruche
+        graine (int): Graine du tirage (même graine = même plateau)
+
+    Returns:
+        tuple: (plateau, ruches)
+    """
+    rng = random.Random(graine)
+
+    plateau = creer_plateau()
+    ruches = creer_ruche(plateau)
+    placer_fleurs(plateau, creer_fleurs(NFLEURS), rng)
+
+    for joueur in range(4):
+        ruche = ruches[joueur]
+        for _ in range(nb_abeilles_par_ruche):
+            while True:
+                x = rng.randrange(NCASES)
+                y = rng.randrange(NCASES)
+                zone_ennemie = False
+                for i in range(4):
+                    if i != joueur and dans_zone_ruche((x, y), i):
+                        zone_ennemie = True
+                if case_libre_abeille(plateau, x, y) and not zone_ennemie:
+                    break
+            role = rng.choice(["ouvriere", "eclaireuse", "bourdon"])
+            abeille = creer_abeille(role, (x, y), joueur)
+            ruche.abeilles.append(abeille)
+            placer_abeille(plateau, abeille)
+
+    return plateau, ruches
+
+
+def chronometrer(fonction, nb_appels, nb_repetitions=5):
+    """
+    Mesure le temps moyen d'un appel de fonction.
+
+    Args:
+        fonction (function): Fonction sans argument à mesurer
+        nb_appels (int): Nombre d'appels par mesure
+        nb_repetitions (int): Nombre de mesures (on garde la meilleure)
+
+    Returns:
+        float: Temps par appel en microsecondes (meilleure mesure)
+    """
+    meilleur = None
+    for _ in range(nb_repetitions):
+        debut = time.perf_counter()
+        for _ in range(nb_appels):
+            fonction()
+        duree = time.perf_counter() - debut
+        if meilleur is None or duree < meilleur:
+            meilleur = duree
+    return meilleur / nb_appels * 1e6
+
+
+# ============================================================================
+# OCCUPATION DES CASES
+# ============================================================================
+
+def case_libre_par_parcours(plateau, x, y):
+    """
+    Ancienne version de case_libre_abeille() (parcours de la case).
+
+    Gardée uniquement comme référence pour mesurer le gain de l'index
+    d'occupation du plateau.
+    """
+    for element in plateau[x][y]:
+        if element.type == "abeille":
+            return False
+    return True
+
+
+def bench_occupation(densites=(4, 16, 32, 48)):
+    """
+    Compare le test d'occupation par parcours et par index d'occupation.
+
+    Pour chaque densité, mesure le test des 256 cases puis le calcul
+    des déplacements possibles de toutes les abeilles.
+
+    Args:
+        densites (tuple): Nombres d'abeilles par ruche à mesurer
+
+    Returns:
+        list: Une ligne de résultats (dict) par densité
+    """
+    resultats = []
+    print("\nOccupation des cases (µs par balayage du plateau)")
+    print(f"{'abeilles':>9} {'parcours':>10} {'index':>10} {'gain':>6}")
+
+    for nb in densites:
+        plateau, ruches = creer_plateau_encombre(nb)
+
+        def balayage_parcours():
+            for x in range(NCASES):
+                for y in range(NCASES):
+                    case_libre_par_parcours(plateau, x, y)
+
+        def balayage_index():
+            for x in range(NCASES):
+                for y in range(NCASES):
+                    case_libre_abeille(plateau, x, y)
+
+        t_parcours = chronometrer(balayage_parcours, 200)
+        t_index = chronometrer(balayage_index, 200)
+
+        abeilles = [a for ruche in ruches for a in ruche.abeilles]
+        t_cases = chronometrer(lambda: [calculer_cases_disponibles(a, plateau) for a in abeilles], 50)
+
+        print(f"{nb * 4:>9} {t_parcours:>10.1f} {t_index:>10.1f} {t_parcours / t_index:>5.1f}x"
+              f"   (calculer_cases_disponibles x{len(abeilles)} : {t_cases:.1f} µs)")
+        resultats.append({
+            "abeilles": nb * 4,
+            "parcours_us": t_parcours,
+            "index_us": t_index,
+            "cases_disponibles_us": t_cases
+        })
+
+    return resultats
+
+
+# ============================================================================
+# ENTITES (__slots__ / dictionnaires)
+# ============================================================================
+
+def abeille_dict(role, position, camp):
+    """
+    Ancienne représentation d'une abeille (dictionnaire), pour comparaison.
+    """
+    return {
+        "type": "abeille", "role": role, "camp": camp, "position": position,
+        "direction": "droite", "nectar": 0, "etat": "OK", "a_bouge": False,
+        "tours_ko_restants": 0
+    }
+
+
+def mesurer_memoire(fabrique, nb):
+    """
+    Mesure la mémoire occupée par nb objets créés par fabrique().
+
+    Returns:
+        float: Octets par objet
+    """
+    tracemalloc.start()
+    objets = [fabrique(i) for i in range(nb)]
+    taille, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objets
+    return taille / nb
+
+
+def bench_entites(nb=10000):
+    """
+    Compare les abeilles à __slots__ et les anciens dictionnaires.
+
+    Mesure la mémoire par abeille et le temps de lecture de 3 champs
+    (etat, role, nectar) par attribut, par clé d'objet et par clé de dict.
+
+    Args:
+        nb (int): Nombre d'abeilles créées pour la mesure mémoire
+
+    Returns:
+        dict: Résultats de la mesure
+    """
+    octets_dict = mesurer_memoire(lambda i: abeille_dict("ouvriere", (i % 16, i // 16), "ruche0"), nb)
+    octets_slots = mesurer_memoire(lambda i: creer_abeille("ouvriere", (i % 16, i // 16), 0), nb)
+
+    a_dict = abeille_dict("ouvriere", (5, 5), "ruche0")
+    a_obj = creer_abeille("ouvriere", (5, 5), 0)
+    t_dict = chronometrer(lambda: (a_dict["etat"], a_dict["role"], a_dict["nectar"]), 20000)
+    t_attr = chronometrer(lambda: (a_obj.etat, a_obj.role, a_obj.nectar), 20000)
+    t_compat = chronometrer(lambda: (a_obj["etat"], a_obj["role"], a_obj["nectar"]), 20000)
+
+    print("\nEntités : abeille dict / __slots__")
+    print(f"  mémoire      : {octets_dict:.0f} o -> {octets_slots:.0f} o par abeille")
+    print(f"  lecture x3   : dict {t_dict * 1000:.0f} ns, attribut {t_attr * 1000:.0f} ns, "
+          f"compatibilité abeille[\"cle\"] {t_compat * 1000:.0f} ns")
+
+    return {
+        "octets_dict": octets_dict,
+        "octets_slots": octets_slots,
+        "lecture_dict_us": t_dict,
+        "lecture_attribut_us": t_attr,
+        "lecture_compat_us": t_compat
+    }
+
+
+# ============================================================================
+# ESCARMOUCHE
+# ============================================================================
+
+def trouver_opposantes_par_parcours(plateau, abeille):
+    """
+    Ancienne version de trouver_opposantes() (parcours des 8 cases).
+
+    Gardée uniquement comme référence pour mesurer le gain de l'escarmouche.
+    """
+    opposantes = []
+    x, y = abeille.position
+    for dx in [-1, 0, 1]:
+        for dy in [-1, 0, 1]:
+            if dx == 0 and dy == 0:
+                continue
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < NCASES and 0 <= ny < NCASES:
+                for element in plateau[nx][ny]:
+                    if (element.type == "abeille" and
+                        element.joueur != abeille.joueur and
+                        element.etat == "OK"):
+                        opposantes.append(element)
+    return opposantes
+
+
+def probas_par_recalcul(plateau, ruche):
+    """
+    Ancien calcul des probabilités d'esquive d'une ruche : les opposantes
+    de chaque opposante sont recherchées à nouveau pour chaque abeille.
+
+    Returns:
+        list: Probabilité d'esquive de chaque abeille en escarmouche
+    """
+    probas = []
+    for abeille in ruche.abeilles:
+        if abeille.etat != "OK":
+            continue
+        opposantes = trouver_opposantes_par_parcours(plateau, abeille)
+        if len(opposantes) == 0:
+            continue
+        somme_fe = 0
+        for opposante in opposantes:
+            somme_fe += calculer_force_effective(opposante, trouver_opposantes_par_parcours(plateau, opposante))
+        force = FORCE[abeille.role]
+        probas.append(force / (force + somme_fe))
+    return probas
+
+
+def probas_partagees(plateau, ruche):
+    """
+    Calcul actuel (celui de phase_escarmouche) : FE partagées entre abeilles.
+
+    Returns:
+        list: Probabilité d'esquive de chaque abeille en escarmouche
+    """
+    probas = []
+    forces = {}
+    for abeille in ruche.abeilles:
+        if abeille.etat != "OK":
+            continue
+        opposantes = trouver_opposantes(plateau, abeille)
+        if len(opposantes) == 0:
+            continue
+        probas.append(calculer_proba_esquive(abeille, opposantes, plateau, forces))
+    return probas
+
+
+def bench_escarmouche(densites=(8, 24, 48)):
+    """
+    Compare le calcul des probabilités d'esquive des 4 ruches avant/après
+    le partage des forces effectives.
+
+    Args:
+        densites (tuple): Nombres d'abeilles par ruche à mesurer
+
+    Returns:
+        list: Une ligne de résultats (dict) par densité
+    """
+    resultats = []
+    print("\nEscarmouche (µs pour les 4 ruches)")
+    print(f"{'abeilles':>9} {'recalcul':>10} {'partage':>10} {'gain':>6}")
+
+    for nb in densites:
+        plateau, ruches = creer_plateau_encombre(nb)
+        assert all(probas_par_recalcul(plateau, r) == probas_partagees(plateau, r) for r in ruches)
+
+        t_avant = chronometrer(lambda: [probas_par_recalcul(plateau, r) for r in ruches], 20)
+        t_apres = chronometrer(lambda: [probas_partagees(plateau, r) for r in ruches], 20)
+
+        print(f"{nb * 4:>9} {t_avant:>10.1f} {t_apres:>10.1f} {t_avant / t_apres:>5.1f}x")
+        resultats.append({
+            "abeilles": nb * 4,
+            "recalcul_us": t_avant,
+            "partage_us": t_apres
+        })
+
+    return resultats
+
+
+# ============================================================================
+# SIMULATEUR VECTORISE
+# ============================================================================
+
+def bench_simulateur(nb_parties=200):
+    """
+    Compare le nombre de parties IA par seconde : moteur / simulateur NumPy.
+
+    Args:
+        nb_parties (int): Taille du lot simulé (le moteur en joue 10)
+
+    Returns:
+        dict: Résultats de la mesure (None si NumPy n'est pas installé)
+    """
+    from moteur import creer_moteur
+    from simulateur import np, simuler_parties
+    if np is None:
+        print("\nSimulateur : numpy absent, mesure ignorée")
+        return None
+
+    debut = time.perf_counter()
+    for graine in range(10):
+        creer_moteur(graine=graine).jouer_jusqu_a_la_fin()
+    par_partie_moteur = (time.perf_counter() - debut) / 10
+
+    debut = time.perf_counter()
+    simuler_parties(range(nb_parties))
+    par_partie_lot = (time.perf_counter() - debut) / nb_parties
+
+    print("\nParties 4 IA (ms par partie)")
+    print(f"  moteur : {par_partie_moteur * 1000:.1f}   simulateur (lot de {nb_parties}) : "
+          f"{par_partie_lot * 1000:.1f}   gain {par_partie_moteur / par_partie_lot:.1f}x")
+
+    return {
+        "moteur_ms": par_partie_moteur * 1000,
+        "simulateur_ms": par_partie_lot * 1000,
+        "taille_lot": nb_parties
+    }
+
+
+# ============================================================================
+# SAUVEGARDE
+# ============================================================================
+
+def bench_sauvegarde(graine=0, nb_etapes=600):
+    """
+    Compare l'instantané binaire (sauvegarde.py) et un pickle de la partie.
+
+    Args:
+        graine (int): Graine de la partie mesurée
+        nb_etapes (int): Nombre de phases jouées avant la mesure
+
+    Returns:
+        dict: Tailles (octets) et temps d'aller-retour (µs)
+    """
+    import pickle
+    from moteur import charger_moteur, creer_moteur
+
+    moteur = creer_moteur(graine=graine)
+    for _ in range(nb_etapes):
+        moteur.etape()
+    nb_abeilles = sum(len(ruche.abeilles) for ruche in moteur.ruches)
+
+    donnees = moteur.sauvegarder(avec_hasard=False)
+    etat = (moteur.plateau, moteur.ruches)
+    octets_pickle = len(pickle.dumps(etat))
+
+    t_encodage = chronometrer(lambda: moteur.sauvegarder(avec_hasard=False), 500)
+    t_decodage = chronometrer(lambda: charger_moteur(donnees), 200)
+    t_pickle = chronometrer(lambda: pickle.loads(pickle.dumps(etat)), 50)
+
+    print(f"\nSauvegarde ({nb_abeilles} abeilles, tour {moteur.tour})")
+    print(f"  taille        : instantané {len(donnees)} o, pickle {octets_pickle} o")
+    print(f"  aller-retour  : instantané {t_encodage:.0f} + {t_decodage:.0f} µs, pickle {t_pickle:.0f} µs")
+
+    return {
+        "abeilles": nb_abeilles,
+        "octets_instantane": len(donnees),
+        "octets_pickle": octets_pickle,
+        "encodage_us": t_encodage,
+        "decodage_us": t_decodage,
+        "pickle_us": t_pickle
+    }
+
+
+# ============================================================================
+# COUPS JOUES / ANNULES
+# ============================================================================
+
+def bench_coups(graine=0, nb_etapes=600):
+    """
+    Compare l'exploration d'un coup par copie du plateau et par le journal.
+
+    Pour chaque abeille active du joueur 0 et chaque case possible : jouer
+    le déplacement et le butinage, puis revenir à la position de départ.
+
+    Args:
+        graine (int): Graine de la partie mesurée
+        nb_etapes (int): Nombre de phases jouées avant la mesure
+
+    Returns:
+        dict: Temps par coup exploré (µs) avec copie et avec le journal
+    """
+    import copy
+    from coups import Journal
+    from moteur import creer_moteur
+
+    moteur = creer_moteur(graine=graine)
+    for _ in range(nb_etapes):
+        moteur.etape()
+    plateau, ruches = moteur.plateau, moteur.ruches
+    coups = [(i, case) for i, abeille in enumerate(ruches[0].abeilles) if abeille.etat == "OK"
+             for case in calculer_cases_disponibles(abeille, plateau)]
+    if not coups:
+        print("\nCoups : aucun coup possible, mesure ignorée")
+        return None
+
+    def par_copie():
+        for i, case in coups:
+            plateau_copie, ruches_copie = copy.deepcopy((plateau, ruches))
+            abeille = ruches_copie[0].abeilles[i]
+            tenter_deplacement(plateau_copie, abeille, case, ruches_copie)
+            tenter_butinage(plateau_copie, abeille, ruches_copie[0])
+
+    journal = Journal(plateau, ruches)
+
+    def par_journal():
+        for i, case in coups:
+            abeille = ruches[0].abeilles[i]
+            journal.deplacer(abeille, case)
+            journal.butiner(abeille)
+            journal.annuler_jusqu_a(0)
+
+    t_copie = chronometrer(par_copie, 1, 3) / len(coups)
+    t_journal = chronometrer(par_journal, 20) / len(coups)
+
+    print(f"\nCoups explorés ({len(coups)} déplacements + butinage, µs par coup)")
+    print(f"  copie du plateau : {t_copie:.0f}   journal : {t_journal:.1f}   gain {t_copie / t_journal:.0f}x")
+
+    return {
+        "coups": len(coups),
+        "copie_us": t_copie,
+        "journal_us": t_journal
+    }
+
+
+# ============================================================================
+# TRANSPOSITIONS (ZOBRIST)
+# ============================================================================
+
+def bench_transposition(graine=0, nb_etapes=600, nb_abeilles=3):
+    """
+    Mesure les positions répétées d'une recherche en phase de mouvement.
+
+    Explore tous les ordres de déplacement d'une case de nb_abeilles abeilles
+    du joueur 0 (journal des coups) et évalue chaque position finale, sans
+    puis avec une table de transposition indexée par plateau.cle (hachage
+    activé pour la mesure).
+
+    Args:
+        graine (int): Graine de la partie mesurée
+        nb_etapes (int): Nombre de phases jouées avant la mesure
+        nb_abeilles (int): Nombre d'abeilles déplacées (profondeur)
+
+    Returns:
+        dict: Feuilles, positions distinctes et temps sans/avec la table (ms)
+    """
+    from coups import Journal
+    from ia import creer_ia
+    from moteur import creer_moteur
+    from zobrist import TableTransposition
+
+    moteur = creer_moteur(graine=graine)
+    for _ in range(nb_etapes):
+        moteur.etape()
+    plateau, ruches = moteur.plateau, moteur.ruches
+    activer_hachage(plateau, ruches)
+    ruche = ruches[0]
+    abeilles = [a for a in ruche.abeilles if a.etat == "OK" and not a.a_bouge][:nb_abeilles]
+    if len(abeilles) < nb_abeilles:
+        print("\nTranspositions : pas assez d'abeilles, mesure ignorée")
+        return None
+    ia = creer_ia()
+    journal = Journal(plateau, ruches)
+
+    def evaluer():
+        return sum(ia._evaluer_case(plateau, a.position, a, ruche, 0) for a in ruche.abeilles)
+
+    def explorer(restantes, table, compteur):
+        if not restantes:
+            compteur[0] += 1
+            if table is not None:
+                entree = table.chercher(plateau.cle)
+                if entree is not None:
+                    return entree[1]
+            valeur = evaluer()
+            if table is not None:
+                table.enregistrer(plateau.cle, 0, valeur)
+            return valeur
+        meilleure = None
+        for abeille in restantes:
+            autres = [a for a in restantes if a is not abeille]
+            for case in calculer_cases_disponibles(abeille, plateau):
+                journal.deplacer(abeille, case)
+                valeur = explorer(autres, table, compteur)
+                journal.annuler()
+                if meilleure is None or valeur > meilleure:
+                    meilleure = valeur
+        return meilleure
+
+    compteur = [0]
+    debut = time.perf_counter()
+    sans = explorer(abeilles, None, compteur)
+    t_sans = time.perf_counter() - debut
+
+    table = TableTransposition(16)
+    debut = time.perf_counter()
+    avec = explorer(abeilles, table, [0])
+    t_avec = time.perf_counter() - debut
+    assert sans == avec
+
+    print(f"\nTranspositions ({nb_abeilles} abeilles, tous les ordres de déplacement)")
+    print(f"  feuilles : {compteur[0]}, positions distinctes : {table.manquees} "
+          f"({table.trouvees} retrouvées dans la table)")
+    print(f"  temps : sans table {t_sans * 1000:.0f} ms, avec table {t_avec * 1000:.0f} ms")
+
+    return {
+        "feuilles": compteur[0],
+        "positions_distinctes": table.manquees,
+        "sans_table_ms": t_sans * 1000,
+        "avec_table_ms": t_avec * 1000
+    }
+
+
+# ============================================================================
+# RECHERCHE MCTS SUR PLUSIEURS CŒURS
+# ============================================================================
+
+def bench_mcts_parallele(graine=0, nb_etapes=600, temps=1.0, nb_processus=None):
+    """
+    Mesure les playouts par seconde de IA_MCTS selon le nombre de processus.
+
+    La recherche porte sur le mouvement du joueur actuel d'une partie en
+    cours. Une première recherche non mesurée lance les processus.
+
+    Args:
+        graine (int): Graine de la partie mesurée
+        nb_etapes (int): Nombre de phases jouées avant la mesure
+        temps (float): Temps de chaque recherche (secondes)
+        nb_processus (list): Nombres de processus mesurés (par défaut 1, 2,
+                             4... jusqu'au nombre de cœurs)
+
+    Returns:
+        dict: Playouts par seconde pour chaque nombre de processus
+    """
+    import os
+    from ia_mcts import IA_MCTS, fermer_executeur
+    from moteur import creer_moteur
+
+    moteur = creer_moteur(graine=graine)
+    for _ in range(nb_etapes):
+        moteur.etape()
+    while moteur.phase != "mouvement" or not any(
+            abeille.etat == "OK" and not abeille.a_bouge for abeille in moteur.ruche_actuelle().abeilles):
+        moteur.etape()
+    ruche = moteur.ruche_actuelle()
+
+    if nb_processus is None:
+        coeurs = os.cpu_count() or 1
+        nb_processus = [1]
+        while nb_processus[-1] * 2 <= max(coeurs, 2):
+            nb_processus.append(nb_processus[-1] * 2)
+
+    print(f"\nMCTS sur plusieurs cœurs (tour {moteur.tour}, {os.cpu_count()} cœurs, {temps:.1f} s par recherche)")
+    resultats = {}
+    for nb in nb_processus:
+        ia = IA_MCTS(random.Random(graine), temps=temps, processus=nb)
+        ia.jouer_tour_mouvement(moteur.plateau, ruche, moteur.ruches)
+        ia.jouer_tour_mouvement(moteur.plateau, ruche, moteur.ruches)
+        par_seconde = ia.derniere_recherche["iterations"] / ia.derniere_recherche["duree"]
+        resultats[nb] = par_seconde
+        print(f"  {nb:3d} processus : {par_seconde:8.0f} playouts/s   x{par_seconde / resultats[1]:.1f}")
+    fermer_executeur()
+
+    return {"playouts_par_seconde": resultats}
+
+
+# ============================================================================
+# CARTES DE CHALEUR DE L'IA
+# ============================================================================
+
+def bench_cartes_ia(densites=(4, 16, 32, 48)):
+    """
+    Compare deux façons de noter les cases des abeilles de l'IA : case par
+    case (IA_BZZZ._evaluer_case) et par les cartes de chaleur (cartes.py).
+
+    Mesure les mouvements des 4 ruches (quelques cases candidates par
+    abeille) et la note de toutes les cases du plateau. Les deux façons
+    doivent donner les mêmes notes.
+
+    Args:
+        densites (tuple): Nombres d'abeilles par ruche à mesurer
+
+    Returns:
+        list: Une ligne de résultats (dict) par densité
+    """
+    from cartes import CARTES_NUMPY, cartes_ia
+    from ia import IA_BZZZ
+
+    resultats = []
+    print(f"\nNotes de l'IA (µs pour les 4 ruches, cartes {'NumPy' if CARTES_NUMPY else 'Python'})")
+    print(f"{'abeilles':>9} {'mouv. case':>11} {'cartes':>8} {'plateau case':>13} {'cartes':>8}")
+
+    ia = IA_BZZZ(random.Random(0))
+    for nb in densites:
+        plateau, ruches = creer_plateau_encombre(nb)
+        abeilles = [(abeille, ruche) for ruche in ruches for abeille in ruche.abeilles if abeille.etat == "OK"]
+        cases = [(x, y) for x in range(NCASES) for y in range(NCASES)]
+
+        def mouvements(avec_cartes):
+            coups = []
+            for ruche in ruches:
+                cartes = cartes_ia(plateau, ruche.joueur, ruches) if avec_cartes else None
+                coups.extend(ia._trouver_meilleur_mouvement(plateau, abeille, ruche, ruches, cartes)
+                             for abeille in ruche.abeilles if abeille.etat == "OK")
+            return coups
+
+        def notes_plateau(avec_cartes):
+            notes = []
+            for ruche in ruches:
+                cartes = cartes_ia(plateau, ruche.joueur, ruches) if avec_cartes else None
+                abeille = next((a for a, r in abeilles if r is ruche), None)
+                if abeille is not None:
+                    notes.append([ia._evaluer_case(plateau, case, abeille, ruche, ruche.joueur, cartes)
+                                  for case in cases])
+            return notes
+
+        assert mouvements(False) == mouvements(True)
+        assert notes_plateau(False) == notes_plateau(True)
+        t_mouv_case = chronometrer(lambda: mouvements(False), 20)
+        t_mouv_cartes = chronometrer(lambda: mouvements(True), 20)
+        t_plateau_case = chronometrer(lambda: notes_plateau(False), 5)
+        t_plateau_cartes = chronometrer(lambda: notes_plateau(True), 5)
+
+        print(f"{nb * 4:>9} {t_mouv_case:>11.1f} {t_mouv_cartes:>8.1f} "
+              f"{t_plateau_case:>13.1f} {t_plateau_cartes:>8.1f}")
+        resultats.append({
+            "abeilles": nb * 4,
+            "mouvements_case_us": t_mouv_case,
+            "mouvements_cartes_us": t_mouv_cartes,
+            "plateau_case_us": t_plateau_case,
+            "plateau_cartes_us": t_plateau_cartes
+        })
+
+    return resultats
+
+# ============================================================================
+# PREMOVES (PLUS COURTS CHEMINS)
+# ============================================================================
+
+def bench_planification(tailles=(6, 12, 24), graine=0):
+    """
+    Mesure la planification commune des prémoves d'une ruche : temps par
+    tour et tours pour que toutes les abeilles arrivent.
+
+    Les destinations sont serrées autour du centre du plateau (abeilles qui
+    vont toutes à la même fleur), avec 10 ennemis comme obstacles.
+
+    Args:
+        tailles (tuple): Nombres d'abeilles planifiées ensemble
+        graine (int): Graine des positions de départ
+
+    Returns:
+        list: Une ligne de résultats (dict) par nombre d'abeilles
+    """
+    from chemins import planifier_deplacements
+
+    resultats = []
+    print("\nPrémoves planifiés ensemble (destinations autour du centre)")
+    print(f"{'abeilles':>9} {'ms/tour':>9} {'tours':>6} {'arrivées':>9}")
+
+    for nb in tailles:
+        rng = random.Random(graine)
+        plateau = creer_plateau()
+        ruches = creer_ruche(plateau)
+        cases = [(x, y) for x in range(NCASES) for y in range(NCASES) if plateau.tables.zones[x][y] in (-1, 0)]
+        rng.shuffle(cases)
+        centre = NCASES // 2
+        destinations = sorted(cases, key=lambda case: abs(case[0] - centre) + abs(case[1] - centre))[:nb]
+        departs = [case for case in cases if case not in destinations]
+        abeilles = []
+        for i, destination in enumerate(destinations):
+            abeille = creer_abeille(ROLES[i % 3], departs[i], 0)
+            abeille.destination_automatique = destination
+            abeilles.append(abeille)
+        for abeille in abeilles + [creer_abeille("bourdon", case, 2) for case in departs[nb:nb + 10]]:
+            ruches[abeille.joueur].abeilles.append(abeille)
+            placer_abeille(plateau, abeille)
+
+        duree = 0.0
+        tours = 0
+        while tours < 100 and any(abeille.destination_automatique for abeille in abeilles):
+            debut = time.perf_counter()
+            planifier_deplacements(plateau, [abeille for abeille in abeilles if abeille.destination_automatique])
+            duree += time.perf_counter() - debut
+            executer_deplacements_automatiques(ruches[0], plateau, ruches)
+            nouveau_tour(ruches, plateau)
+            tours += 1
+        arrivees = sum(abeille.position == destination for abeille, destination in zip(abeilles, destinations))
+
+        print(f"{nb:>9} {duree / tours * 1000:>9.2f} {tours:>6} {arrivees:>5}/{nb}")
+        resultats.append({
+            "abeilles": nb,
+            "ms_par_tour": duree / tours * 1000,
+            "tours": tours,
+            "arrivees": arrivees
+        })
+
+    return resultats
+
+# ============================================================================
+# IA PAR AFFECTATION
+# ============================================================================
+
+def bench_affectation(densites=(4, 16, 32, 48)):
+    """
+    Mesure la phase de mouvement de IA_AFFECTATION contre celle de IA_BZZZ.
+
+    Pour IA_AFFECTATION : premier tour (toutes les abeilles affectées) et
+    tour suivant sur la même position (cibles gardées, rien à réaffecter).
+
+    Args:
+        densites (tuple): Nombres d'abeilles par ruche à mesurer
+
+    Returns:
+        list: Une ligne de résultats (dict) par densité
+    """
+    from ia import IA_BZZZ
+    from ia_affectation import IA_AFFECTATION
+
+    resultats = []
+    print("\nPhase de mouvement de l'IA (µs pour les 4 ruches)")
+    print(f"{'abeilles':>9} {'IA_BZZZ':>9} {'affect.':>9} {'gardées':>9}")
+
+    for nb in densites:
+        plateau, ruches = creer_plateau_encombre(nb)
+        glouton = IA_BZZZ(random.Random(0))
+        gardees = [IA_AFFECTATION(random.Random(0)) for _ in ruches]
+
+        def tour(ias):
+            for ia, ruche in zip(ias, ruches):
+                ia.jouer_tour_mouvement(plateau, ruche, ruches)
+
+        tour(gardees)
+        t_glouton = chronometrer(lambda: tour([glouton] * len(ruches)), 10)
+        t_affectation = chronometrer(lambda: tour([IA_AFFECTATION(random.Random(0)) for _ in ruches]), 10)
+        t_gardees = chronometrer(lambda: tour(gardees), 10)
+
+        print(f"{nb * 4:>9} {t_glouton:>9.1f} {t_affectation:>9.1f} {t_gardees:>9.1f}")
+        resultats.append({
+            "abeilles": nb * 4,
+            "glouton_us": t_glouton,
+            "affectation_us": t_affectation,
+            "gardees_us": t_gardees
+        })
+
+    return resultats
+
+
+# ============================================================================
+# PASSAGE A L'ECHELLE (TAILLE DU PLATEAU, NOMBRE D'ABEILLES)
+# ============================================================================
+
+PHASES = ("ponte", "mouvement", "butinage", "escarmouche", "nouveau_tour", "fin_de_partie")
+
+
+def creer_grand_plateau(taille, nb_abeilles_par_ruche, graine=0):
+    """
+    Crée un plateau de taille quelconque, fleurs et abeilles placées au hasard.
+
+    Comme creer_plateau_encombre(), avec NFLEURS fleurs par carré de 16x16
+    (même densité de fleurs que le jeu).
+
+    Args:
+        taille (int): Taille du plateau (paire, au moins 16)
+        nb_abeilles_par_ruche (int): Nombre d'abeilles de chaque ruche
+        graine (int): Graine du tirage
+
+    Returns:
+        tuple: (plateau, ruches)
+    """
+    rng = random.Random(graine)
+    plateau = Plateau(taille)
+    ruches = creer_ruche(plateau)
+    placer_fleurs(plateau, creer_fleurs(NFLEURS * (taille // NCASES) ** 2), rng)
+    plateau.nectar_fleurs = calculer_nectar_total_initial(plateau)
+
+    zones = plateau.tables.zones
+    cases = [(x, y) for x in range(taille) for y in range(taille)]
+    rng.shuffle(cases)
+    libres = iter(cases)
+    for ruche in ruches:
+        for _ in range(nb_abeilles_par_ruche):
+            x, y = next(case for case in libres if zones[case[0]][case[1]] in (-1, ruche.joueur))
+            abeille = creer_abeille(rng.choice(ROLES), (x, y), ruche.joueur)
+            abeille.nectar = rng.randint(0, CAPACITE_NECTAR[abeille.role])
+            plateau.nectar_abeilles += abeille.nectar
+            ruche.abeilles.append(abeille)
+            placer_abeille(plateau, abeille)
+        ruche.nectar = 100 # de quoi pondre
+    return plateau, ruches
+
+
+def mesurer_phases(plateau, ruches, graine=0, nb_repetitions=3):
+    """
+    Mesure chaque phase d'un tour complet (les 4 ruches) sur un plateau.
+
+    Les phases sont jouées par le journal (coups.py) puis annulées : toutes
+    les mesures partent du même plateau, annulation comprise. Les décisions
+    de IA_BZZZ (ponte, mouvement, butinage) sont dans leur phase.
+
+    Args:
+        plateau (Plateau): Plateau mesuré
+        ruches (list): Les 4 ruches
+        graine (int): Graine de l'IA et des tirages d'esquive
+        nb_repetitions (int): Nombre de mesures (on garde la meilleure)
+
+    Returns:
+        dict: Temps de chaque phase (µs pour les 4 ruches)
+    """
+    from coups import Journal
+    from ia import IA_BZZZ
+
+    taille = len(plateau)
+    coins = ((0, 0), (0, taille - 1), (taille - 1, 0), (taille - 1, taille - 1))
+    journal = Journal(plateau, ruches)
+    nectar_initial = plateau.nectar_fleurs
+
+    def ponte():
+        ia = IA_BZZZ(random.Random(graine))
+        for ruche, coin in zip(ruches, coins):
+            type_abeille = ia.jouer_tour_ponte(plateau, ruche)
+            if type_abeille:
+                journal.pondre(ruche, type_abeille, coin)
+        journal.annuler_jusqu_a(0)
+
+    def mouvement():
+        ia = IA_BZZZ(random.Random(graine))
+        for ruche in ruches:
+            for abeille, case in ia.jouer_tour_mouvement(plateau, ruche, ruches):
+                journal.deplacer(abeille, case)
+        journal.annuler_jusqu_a(0)
+
+    def butinage():
+        ia = IA_BZZZ(random.Random(graine))
+        for ruche in ruches:
+            for abeille in ia.jouer_tour_butinage(plateau, ruche):
+                journal.butiner(abeille)
+        journal.annuler_jusqu_a(0)
+
+    def escarmouche():
+        rng = random.Random(graine)
+        for ruche in ruches:
+            journal.escarmouche(ruche, rng)
+        journal.annuler_jusqu_a(0)
+
+    def tour_suivant():
+        journal.nouveau_tour()
+        journal.annuler_jusqu_a(0)
+
+    fonctions = {
+        "ponte": ponte,
+        "mouvement": mouvement,
+        "butinage": butinage,
+        "escarmouche": escarmouche,
+        "nouveau_tour": tour_suivant,
+        "fin_de_partie": lambda: fin_de_partie(plateau, ruches, 100, nectar_initial)
+    }
+    return {phase: chronometrer(fonctions[phase], 1, nb_repetitions) for phase in PHASES}
+
+
+def ajuster_puissance(points):
+    """
+    Ajuste temps = c * abeilles^a * taille^b (moindres carrés sur les logarithmes).
+
+    Args:
+        points (list): Tuples (abeilles, taille, temps), tous > 0
+
+    Returns:
+        tuple: (a, b) exposants du nombre d'abeilles et de la taille
+               (None si les points ne suffisent pas)
+    """
+    lignes = [(1.0, math.log(abeilles), math.log(taille), math.log(temps))
+              for abeilles, taille, temps in points if temps > 0]
+    # Équations normales (3x3), résolues par la règle de Cramer
+    m = [[sum(l[i] * l[j] for l in lignes) for j in range(3)] for i in range(3)]
+    v = [sum(l[i] * l[3] for l in lignes) for i in range(3)]
+
+    def det(a):
+        return (a[0][0] * (a[1][1] * a[2][2] - a[1][2] * a[2][1])
+                - a[0][1] * (a[1][0] * a[2][2] - a[1][2] * a[2][0])
+                + a[0][2] * (a[1][0] * a[2][1] - a[1][1] * a[2][0]))
+
+    d = det(m)
+    if len(lignes) < 3 or abs(d) < 1e-9:
+        return None
+
+    def exposant(colonne):
+        return det([[v[i] if j == colonne else m[i][j] for j in range(3)] for i in range(3)]) / d
+
+    return exposant(1), exposant(2)
+
+
+def bench_echelle(tailles=(16, 32, 64, 128, 256), abeilles=(4, 16, 64, 125, 250, 500), graine=0):
+    """
+    Mesure le coût de chaque phase selon la taille du plateau et le nombre
+    d'abeilles, puis ajuste sa croissance : temps ∝ abeilles^a × taille^b.
+
+    Lecture des exposants : a = 1, b = 0 pour un coût par abeille ; b = 2
+    pour un parcours du plateau ; a = 2, b = -2 pour un coût qui suit le
+    nombre d'abeilles × leur densité (voisines de chaque abeille).
+
+    Les plateaux remplis à plus d'un quart par les abeilles sont sautés.
+    Un plateau 256x256 prend ≈ 260 Mo (tables de déplacement et de fleurs).
+
+    Args:
+        tailles (tuple): Tailles de plateau mesurées
+        abeilles (tuple): Nombres d'abeilles par ruche mesurés
+        graine (int): Graine des plateaux
+
+    Returns:
+        dict: "mesures" (une ligne par plateau) et "croissance" (exposants
+              a et b par phase)
+    """
+    mesures = []
+    print("\nPassage à l'échelle (µs par tour complet des 4 ruches)")
+    print(f"{'taille':>7} {'abeilles':>9} " + " ".join(f"{phase[:10]:>10}" for phase in PHASES))
+
+    for taille in tailles:
+        for nb in abeilles:
+            if 4 * nb > taille * taille // 4:
+                continue
+            plateau, ruches = creer_grand_plateau(taille, nb, graine)
+            temps = mesurer_phases(plateau, ruches, graine)
+            print(f"{taille:>7} {nb * 4:>9} " + " ".join(f"{temps[phase]:>10.1f}" for phase in PHASES))
+            mesures.append({"taille": taille, "abeilles": nb * 4, **{f"{phase}_us": temps[phase] for phase in PHASES}})
+
+    croissance = {}
+    print(f"\n{'phase':<14} {'a (abeilles)':>13} {'b (taille)':>11}")
+    for phase in PHASES:
+        exposants = ajuster_puissance([(m["abeilles"], m["taille"], m[f"{phase}_us"]) for m in mesures])
+        if exposants is None:
+            continue
+        croissance[phase] = {"abeilles": exposants[0], "taille": exposants[1]}
+        print(f"{phase:<14} {exposants[0]:>13.2f} {exposants[1]:>11.2f}")
+
+    return {"mesures": mesures, "croissance": croissance}
+
+
+# ============================================================================
+# SUITE DE RÉFÉRENCE
+# ============================================================================
+
+def bench_fonctions(densites=(4, 16, 32, 48), graine=0):
+    """
+    Mesure les fonctions les plus appelées pendant une partie.
+
+    Pour chaque densité, sur le même plateau encombré :
+    - case_libre_abeille et fleurs_accessibles sur les 256 cases
+    - calculer_cases_disponibles pour toutes les abeilles OK
+    - phase_escarmouche des 4 ruches (annulée par le journal après chaque
+      mesure : le plateau reste le même)
+    - fin_de_partie
+    - IA_BZZZ.jouer_tour_mouvement des 4 ruches
+
+    Args:
+        densites (tuple): Nombres d'abeilles par ruche à mesurer
+        graine (int): Graine des plateaux
+
+    Returns:
+        list: Une ligne de résultats (dict, µs par appel) par densité
+    """
+    from coups import Journal
+    from ia import IA_BZZZ
+
+    resultats = []
+    print("\nFonctions du modèle et de l'IA (µs par appel)")
+    print(f"{'abeilles':>9} {'libre':>8} {'cases':>8} {'fleurs':>8} {'escarm.':>8} {'fin':>6} {'IA mouv.':>9}")
+
+    for nb in densites:
+        plateau, ruches = creer_plateau_encombre(nb, graine)
+        abeilles = [abeille for ruche in ruches for abeille in ruche.abeilles if abeille.etat == "OK"]
+        cases = [(x, y) for x in range(NCASES) for y in range(NCASES)]
+        nectar_initial = calculer_nectar_disponible(plateau, ruches)
+        journal = Journal(plateau, ruches)
+        ia = IA_BZZZ(random.Random(graine))
+
+        def escarmouches():
+            rng = random.Random(graine)
+            for ruche in ruches:
+                journal.escarmouche(ruche, rng)
+            journal.annuler_jusqu_a(0)
+
+        mesures = {
+            "case_libre_abeille_us": chronometrer(lambda: [case_libre_abeille(plateau, x, y) for x, y in cases], 50),
+            "calculer_cases_disponibles_us": chronometrer(
+                lambda: [calculer_cases_disponibles(abeille, plateau) for abeille in abeilles], 20),
+            "fleurs_accessibles_us": chronometrer(lambda: [fleurs_accessibles(plateau, x, y) for x, y in cases], 50),
+            "phase_escarmouche_us": chronometrer(escarmouches, 20),
+            "fin_de_partie_us": chronometrer(lambda: fin_de_partie(plateau, ruches, 100, nectar_initial), 200),
+            "jouer_tour_mouvement_us": chronometrer(
+                lambda: [ia.jouer_tour_mouvement(plateau, ruche, ruches) for ruche in ruches], 10)
+        }
+
+        print(f"{nb * 4:>9} {mesures['case_libre_abeille_us']:>8.1f} {mesures['calculer_cases_disponibles_us']:>8.1f} "
+              f"{mesures['fleurs_accessibles_us']:>8.1f} {mesures['phase_escarmouche_us']:>8.1f} "
+              f"{mesures['fin_de_partie_us']:>6.1f} {mesures['jouer_tour_mouvement_us']:>9.1f}")
+        resultats.append({"abeilles": nb * 4, **mesures})
+
+    return resultats
+
+
+def bench_parties(nb_parties=20, graine=0):
+    """
+    Mesure le débit de parties complètes 4 IA sans interface (moteur.py).
+
+    Args:
+        nb_parties (int): Nombre de parties jouées (graines graine, graine + 1...)
+        graine (int): Graine de la première partie
+
+    Returns:
+        dict: Parties par seconde, tours par seconde et durée moyenne
+    """
+    from moteur import creer_moteur
+
+    tours = 0
+    debut = time.perf_counter()
+    for g in range(graine, graine + nb_parties):
+        moteur = creer_moteur(graine=g)
+        moteur.jouer_jusqu_a_la_fin()
+        tours += moteur.tour
+    duree = time.perf_counter() - debut
+
+    print(f"\nParties 4 IA sans interface ({nb_parties} parties)")
+    print(f"  {nb_parties / duree:.1f} parties/s   {tours / duree:.0f} tours/s   "
+          f"{duree / nb_parties * 1000:.1f} ms par partie")
+
+    return {
+        "parties": nb_parties,
+        "tours": tours,
+        "parties_par_s": nb_parties / duree,
+        "tours_par_s": tours / duree,
+        "ms_par_partie": duree / nb_parties * 1000
+    }
+
+
+def lancer_suite(sortie=None, nb_parties=20):
+    """
+    Lance la suite de référence et écrit ses résultats en JSON.
+
+    Args:
+        sortie (str): Fichier JSON à écrire (None = ne rien écrire)
+        nb_parties (int): Nombre de parties de bench_parties
+
+    Returns:
+        dict: Résultats (machine, fonctions, parties)
+    """
+    resultats = {
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "fonctions": bench_fonctions(),
+        "parties": bench_parties(nb_parties)
+    }
+    if sortie:
+        with open(sortie, "w", encoding="utf-8") as fichier:
+            json.dump(resultats, fichier, indent=2)
+    return resultats
+
+
+def _mesures_a_plat(resultats, prefixe=""):
+    """
+    Met à plat les mesures d'un résultat JSON : {"fonctions/16/fin_de_partie_us": 3.2, ...}.
+    """
+    mesures = {}
+    if isinstance(resultats, dict):
+        for cle, valeur in resultats.items():
+            mesures.update(_mesures_a_plat(valeur, f"{prefixe}{cle}/"))
+    elif isinstance(resultats, list):
+        for ligne in resultats:
+            # Les lignes d'une liste sont repérées par leur nombre d'abeilles
+            nom = ligne.get("abeilles", "") if isinstance(ligne, dict) else ""
+            mesures.update(_mesures_a_plat(ligne, f"{prefixe}{nom}/"))
+    elif isinstance(resultats, float): # durées et débits (les nombres entiers sont des comptes)
+        mesures[prefixe.rstrip("/")] = resultats
+    return mesures
+
+
+def comparer(avant, apres):
+    """
+    Compare deux fichiers de résultats JSON mesure par mesure.
+
+    Args:
+        avant (str): Résultats de référence
+        apres (str): Résultats à comparer
+
+    Returns:
+        list: Tuples (mesure, avant, après, rapport après / avant)
+    """
+    with open(avant, encoding="utf-8") as fichier:
+        mesures_avant = _mesures_a_plat(json.load(fichier))
+    with open(apres, encoding="utf-8") as fichier:
+        mesures_apres = _mesures_a_plat(json.load(fichier))
+
+    lignes = []
+    print(f"{'mesure':<48} {'avant':>10} {'après':>10} {'rapport':>8}")
+    for nom, valeur in mesures_avant.items():
+        if nom not in mesures_apres or not valeur:
+            continue
+        rapport = mesures_apres[nom] / valeur
+        print(f"{nom:<48} {valeur:>10.1f} {mesures_apres[nom]:>10.1f} {rapport:>7.2f}x")
+        lignes.append((nom, valeur, mesures_apres[nom], rapport))
+    return lignes
+
+
+def lancer_tout(sortie=None):
+    """
+    Lance toutes les mesures et écrit leurs résultats en JSON.
+
+    Args:
+        sortie (str): Fichier JSON à écrire (None = ne rien écrire)
+
+    Returns:
+        dict: Résultats de chaque mesure, par nom
+    """
+    mesures = (bench_occupation, bench_entites, bench_escarmouche, bench_simulateur, bench_sauvegarde,
+               bench_coups, bench_transposition, bench_cartes_ia, bench_planification,
+               bench_affectation, bench_mcts_parallele, bench_echelle, bench_fonctions, bench_parties)
+    resultats = {mesure.__name__[len("bench_"):]: mesure() for mesure in mesures}
+    if sortie:
+        with open(sortie, "w", encoding="utf-8") as fichier:
+            json.dump(resultats, fichier, indent=2)
+    return resultats
+
+
+if __name__ == "__main__":
+    analyseur = argparse.ArgumentParser(description="Mesures de performance BZZZ")
+    analyseur.add_argument("--suite", action="store_true", help="suite de référence seule")
+    analyseur.add_argument("--sortie", help="fichier JSON des résultats")
+    analyseur.add_argument("--parties", type=int, default=20, help="parties jouées par la suite")
+    analyseur.add_argument("--comparer", nargs=2, metavar=("AVANT", "APRES"),
+                           help="comparer deux fichiers de résultats")
+    arguments = analyseur.parse_args()
+    if arguments.comparer:
+        comparer(*arguments.comparer)
+    elif arguments.suite:
+        lancer_suite(arguments.sortie, arguments.parties)
+    else:
+        lancer_tout(arguments.sortie)
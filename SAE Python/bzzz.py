@@ -0,0 +1,201 @@
+# bzzz.py - Outils en ligne de commande pour BZZZ
+"""
+Point d'entrée en ligne de commande des outils BZZZ (sans interface).
+
+Commandes:
+    tournament : parties IA contre IA sur tous les cœurs, résultats en
+                 JSON (une ligne par partie) au fur et à mesure, et journal
+                 des événements de chaque partie avec --evenements
+    partie     : parties IA contre IA dans ce processus, déroulement mesuré
+                 avec --stats (temps des phases et des IA, voir
+                 instrumentation.py), tracé avec --trace (format Chrome) ou
+                 profilé par phase avec --profile (cProfile)
+
+Exemples:
+    python bzzz.py tournament --parties 1000
+    python bzzz.py tournament --parties 200 --ia ia:IA_BZZZ --ia mon_ia:MonIA --sortie res.jsonl
+    python bzzz.py tournament --parties 20 --ia ia_mcts:IA_MCTS --ia ia:IA_BZZZ
+    python bzzz.py tournament --parties 200 --ia ia_affectation:IA_AFFECTATION --ia ia:IA_BZZZ
+    python bzzz.py tournament --parties 1000 --evenements journaux
+    python bzzz.py partie --graine 3 --parties 10 --stats
+    python bzzz.py partie --graine 3 --trace trace.json
+    python bzzz.py partie --parties 20 --profile profils
+
+Le jeu lui-même se lance toujours avec : python main.py
+"""
+import argparse
+import json
+import os
+import sys
+
+from instrumentation import Collecteur, Profileur, Trace, observer
+from tournoi import IA_PAR_DEFAUT, bilan_tournoi, jouer_partie_tournoi, lancer_tournoi
+
+
+def lire_designations(arguments):
+    """
+    Donne l'IA de chaque place à partir des options --ia.
+
+    Args:
+        arguments (argparse.Namespace): Options de la commande
+
+    Returns:
+        list: 4 désignations "module:Classe" (IA_PAR_DEFAUT sans --ia)
+
+    Raises:
+        ValueError: Si --ia n'est donnée ni une fois (même IA partout) ni
+                    4 fois (une par place)
+    """
+    designations = arguments.ia or [IA_PAR_DEFAUT]
+    if len(designations) == 1:
+        designations = designations * 4
+    if len(designations) != 4:
+        raise ValueError("donner --ia une fois (même IA partout) ou 4 fois (une par place)")
+    return designations
+
+
+def commande_tournoi(arguments):
+    """
+    Lance un tournoi et écrit chaque résultat dès qu'il arrive.
+
+    Args:
+        arguments (argparse.Namespace): Options de la commande
+
+    Returns:
+        int: Code de sortie (0 si tout s'est bien passé)
+    """
+    try:
+        designations = lire_designations(arguments)
+    except ValueError as erreur:
+        print(f"Erreur : {erreur}", file=sys.stderr)
+        return 2
+
+    graines = range(arguments.graine, arguments.graine + arguments.parties)
+    if arguments.sortie:
+        sortie = open(arguments.sortie, "w", encoding="utf-8")
+    else:
+        sortie = sys.stdout
+
+    resultats = []
+    try:
+        for resultat in lancer_tournoi(graines, designations, arguments.processus, arguments.evenements):
+            sortie.write(json.dumps(resultat) + "\n")
+            sortie.flush()
+            resultats.append(resultat)
+    except ValueError as erreur:
+        print(f"Erreur : {erreur}", file=sys.stderr)
+        return 2
+    finally:
+        if sortie is not sys.stdout:
+            sortie.close()
+
+    bilan = bilan_tournoi(resultats)
+    print(f"{bilan['parties']} parties - victoires par place : {bilan['victoires']} - "
+          f"fins : {bilan['raisons']}", file=sys.stderr)
+    return 0
+
+
+def commande_partie(arguments):
+    """
+    Joue des parties dans ce processus, en mesurant leur déroulement si demandé.
+
+    Args:
+        arguments (argparse.Namespace): Options de la commande
+
+    Returns:
+        int: Code de sortie (0 si tout s'est bien passé)
+    """
+    try:
+        designations = lire_designations(arguments)
+    except ValueError as erreur:
+        print(f"Erreur : {erreur}", file=sys.stderr)
+        return 2
+
+    collecteur = Collecteur() if arguments.stats else None
+    traceur = Trace() if arguments.trace else None
+    profileur = Profileur() if arguments.profile else None
+    if arguments.evenements:
+        os.makedirs(arguments.evenements, exist_ok=True)
+    try:
+        for graine in range(arguments.graine, arguments.graine + arguments.parties):
+            with observer(collecteur, traceur, profileur):
+                resultat = jouer_partie_tournoi(graine, designations, arguments.evenements)
+            print(json.dumps(resultat))
+    except ValueError as erreur:
+        print(f"Erreur : {erreur}", file=sys.stderr)
+        return 2
+
+    if traceur is not None:
+        traceur.ecrire(arguments.trace)
+    if profileur is not None:
+        profileur.ecrire(arguments.profile, arguments.lignes)
+        print(f"Profils écrits dans {arguments.profile} (résumé dans resume.txt)", file=sys.stderr)
+
+    if collecteur is not None:
+        print(collecteur.rapport(), file=sys.stderr)
+        if arguments.stats_sortie:
+            with open(arguments.stats_sortie, "w", encoding="utf-8") as fichier:
+                json.dump(collecteur.resume(), fichier, indent=2)
+    return 0
+
+
+def creer_analyseur():
+    """
+    Crée l'analyseur des arguments de la ligne de commande.
+
+    Returns:
+        argparse.ArgumentParser: Analyseur avec ses sous-commandes
+    """
+    analyseur = argparse.ArgumentParser(prog="bzzz", description="Outils BZZZ sans interface")
+    commandes = analyseur.add_subparsers(dest="commande", required=True)
+
+    tournoi = commandes.add_parser("tournament", aliases=["tournoi"],
+                                   help="parties IA contre IA sur tous les cœurs")
+    tournoi.add_argument("--parties", type=int, default=100, help="nombre de parties (défaut 100)")
+    tournoi.add_argument("--graine", type=int, default=0, help="graine de la première partie (défaut 0)")
+    tournoi.add_argument("--ia", action="append", metavar="MODULE:CLASSE",
+                         help=f"IA d'une place, une fois par place (défaut {IA_PAR_DEFAUT})")
+    tournoi.add_argument("--processus", type=int, default=None,
+                         help="nombre de processus (défaut : nombre de cœurs)")
+    tournoi.add_argument("--sortie", help="fichier JSONL des résultats (défaut : sortie standard)")
+    tournoi.add_argument("--evenements", metavar="DOSSIER",
+                         help="journal des événements de chaque partie (DOSSIER/partie_<graine>.jsonl)")
+    tournoi.set_defaults(fonction=commande_tournoi)
+
+    partie = commandes.add_parser("partie", aliases=["game"],
+                                  help="parties IA contre IA dans ce processus (mesures)")
+    partie.add_argument("--parties", type=int, default=1, help="nombre de parties (défaut 1)")
+    partie.add_argument("--graine", type=int, default=0, help="graine de la première partie (défaut 0)")
+    partie.add_argument("--ia", action="append", metavar="MODULE:CLASSE",
+                        help=f"IA d'une place, une fois par place (défaut {IA_PAR_DEFAUT})")
+    partie.add_argument("--stats", action="store_true",
+                        help="mesurer phases, IA et fonctions du modèle (rapport sur la sortie d'erreur)")
+    partie.add_argument("--stats-sortie", help="fichier JSON du résumé des mesures")
+    partie.add_argument("--trace", metavar="FICHIER", help="trace Chrome des parties (JSON)")
+    partie.add_argument("--profile", metavar="DOSSIER",
+                        help="profil cProfile de chaque phase et décision d'IA (pstats + résumés)")
+    partie.add_argument("--lignes", type=int, default=20,
+                        help="fonctions par résumé de profil (défaut 20)")
+    partie.add_argument("--evenements", metavar="DOSSIER",
+                        help="journal des événements de chaque partie (DOSSIER/partie_<graine>.jsonl)")
+    partie.set_defaults(fonction=commande_partie)
+
+    return analyseur
+
+
+def main(argv=None):
+    """
+    Lit la ligne de commande et lance la commande demandée.
+
+    Args:
+        argv (list): Arguments (None = ceux de sys.argv)
+
+    Returns:
+        int: Code de sortie
+    """
+    arguments = creer_analyseur().parse_args(argv)
+    return arguments.fonction(arguments)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
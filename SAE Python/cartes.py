@@ -0,0 +1,185 @@
+# cartes.py - Cartes de chaleur de l'IA pour BZZZ
+"""
+Cartes de chaleur qui notent toutes les cases du plateau pour l'IA (ia.py).
+
+IA_BZZZ note chaque case où une abeille peut aller : proximité de sa ruche
+pour une abeille chargée, fleurs voisines et proximité du centre pour une
+abeille vide, moins une pénalité par ennemi autour.
+
+- Distance à chaque ruche, proximité du centre et carrés 3x3 autour de
+  chaque case : ne dépendent que de la taille du plateau, calculées une
+  fois par taille (cartes_fixes)
+- Valeur des fleurs : plateau.nb_fleurs_nectar (tenu à jour par le modèle)
+- Pression ennemie : ennemis en état de combattre dans les 9 cases autour
+  de chaque case, à recalculer à chaque fois (les abeilles bougent)
+
+cartes_ia() calcule les notes de toutes les cases d'un coup pour une ruche.
+IA_BZZZ.jouer_tour_mouvement l'appelle une fois par phase de mouvement
+(le plateau ne change pas avant que les mouvements soient joués) et lit
+ensuite la note de chaque case candidate dans les cartes
+(voir bench_cartes_ia dans benchmarks.py).
+
+Dépendance:
+    NumPy (optionnel) calcule la pression ennemie et les notes par
+    tableaux. Sans NumPy, cartes_ia() fait le même calcul en Python pur.
+
+Exemple:
+    >>> cartes = cartes_ia(plateau, 0, ruches)
+    >>> note = cartes.vide[x][y]  # note de (x, y) pour une abeille sans nectar
+"""
+from collections import Counter
+from itertools import chain
+
+from deplacements import tables_deplacement
+from entites import OK
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CARTES_NUMPY = np is not None # cartes_ia() calculée par NumPy
+
+# Notes de IA_BZZZ._evaluer_case
+NOTE_ZONE = 1000 # abeille chargée dans la zone de sa ruche
+POIDS_RUCHE = 3 # par case de moins jusqu'à la ruche (abeille chargée)
+POIDS_FLEUR = 80 # par fleur avec nectar autour (abeille vide)
+POIDS_CENTRE = 2 # par case de moins jusqu'au centre (abeille vide)
+PENALITE_ENNEMI = 15 # par ennemi autour de la case
+
+_fixes_par_taille = {} # cartes fixes déjà calculées, une par taille de plateau
+
+
+class CartesFixes:
+    """
+    Cartes qui ne dépendent que de la taille du plateau.
+
+    Attributs:
+        taille (int): Taille du plateau
+        distance_ruche (list): distance_ruche[joueur][x][y] = distance de
+                               Manhattan de (x, y) à la ruche du joueur
+        retour (list): retour[joueur][x][y] = note de proximité de la ruche
+        centre (list): centre[x][y] = note de proximité du centre
+        zones (list): Propriétaire de la zone protégée de chaque case (-1 = aucun)
+        blocs (list): blocs[x][y] = cases du carré 3x3 autour de (x, y)
+        tableaux (tuple ou None): retour, centre et zones en tableaux NumPy
+    """
+    __slots__ = ("taille", "distance_ruche", "retour", "centre", "zones", "blocs", "tableaux")
+
+    def __init__(self, taille):
+        self.taille = taille
+        coins = ((0, 0), (0, taille - 1), (taille - 1, 0), (taille - 1, taille - 1))
+        self.distance_ruche = [[[abs(x - rx) + abs(y - ry) for y in range(taille)] for x in range(taille)]
+                               for rx, ry in coins]
+        self.retour = [[[(2 * taille - d) * POIDS_RUCHE for d in ligne] for ligne in distances]
+                       for distances in self.distance_ruche]
+        milieu = taille // 2
+        self.centre = [[(taille - abs(x - milieu) - abs(y - milieu)) * POIDS_CENTRE for y in range(taille)]
+                       for x in range(taille)]
+        self.zones = tables_deplacement(taille).zones
+        self.blocs = [[tuple((nx, ny) for nx in range(max(x - 1, 0), min(x + 2, taille))
+                             for ny in range(max(y - 1, 0), min(y + 2, taille)))
+                       for y in range(taille)] for x in range(taille)]
+        self.tableaux = None
+        if np is not None:
+            self.tableaux = (np.array(self.retour), np.array(self.centre), np.array(self.zones))
+
+
+def cartes_fixes(taille):
+    """
+    Retourne les cartes fixes d'une taille de plateau (calculées au premier appel).
+
+    Args:
+        taille (int): Taille du plateau
+
+    Returns:
+        CartesFixes: Cartes de cette taille
+    """
+    cartes = _fixes_par_taille.get(taille)
+    if cartes is None:
+        cartes = CartesFixes(taille)
+        _fixes_par_taille[taille] = cartes
+    return cartes
+
+
+class CartesIA:
+    """
+    Notes de toutes les cases pour les abeilles d'une ruche.
+
+    Attributs:
+        joueur (int): Ruche dont les abeilles sont notées
+        pression (list): pression[x][y] = ennemis en état de combattre dans
+                         les 9 cases autour de (x, y)
+        chargee (list): chargee[x][y] = note de (x, y) pour une abeille qui
+                        porte du nectar
+        vide (list): vide[x][y] = note de (x, y) pour une abeille sans nectar
+    """
+    __slots__ = ("joueur", "pression", "chargee", "vide")
+
+    def __init__(self, joueur, pression, chargee, vide):
+        self.joueur = joueur
+        self.pression = pression
+        self.chargee = chargee
+        self.vide = vide
+
+
+def _ennemis(plateau, joueur, ruches):
+    """
+    Positions des abeilles ennemies en état de combattre.
+    """
+    if ruches is None:
+        return [(x, y) for x, ligne in enumerate(plateau.occupation) for y, abeille in enumerate(ligne)
+                if abeille is not None and abeille.joueur != joueur and abeille.etat == OK]
+    return [abeille.position for ruche in ruches if ruche.joueur != joueur
+            for abeille in ruche.abeilles if abeille.etat == OK]
+
+
+def cartes_ia(plateau, joueur, ruches=None):
+    """
+    Calcule les notes de toutes les cases pour les abeilles d'une ruche.
+
+    Les notes sont celles de IA_BZZZ._evaluer_case : à calculer au début de
+    la phase de mouvement de la ruche, avant de déplacer ses abeilles.
+
+    Args:
+        plateau (Plateau): Plateau de jeu
+        joueur (int): Ruche dont les abeilles sont notées
+        ruches (list): Les 4 ruches (None = ennemis cherchés dans
+                       plateau.occupation, un peu plus lent)
+
+    Returns:
+        CartesIA: Notes des cases
+    """
+    fixes = cartes_fixes(len(plateau))
+    ennemis = _ennemis(plateau, joueur, ruches)
+    if np is not None:
+        return _cartes_numpy(plateau, joueur, ennemis, fixes)
+
+    taille = fixes.taille
+    compte = Counter(chain.from_iterable(fixes.blocs[x][y] for x, y in ennemis))
+    pression = [[compte[(x, y)] for y in range(taille)] for x in range(taille)]
+    chargee = [[NOTE_ZONE if z == joueur else r - PENALITE_ENNEMI * p for z, r, p in zip(zones, retour, ennemis_ligne)]
+               for zones, retour, ennemis_ligne in zip(fixes.zones, fixes.retour[joueur], pression)]
+    vide = [[POIDS_FLEUR * f + c - PENALITE_ENNEMI * p for f, c, p in zip(fleurs, centre, ennemis_ligne)]
+            for fleurs, centre, ennemis_ligne in zip(plateau.nb_fleurs_nectar, fixes.centre, pression)]
+    return CartesIA(joueur, pression, chargee, vide)
+
+
+def _cartes_numpy(plateau, joueur, ennemis, fixes):
+    """
+    Même calcul que cartes_ia() par tableaux NumPy.
+    """
+    taille = fixes.taille
+    retour, centre, zones = fixes.tableaux
+    # Grille bordée d'une case vide : une abeille au plus par case
+    bordee = np.zeros((taille + 2) * (taille + 2), dtype=np.int64)
+    bordee[[(x + 1) * (taille + 2) + y + 1 for x, y in ennemis]] = 1
+    bordee = bordee.reshape(taille + 2, taille + 2)
+    pression = bordee[:-2, :] + bordee[1:-1, :] + bordee[2:, :]
+    pression = pression[:, :-2] + pression[:, 1:-1] + pression[:, 2:]
+
+    fleurs = np.fromiter(chain.from_iterable(plateau.nb_fleurs_nectar), dtype=np.int64,
+                         count=taille * taille).reshape(taille, taille)
+    chargee = np.where(zones == joueur, NOTE_ZONE, retour[joueur] - PENALITE_ENNEMI * pression)
+    vide = POIDS_FLEUR * fleurs + centre - PENALITE_ENNEMI * pression
+    return CartesIA(joueur, pression.tolist(), chargee.tolist(), vide.tolist())
@@ -0,0 +1,279 @@
+# chemins.py - Champs de distances des déplacements automatiques de BZZZ
+"""
+Plus courts chemins vers la destination d'un prémove (déplacement automatique).
+
+Un champ de distances donne, pour chaque case, le nombre de pas qu'il faut à
+une abeille pour atteindre la destination, calculé par un parcours en largeur
+depuis la destination (4 ou 8 directions selon l'abeille). Les abeilles
+contournent ainsi les zones ennemies et les abeilles qui les bloquent au lieu
+de s'arrêter devant.
+
+Le champ de terrain (seules les zones ennemies bloquent) ne dépend que de la
+taille du plateau : il est calculé une seule fois par (destination, joueur,
+type de déplacement) et partagé (distances_terrain).
+
+Les abeilles d'une ruche qui ont un prémove sont planifiées ensemble
+(planifier_deplacements) : chacune à son tour cherche son chemin sur les
+HORIZON_PLAN prochains tours (A* dans l'espace-temps, guidé par le champ de
+terrain) en évitant les cases et les passages déjà réservés par les
+précédentes. Les abeilles qui vont à la même fleur se suivent ou se
+contournent au lieu de se bloquer, et le plan est refait à chaque tour.
+
+Exemple:
+    >>> distances = distances_terrain(16, (8, 8), 0, False)
+    >>> distances[3][5]  # pas jusqu'à (8, 8) depuis (3, 5), -1 si inaccessible
+    8
+    >>> pas = planifier_deplacements(plateau, abeilles_programmees)
+"""
+import heapq
+
+from deplacements import tables_deplacement
+
+INACCESSIBLE = -1 # distance d'une case d'où la destination est inaccessible
+HORIZON_PLAN = 4 # tours planifiés ensemble par planifier_deplacements
+NOEUDS_PLAN = 4000 # états explorés au plus par planification (toutes abeilles confondues)
+VERIFICATIONS_PLAN = 32 # parcours au plus par planification pour vérifier les arrivées
+
+_terrain = {} # champs de terrain déjà calculés : (taille, destination, joueur, diagonale) -> distances
+
+
+def _parcours(tables, destination, joueur, diagonale, occupation=None):
+    """
+    Parcours en largeur depuis la destination.
+
+    Une case est comptée si une abeille peut y entrer (hors zone ennemie)
+    et, avec occupation, si aucune abeille ne l'occupe. La destination est
+    la source même si elle est occupée.
+    """
+    taille = tables.taille
+    distances = [[INACCESSIBLE] * taille for _ in range(taille)]
+    dx, dy = destination
+    if tables.zones[dx][dy] not in (-1, joueur):
+        return distances # destination en zone ennemie
+
+    # Les voisins autorisés d'une case sont les cases hors zone ennemie
+    # autour d'elle : ce sont aussi celles d'où l'on peut y venir
+    voisins = tables.voisins[(joueur, diagonale)]
+    distances[dx][dy] = 0
+    file = [destination]
+    for x, y in file:
+        suivante = distances[x][y] + 1
+        for nx, ny in voisins[x][y]:
+            if distances[nx][ny] == INACCESSIBLE and (occupation is None or occupation[nx][ny] is None):
+                distances[nx][ny] = suivante
+                file.append((nx, ny))
+    return distances
+
+
+def distances_terrain(taille, destination, joueur, diagonale):
+    """
+    Retourne le champ de distances sans tenir compte des abeilles.
+
+    Calculé au premier appel puis réutilisé (ne dépend que de la taille).
+
+    Args:
+        taille (int): Taille du plateau
+        destination (tuple): Case à atteindre (x, y)
+        joueur (int): Joueur de l'abeille (zones ennemies)
+        diagonale (bool): True pour une éclaireuse (8 directions)
+
+    Returns:
+        list: distances[x][y] = pas jusqu'à la destination (INACCESSIBLE si aucun chemin)
+    """
+    cle = (taille, destination, joueur, diagonale)
+    distances = _terrain.get(cle)
+    if distances is None:
+        distances = _parcours(tables_deplacement(taille), destination, joueur, diagonale)
+        _terrain[cle] = distances
+    return distances
+
+
+def _chemin_espace_temps(voisins, depart, terrain, bloquee, reservees, horizon, budget):
+    """
+    A* dans l'espace-temps : chemin de depart vers la destination (terrain = 0)
+    sur horizon tours, en évitant les cases réservées à chaque instant.
+
+    Un état est (case, t). À chaque tour l'abeille attend ou va sur une
+    voisine libre à l'instant t et à l'instant t + 1 (jamais sur la case
+    qu'une autre abeille quitte au même tour : pas d'échange ni de cycle).
+    L'état final est la destination (libre jusqu'à l'horizon) ou la case
+    atteinte à l'horizon ; coût = tours écoulés + distance restante.
+
+    Returns:
+        tuple: (chemin, noeuds) avec chemin = cases aux instants 0..t (None
+               si aucun chemin ou budget épuisé), noeuds = états explorés
+    """
+    file = [(terrain[depart[0]][depart[1]], 0, depart, 0)]
+    parents = {(depart, 0): None}
+    noeuds = 0
+    while file:
+        _, _, case, t = heapq.heappop(file)
+        noeuds += 1
+        x, y = case
+        if t == horizon or (terrain[x][y] == 0 and all((case, u) not in reservees for u in range(t + 1, horizon + 1))):
+            chemin = []
+            etat = (case, t)
+            while etat is not None:
+                chemin.append(etat[0])
+                etat = parents[etat]
+            chemin.reverse()
+            return chemin, noeuds
+        if noeuds >= budget:
+            return None, noeuds
+
+        suivant = t + 1
+        for arrivee in ((x, y),) + voisins[x][y]:
+            nx, ny = arrivee
+            distance = terrain[nx][ny]
+            if (distance == INACCESSIBLE or (arrivee, suivant) in parents or (arrivee, suivant) in reservees
+                    or (arrivee != case and ((arrivee, t) in reservees or bloquee(nx, ny)))):
+                continue
+            parents[(arrivee, suivant)] = (case, t)
+            # à coût égal, les états les plus proches de la destination d'abord
+            heapq.heappush(file, (suivant + distance, distance, arrivee, suivant))
+    return None, noeuds
+
+
+def planifier_deplacements(plateau, abeilles, horizon=HORIZON_PLAN, max_noeuds=NOEUDS_PLAN,
+                           max_verifications=VERIFICATIONS_PLAN):
+    """
+    Planifie ensemble les prémoves de plusieurs abeilles d'une même ruche.
+
+    Les abeilles les plus proches de leur destination choisissent d'abord.
+    Chacune cherche son chemin sur horizon tours (A* dans l'espace-temps) et
+    réserve ses cases à chaque instant : deux abeilles ne visent jamais la
+    même case au même tour, et une abeille n'entre que dans une case déjà
+    libre au tour d'avant (pas d'échange de cases ni de cycle). Une abeille
+    qui barre la route d'une abeille prioritaire doit donc s'écarter, et une
+    abeille n'entre pas dans sa destination si elle fermait ainsi le dernier
+    passage d'une autre. Les autres abeilles du plateau sont des obstacles
+    fixes, et le chemin est guidé par les distances qui les contournent. Seul
+    le premier pas de chaque chemin est joué : le plan est refait au tour
+    suivant.
+
+    Coût par appel : au plus max_noeuds états de A*, un parcours du plateau
+    par destination, et au plus max_verifications parcours pour vérifier les
+    arrivées (au-delà, une arrivée est acceptée sans vérification).
+
+    Args:
+        plateau (Plateau): Plateau de jeu
+        abeilles (list): Abeilles à planifier (OK, pas encore bougées, avec
+                         une destination_automatique)
+        horizon (int): Nombre de tours planifiés
+        max_noeuds (int): États explorés au plus, toutes abeilles confondues
+                          (les abeilles sans plan faute de budget attendent)
+        max_verifications (int): Parcours au plus pour vérifier qu'une
+                                 arrivée ne ferme pas le chemin d'une autre
+
+    Returns:
+        list: Tuples (abeille, case) des pas à jouer ; les cases visées sont
+              libres et toutes différentes (ordre sans importance)
+    """
+    taille = plateau.tables.taille
+    occupation = plateau.occupation
+    voisins_par_type = plateau.tables.voisins
+
+    # Les abeilles planifiées bougent : seules les autres sont des obstacles fixes
+    abeilles = [abeille for abeille in abeilles if abeille.position != abeille.destination_automatique]
+    mobiles = {abeille.position for abeille in abeilles}
+    fixes = [[None if (x, y) in mobiles else abeille for y, abeille in enumerate(ligne)]
+             for x, ligne in enumerate(occupation)]
+
+    def bloquee(x, y):
+        return fixes[x][y] is not None
+
+    # Distances guides : obstacles fixes compris, une fois par destination
+    # (champ de terrain si les obstacles fixes ferment tous les chemins)
+    guides = {}
+    coupees = set() # abeilles déjà coupées de leur destination par les obstacles fixes
+    a_planifier = []
+    for rang, abeille in enumerate(abeilles):
+        diagonale = abeille.role == "eclaireuse"
+        cle = (abeille.destination_automatique, abeille.joueur, diagonale)
+        if cle not in guides:
+            guides[cle] = _parcours(plateau.tables, cle[0], cle[1], diagonale, fixes)
+        guide = guides[cle]
+        x, y = abeille.position
+        if guide[x][y] == INACCESSIBLE:
+            guide = distances_terrain(taille, cle[0], cle[1], diagonale)
+            coupees.add(abeille)
+        if guide[x][y] != INACCESSIBLE:
+            a_planifier.append((guide[x][y], rang, abeille, guide, diagonale))
+    a_planifier.sort(key=lambda entree: entree[:2])
+
+    # Une abeille qui peut arriver dans l'horizon n'entre pas dans sa
+    # destination si elle y fermerait le dernier chemin d'une autre abeille
+    # vers la sienne : elle attend à côté, et choisit en dernier. Un parcours
+    # par destination suffit pour toutes les abeilles qui y vont, et seulement
+    # si la case est atteignable depuis cette destination (sinon elle ne
+    # coupe rien)
+    par_destination = {}
+    for _, _, autre, _, diagonale in a_planifier:
+        if autre not in coupees:
+            cle = (autre.destination_automatique, autre.joueur, diagonale)
+            par_destination.setdefault(cle, []).append(autre)
+    verifications = max_verifications
+
+    def fermerait(case):
+        nonlocal verifications
+        x, y = case
+        for cle, autres in par_destination.items():
+            destination, joueur, diagonale = cle
+            if destination == case or guides[cle][x][y] == INACCESSIBLE:
+                continue
+            if verifications <= 0:
+                return False # plus de budget : arrivée acceptée sans vérification
+            verifications -= 1
+            distances = _parcours(plateau.tables, destination, joueur, diagonale, fixes)
+            for autre in autres:
+                ax, ay = autre.position
+                if fixes[ax][ay] is None:
+                    if distances[ax][ay] == INACCESSIBLE:
+                        return True
+                # l'autre est sur une case d'arrivée : elle doit pouvoir en sortir par ailleurs
+                elif all(distances[vx][vy] == INACCESSIBLE for vx, vy in voisins_par_type[(joueur, diagonale)][ax][ay]):
+                    return True
+        return False
+
+    # Les arrivées acceptées comptent comme obstacles pour les suivantes
+    attendent = set()
+    arrivees = []
+    for distance, _, abeille, _, _ in a_planifier:
+        if distance <= horizon:
+            x, y = abeille.destination_automatique
+            fixes[x][y] = abeille
+            if fermerait((x, y)):
+                fixes[x][y] = None
+                attendent.add(abeille)
+            else:
+                arrivees.append((x, y))
+    for x, y in arrivees:
+        fixes[x][y] = None
+    a_planifier.sort(key=lambda entree: entree[2] in attendent)
+
+    reservees = {(abeille.position, 0) for _, _, abeille, _, _ in a_planifier}
+    pas = []
+    budget = max_noeuds
+    for _, _, abeille, guide, diagonale in a_planifier:
+        depart = abeille.position
+        chemin = None
+        if budget > 0:
+            bloquee_abeille = bloquee
+            if abeille in attendent:
+                interdite = abeille.destination_automatique
+                bloquee_abeille = lambda x, y: (x, y) == interdite or bloquee(x, y)
+            chemin, noeuds = _chemin_espace_temps(voisins_par_type[(abeille.joueur, diagonale)], depart, guide,
+                                                  bloquee_abeille, reservees, horizon, budget)
+            budget -= noeuds
+        if chemin is None:
+            chemin = [depart] # coincée ou budget épuisé : attend
+        # Réserver le chemin, puis la dernière case jusqu'à l'horizon ; une
+        # case où l'abeille entre est aussi réservée le tour d'avant (libre)
+        for t in range(horizon + 1):
+            case = chemin[min(t, len(chemin) - 1)]
+            reservees.add((case, t))
+            if 0 < t < len(chemin) and case != chemin[t - 1]:
+                reservees.add((case, t - 1))
+        if len(chemin) > 1 and chemin[1] != depart:
+            pas.append((abeille, chemin[1]))
+    return pas
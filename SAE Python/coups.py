@@ -0,0 +1,221 @@
+# coups.py - Coups joués et annulés pour BZZZ
+"""
+Jouer puis annuler exactement les actions d'une partie, sans copier le plateau.
+
+Les fonctions du modèle (tenter_ponte, tenter_deplacement, tenter_butinage,
+phase_escarmouche, nouveau_tour) modifient le plateau et les ruches sur place.
+Le journal les appelle telles quelles (les règles restent dans model.py) et
+retient, pour chaque coup réussi, le strict nécessaire pour revenir en arrière :
+position de départ, nectar d'avant, abeilles mises KO, coût de la ponte...
+et la clé de Zobrist d'avant le coup (plateau.cle, si le hachage est activé,
+voir zobrist.py).
+
+Une IA qui explore des suites de coups joue, évalue puis annule sur le même
+plateau au lieu de copier tout le plateau à chaque nœud.
+
+Exemple:
+    >>> journal = Journal(plateau, ruches)
+    >>> marque = len(journal)
+    >>> journal.deplacer(abeille, (5, 6))
+    >>> journal.butiner(abeille)
+    >>> valeur = evaluer(plateau)
+    >>> journal.annuler_jusqu_a(marque)  # plateau et ruches comme avant
+
+Note:
+    Le journal ne connaît que le plateau et les ruches : l'orientation des
+    abeilles (direction), le tour et la phase du moteur et le générateur
+    aléatoire ne sont pas restaurés.
+"""
+import random
+from model import *
+
+# Types de coups (premier élément de chaque coup du journal)
+PONTE = "ponte"
+DEPLACEMENT = "deplacement"
+BUTINAGE = "butinage"
+ESCARMOUCHE = "escarmouche"
+NOUVEAU_TOUR = "nouveau_tour"
+
+
+class Journal:
+    """
+    Pile des coups joués sur un plateau, annulables dans l'ordre inverse.
+
+    Attributs:
+        plateau (Plateau): Plateau de jeu
+        ruches (list): Les 4 ruches du plateau
+        coups (list): Coups joués (tuples : type, clé du plateau avant le coup,
+                      puis ce qu'il faut pour l'annuler)
+    """
+    __slots__ = ("plateau", "ruches", "coups")
+
+    def __init__(self, plateau, ruches):
+        self.plateau = plateau
+        self.ruches = ruches
+        self.coups = []
+
+    def __len__(self):
+        return len(self.coups)
+
+    # ========== JOUER ==========
+
+    def pondre(self, ruche, type_abeille, position=None):
+        """
+        Pond une abeille (tenter_ponte) et retient la ponte.
+
+        Args:
+            ruche (Ruche): Ruche qui pond
+            type_abeille (str): "ouvriere", "eclaireuse" ou "bourdon"
+            position (tuple): Case de ponte (par défaut la case de la ruche)
+
+        Returns:
+            tuple: (abeille, None) si succès, (None, message_erreur) sinon
+        """
+        if position is None:
+            position = POSITIONS_RUCHES[ruche.joueur]
+        cle = self.plateau.cle
+        abeille, erreur = tenter_ponte(self.plateau, ruche, type_abeille, position)
+        if abeille is not None:
+            self.coups.append((PONTE, cle, ruche, abeille))
+        return abeille, erreur
+
+    def deplacer(self, abeille, nouvelle_position):
+        """
+        Déplace une abeille (tenter_deplacement) et retient le déplacement.
+
+        Args:
+            abeille (Abeille): Abeille à déplacer
+            nouvelle_position (tuple): Case de destination (x, y)
+
+        Returns:
+            tuple: (True, None) si succès, (False, message_erreur) sinon
+        """
+        ruche = self.ruches[abeille.joueur]
+        coup = (DEPLACEMENT, self.plateau.cle, abeille, abeille.position, abeille.a_bouge, abeille.nectar, ruche.nectar)
+        succes, erreur = tenter_deplacement(self.plateau, abeille, nouvelle_position, self.ruches)
+        if succes:
+            self.coups.append(coup)
+        return succes, erreur
+
+    def butiner(self, abeille):
+        """
+        Fait butiner une abeille (tenter_butinage) et retient le butinage.
+
+        Args:
+            abeille (Abeille): Abeille qui butine
+
+        Returns:
+            tuple: (True, nectar_pris) si succès, (False, message_erreur) sinon
+        """
+        ruche = self.ruches[abeille.joueur]
+        x, y = abeille.position
+        fleurs = fleurs_accessibles(self.plateau, x, y)
+        fleur = fleurs[0] if fleurs else None
+        nectar_fleur = fleur.nectar if fleur is not None else 0
+        coup = (BUTINAGE, self.plateau.cle, abeille, fleur, nectar_fleur, abeille.nectar, ruche.nectar)
+        succes, resultat = tenter_butinage(self.plateau, abeille, ruche)
+        if succes:
+            self.coups.append(coup)
+        return succes, resultat
+
+    def escarmouche(self, ruche, rng=random):
+        """
+        Joue l'escarmouche d'une ruche (phase_escarmouche) et retient les KO.
+
+        Args:
+            ruche (Ruche): Ruche dont les abeilles sont en escarmouche
+            rng (random.Random): Générateur pour les tirages
+
+        Returns:
+            list: Abeilles mises KO par l'escarmouche
+        """
+        cle = self.plateau.cle
+        avant = [(abeille, abeille.nectar, abeille.tours_ko_restants)
+                 for abeille in ruche.abeilles if abeille.etat == "OK"]
+        phase_escarmouche(self.plateau, ruche, rng)
+        mises_ko = [etat for etat in avant if etat[0].etat == "KO"]
+        self.coups.append((ESCARMOUCHE, cle, mises_ko))
+        return [etat[0] for etat in mises_ko]
+
+    def nouveau_tour(self):
+        """
+        Passe au tour suivant (nouveau_tour) et retient l'état des abeilles.
+        """
+        cle = self.plateau.cle
+        avant = [(abeille, abeille.a_bouge, abeille.etat, abeille.tours_ko_restants)
+                 for ruche in self.ruches for abeille in ruche.abeilles
+                 if abeille.a_bouge or abeille.etat == "KO"]
+        nouveau_tour(self.ruches, self.plateau)
+        self.coups.append((NOUVEAU_TOUR, cle, avant))
+
+    # ========== ANNULER ==========
+
+    def annuler(self):
+        """
+        Annule le dernier coup joué.
+
+        Returns:
+            str ou None: Type du coup annulé, None si le journal est vide
+        """
+        if not self.coups:
+            return None
+        coup = self.coups.pop()
+        type_coup = coup[0]
+        plateau = self.plateau
+
+        if type_coup == DEPLACEMENT:
+            _, _, abeille, position, a_bouge, nectar, nectar_ruche = coup
+            x, y = abeille.position
+            plateau[x][y].remove(abeille)
+            plateau.occupation[x][y] = None
+            abeille.position = position
+            abeille.a_bouge = a_bouge
+            placer_abeille(plateau, abeille)
+            plateau.nectar_abeilles += nectar - abeille.nectar
+            abeille.nectar = nectar
+            self.ruches[abeille.joueur].nectar = nectar_ruche
+
+        elif type_coup == BUTINAGE:
+            _, _, abeille, fleur, nectar_fleur, nectar, nectar_ruche = coup
+            if nectar_fleur > 0 and fleur.nectar == 0:
+                remettre_fleur_videe(plateau, fleur)
+            plateau.nectar_fleurs += nectar_fleur - fleur.nectar
+            fleur.nectar = nectar_fleur
+            plateau.nectar_abeilles += nectar - abeille.nectar
+            abeille.nectar = nectar
+            abeille.a_bouge = False
+            self.ruches[abeille.joueur].nectar = nectar_ruche
+
+        elif type_coup == PONTE:
+            _, _, ruche, abeille = coup
+            x, y = abeille.position
+            ruche.abeilles.pop() # dernière pondue (annulation dans l'ordre inverse)
+            plateau[x][y].remove(abeille)
+            plateau.occupation[x][y] = None
+            ruche.nectar += COUT_PONTE
+
+        elif type_coup == ESCARMOUCHE:
+            for abeille, nectar, tours_ko in coup[2]:
+                abeille.etat = "OK"
+                abeille.nectar = nectar
+                abeille.tours_ko_restants = tours_ko
+                plateau.nectar_abeilles += nectar
+
+        elif type_coup == NOUVEAU_TOUR:
+            for abeille, a_bouge, etat, tours_ko in coup[2]:
+                abeille.a_bouge = a_bouge
+                abeille.etat = etat
+                abeille.tours_ko_restants = tours_ko
+
+        plateau.cle = coup[1]
+        return type_coup
+
+    def annuler_jusqu_a(self, marque):
+        """
+        Annule les coups jusqu'à revenir à len(journal) == marque.
+
+        Args:
+            marque (int): Longueur du journal à retrouver (0 = tout annuler)
+        """
+        while len(self.coups) > marque:
+            self.annuler()
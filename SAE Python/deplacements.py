@@ -0,0 +1,202 @@
+# deplacements.py - Génération des déplacements pour BZZZ
+"""
+Règles de déplacement des abeilles, précalculées une fois pour toutes.
+
+Ce fichier regroupe tout ce qui décide où une abeille peut aller :
+- Zones protégées 4x4 des ruches (grille du propriétaire de chaque case)
+- Cases voisines de chaque case selon le type d'abeille (4 ou 8 directions),
+  déjà privées des cases hors plateau et des zones ennemies
+- Cases adjacentes de chaque case (8 directions, sans tenir compte des zones),
+  utilisées pour trouver les opposantes en escarmouche
+
+Les tables ne dépendent que de la taille du plateau : elles sont construites
+une seule fois par taille. Une question "où peut aller cette abeille ?"
+devient une lecture de table plus un test de l'index d'occupation.
+
+Utilisé par model.py (calculer_cases_disponibles, tenter_deplacement),
+chemins.py (prémoves) et ia.py (_trouver_meilleur_mouvement).
+"""
+from entites import ECLAIREUSE
+
+TAILLE_ZONE = 4 # côté des zones protégées des ruches
+
+# Ordre des directions : le même partout (le premier meilleur coup de l'IA en dépend)
+DIRECTIONS_4 = ((-1, 0), (1, 0), (0, -1), (0, 1))
+DIRECTIONS_8 = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+_tables_par_taille = {} # tables déjà construites, une par taille de plateau
+
+
+def proprietaire_zone(x, y, taille):
+    """
+    Retourne le joueur propriétaire de la zone protégée contenant (x, y).
+
+    Args:
+        x (int): Ligne de la case
+        y (int): Colonne de la case
+        taille (int): Taille du plateau (NCASES)
+
+    Returns:
+        int: Numéro du joueur (0-3), ou -1 si la case n'est dans aucune zone
+
+    Zones protégées (TAILLE_ZONE x TAILLE_ZONE dans les coins):
+        - Joueur 0 : haut-gauche    - Joueur 1 : haut-droite
+        - Joueur 2 : bas-gauche     - Joueur 3 : bas-droite
+    """
+    haut = x < TAILLE_ZONE
+    bas = x >= taille - TAILLE_ZONE
+    gauche = y < TAILLE_ZONE
+    droite = y >= taille - TAILLE_ZONE
+
+    if haut and gauche:
+        return 0
+    if haut and droite:
+        return 1
+    if bas and gauche:
+        return 2
+    if bas and droite:
+        return 3
+    return -1
+
+
+class TablesDeplacement:
+    """
+    Tables précalculées des déplacements pour une taille de plateau.
+
+    Attributs:
+        taille (int): Taille du plateau
+        zones (list): zones[x][y] = propriétaire de la zone (-1 si aucune)
+        adjacentes (list): adjacentes[x][y] = tuple des 8 cases autour de (x, y)
+                           qui sont dans le plateau (ordre de DIRECTIONS_8)
+        voisins (dict): voisins[(joueur, diagonale)][x][y] = tuple des cases
+                        voisines autorisées (dans le plateau, hors zones
+                        ennemies), dans l'ordre de DIRECTIONS_4 / DIRECTIONS_8
+    """
+    __slots__ = ("taille", "zones", "adjacentes", "voisins")
+
+    def __init__(self, taille):
+        self.taille = taille
+        self.zones = [[proprietaire_zone(x, y, taille) for y in range(taille)] for x in range(taille)]
+        self.adjacentes = [[tuple((x + dx, y + dy) for dx, dy in DIRECTIONS_8
+                                  if 0 <= x + dx < taille and 0 <= y + dy < taille)
+                            for y in range(taille)] for x in range(taille)]
+        self.voisins = {}
+
+        for joueur in range(4):
+            for diagonale in (False, True):
+                if diagonale:
+                    directions = DIRECTIONS_8
+                else:
+                    directions = DIRECTIONS_4
+
+                grille = []
+                for x in range(taille):
+                    ligne = []
+                    for y in range(taille):
+                        cases = []
+                        for dx, dy in directions:
+                            nx, ny = x + dx, y + dy
+                            if 0 <= nx < taille and 0 <= ny < taille:
+                                if self.zones[nx][ny] == -1 or self.zones[nx][ny] == joueur:
+                                    cases.append((nx, ny))
+                        ligne.append(tuple(cases))
+                    grille.append(ligne)
+                self.voisins[(joueur, diagonale)] = grille
+
+
+def tables_deplacement(taille):
+    """
+    Retourne les tables de déplacement d'une taille de plateau.
+
+    Les tables sont construites au premier appel puis réutilisées.
+
+    Args:
+        taille (int): Taille du plateau
+
+    Returns:
+        TablesDeplacement: Tables de cette taille
+    """
+    tables = _tables_par_taille.get(taille)
+    if tables is None:
+        tables = TablesDeplacement(taille)
+        _tables_par_taille[taille] = tables
+    return tables
+
+
+def voisins_autorises(tables, abeille, position=None):
+    """
+    Retourne les cases voisines où l'abeille a le droit d'aller.
+
+    Tient compte du type d'abeille (diagonales pour l'éclaireuse), des bords
+    du plateau et des zones ennemies. Ne regarde PAS l'occupation.
+
+    Args:
+        tables (TablesDeplacement): Tables du plateau
+        abeille (Abeille): Abeille qui se déplace
+        position (tuple): Case de départ (par défaut la position de l'abeille)
+
+    Returns:
+        tuple: Cases (x, y) voisines autorisées
+    """
+    if position is None:
+        position = abeille.position
+    x, y = position
+    return tables.voisins[(abeille.joueur, abeille.role == ECLAIREUSE)][x][y]
+
+
+def cases_libres(plateau, abeille):
+    """
+    Retourne les cases où l'abeille peut se déplacer maintenant.
+
+    Args:
+        plateau (Plateau): Plateau de jeu (avec tables et index d'occupation)
+        abeille (Abeille): Abeille qui se déplace
+
+    Returns:
+        list: Cases (x, y) voisines autorisées et sans abeille
+    """
+    occupation = plateau.occupation
+    cases = []
+    for nx, ny in voisins_autorises(plateau.tables, abeille):
+        if occupation[nx][ny] is None:
+            cases.append((nx, ny))
+    return cases
+
+
+def verifier_deplacement(plateau, abeille, nouvelle_position):
+    """
+    Vérifie un déplacement d'une case et donne la raison d'un refus.
+
+    Args:
+        plateau (Plateau): Plateau de jeu
+        abeille (Abeille): Abeille qui se déplace
+        nouvelle_position (tuple): Case visée (x, y)
+
+    Returns:
+        str ou None: None si le déplacement est autorisé, sinon
+                     "distance" (trop loin ou hors plateau),
+                     "occupee" (une abeille y est déjà) ou
+                     "zone_ennemie" (zone protégée d'une autre ruche)
+    """
+    x_old, y_old = abeille.position
+    x_new, y_new = nouvelle_position
+    dx = abs(x_new - x_old)
+    dy = abs(y_new - y_old)
+
+    # Distance de Chebyshev pour l'éclaireuse, de Manhattan pour les autres
+    if abeille.role == ECLAIREUSE:
+        trop_loin = max(dx, dy) > 1
+    else:
+        trop_loin = dx + dy > 1
+    taille = plateau.tables.taille
+    if trop_loin or not (0 <= x_new < taille and 0 <= y_new < taille):
+        return "distance"
+
+    if plateau.occupation[x_new][y_new] is not None:
+        return "occupee"
+
+    zone = plateau.tables.zones[x_new][y_new]
+    if zone != -1 and zone != abeille.joueur:
+        return "zone_ennemie"
+
+    return None
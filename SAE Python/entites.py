@@ -0,0 +1,170 @@
+# entites.py - Abeilles, ruches et fleurs de BZZZ
+"""
+Classes compactes pour les éléments du plateau (abeilles, ruches, fleurs).
+
+Chaque élément est un objet à __slots__ : pas de dictionnaire par objet,
+moins de mémoire et des accès plus rapides (abeille.nectar). Le camp est
+un entier (abeille.joueur, ruche.joueur) au lieu d'être relu dans "ruche0".
+
+Compatibilité:
+    Les objets se lisent aussi comme les anciens dictionnaires :
+    abeille["etat"], abeille.get("type"), "destination_automatique" in abeille,
+    abeille["camp"] == "ruche0"... L'ancien code (interface graphique) marche
+    donc sans modification.
+"""
+
+# Rôles et états : chaînes uniques (comparaisons rapides, clés de FORCE/CAPACITE_NECTAR)
+OUVRIERE = "ouvriere"
+ECLAIREUSE = "eclaireuse"
+BOURDON = "bourdon"
+ROLES = (OUVRIERE, ECLAIREUSE, BOURDON)
+
+OK = "OK"
+KO = "KO"
+
+CAMPS = ("ruche0", "ruche1", "ruche2", "ruche3") # identifiant texte de chaque joueur
+
+
+def numero_camp(camp):
+    """
+    Convertit un camp en numéro de joueur.
+
+    Args:
+        camp (int ou str): Numéro (0-3) ou identifiant ("ruche0" à "ruche3")
+
+    Returns:
+        int: Numéro du joueur (0, 1, 2 ou 3)
+    """
+    if isinstance(camp, int):
+        return camp
+    return int(camp[-1])
+
+
+class EntiteCompat:
+    """
+    Accès façon dictionnaire pour les entités à __slots__.
+
+    Seules les clés listées dans CLES sont accessibles par entite["cle"].
+    Les clés de OPTIONNELLES (ex: "destination_automatique") se comportent
+    comme une clé absente tant qu'elles valent None.
+    """
+    __slots__ = ()
+    CLES = ()
+    OPTIONNELLES = ()
+
+    def __getitem__(self, cle):
+        if cle in self.CLES:
+            valeur = getattr(self, cle)
+            if valeur is not None or cle not in self.OPTIONNELLES:
+                return valeur
+        raise KeyError(cle)
+
+    def __setitem__(self, cle, valeur):
+        if cle not in self.CLES:
+            raise KeyError(cle)
+        setattr(self, cle, valeur)
+
+    def __delitem__(self, cle):
+        if cle not in self.OPTIONNELLES:
+            raise KeyError(cle)
+        setattr(self, cle, None)
+
+    def __contains__(self, cle):
+        if cle not in self.CLES:
+            return False
+        return cle not in self.OPTIONNELLES or getattr(self, cle) is not None
+
+    def get(self, cle, defaut=None):
+        if cle in self:
+            return self[cle]
+        return defaut
+
+    def __repr__(self):
+        champs = ", ".join(f"{cle}={getattr(self, cle)!r}" for cle in self.CLES if cle in self)
+        return f"{type(self).__name__}({champs})"
+
+
+class Abeille(EntiteCompat):
+    """
+    Abeille posée sur le plateau.
+
+    Attributs:
+        role (str): OUVRIERE, ECLAIREUSE ou BOURDON
+        joueur (int): Numéro de la ruche propriétaire (0-3)
+        position (tuple): Position (x, y) sur le plateau
+        direction (str): "droite" ou "gauche" (pour l'image)
+        nectar (int): Nectar transporté
+        etat (str): OK (active) ou KO (assommée)
+        a_bouge (bool): True si l'abeille a déjà agi ce tour
+        tours_ko_restants (int): Tours avant le réveil
+        destination_automatique (tuple ou None): Destination du prémove
+        camp (str): Identifiant de la ruche ("ruche0"...), calculé depuis joueur
+    """
+    __slots__ = ("role", "joueur", "position", "direction", "nectar", "etat",
+                 "a_bouge", "tours_ko_restants", "destination_automatique")
+    type = "abeille"
+    CLES = ("type", "role", "camp", "joueur", "position", "direction", "nectar", "etat",
+            "a_bouge", "tours_ko_restants", "destination_automatique")
+    OPTIONNELLES = ("destination_automatique",)
+
+    def __init__(self, role, position, joueur):
+        self.role = role
+        self.joueur = joueur
+        self.position = position
+        self.direction = "droite"
+        self.nectar = 0
+        self.etat = OK
+        self.a_bouge = False
+        self.tours_ko_restants = 0
+        self.destination_automatique = None
+
+    @property
+    def camp(self):
+        return CAMPS[self.joueur]
+
+    @camp.setter
+    def camp(self, camp):
+        self.joueur = numero_camp(camp)
+
+
+class Ruche(EntiteCompat):
+    """
+    Ruche d'un joueur.
+
+    Attributs:
+        id (str): Identifiant ("ruche0" à "ruche3")
+        joueur (int): Numéro du joueur (0-3)
+        nectar (int): Nectar stocké dans la ruche
+        abeilles (list): Abeilles de la ruche (dans l'ordre de ponte)
+    """
+    __slots__ = ("joueur", "nectar", "abeilles")
+    type = "ruche"
+    CLES = ("type", "id", "joueur", "nectar", "abeilles")
+
+    def __init__(self, joueur, nectar):
+        self.joueur = joueur
+        self.nectar = nectar
+        self.abeilles = []
+
+    @property
+    def id(self):
+        return CAMPS[self.joueur]
+
+
+class Fleur(EntiteCompat):
+    """
+    Fleur du plateau.
+
+    Attributs:
+        id (str): Identifiant ("fleur0"...), partagé par les 4 fleurs symétriques
+        nectar (int): Nectar restant
+        position (tuple ou None): Position (x, y), None avant placement
+    """
+    __slots__ = ("id", "nectar", "position")
+    type = "fleur"
+    CLES = ("type", "id", "nectar", "position")
+
+    def __init__(self, id, nectar=0, position=None):
+        self.id = id
+        self.nectar = nectar
+        self.position = position
@@ -0,0 +1,122 @@
+# evenements.py - Journal des événements d'une partie pour BZZZ
+"""
+Journal des événements d'une partie, écrit au fil de l'eau en JSONL.
+
+Le moteur (moteur.py) signale chaque action de la partie à travers
+instrumentation.signaler() ; EcrivainEvenements les écrit une par ligne
+(JSON), par paquets de TAILLE_TAMPON lignes : la partie n'est jamais gardée
+en mémoire, des milliers de parties peuvent être journalisées pour
+analyser l'équilibre du jeu après coup.
+
+Événements (champ "type", plus "tour" et "joueur" du joueur actuel):
+    debut : graine, nb_joueurs, nectar_total_initial, fleurs [[x, y, nectar]...]
+    ponte : abeille, role, position, nectar_ruche (après le coût de la ponte)
+    mouvement : abeille, role, de, vers, premove (True pour un prémove)
+    depot : abeille, nectar déposé, nectar_ruche
+    butinage : abeille, position, fleur (case), pris, reste, epuisee
+    esquive : abeille, proba, tirage, reussie, nectar_perdu (0 si réussie)
+    reveil : abeille (fin de KO, au début d'un tour)
+    fin_tour : nectar_ruches (à la fin du tour, quand tous ont joué)
+    fin : raison, gagnant, nectar_ruches
+
+    Une abeille est désignée par [joueur, rang dans ruche.abeilles] (les
+    abeilles ne quittent jamais leur ruche, le rang ne change pas).
+
+Exemple:
+    >>> with EcrivainEvenements("partie_3.jsonl"):
+    ...     creer_moteur(graine=3).jouer_jusqu_a_la_fin()
+    >>> butinages = [e for e in lire_evenements("partie_3.jsonl") if e["type"] == "butinage"]
+
+En ligne de commande : python bzzz.py tournament --evenements journaux
+(un fichier par partie), python main.py --evenements partie.jsonl
+"""
+import gzip
+import json
+
+from instrumentation import Observateur, activer, desactiver
+
+TAILLE_TAMPON = 1000 # lignes gardées avant d'écrire dans le fichier
+
+
+def _ouvrir(chemin, mode):
+    """
+    Ouvre un journal en texte, compressé (gzip) si le nom finit par .gz.
+    """
+    if chemin.endswith(".gz"):
+        return gzip.open(chemin, mode + "t", encoding="utf-8")
+    return open(chemin, mode, encoding="utf-8")
+
+
+class EcrivainEvenements(Observateur):
+    """
+    Écrit les événements de la partie en JSONL, par paquets.
+
+    S'utilise avec with : actif dans le bloc, fichier fermé à la sortie.
+    Avec activer()/desactiver(), appeler fermer() à la fin.
+
+    Attributs:
+        chemin (str): Fichier écrit (.jsonl, ou .jsonl.gz compressé)
+        taille_tampon (int): Lignes gardées avant d'écrire
+        tampon (list): Lignes pas encore écrites
+        nb_evenements (int): Événements reçus
+    """
+    suit_evenements = True
+
+    def __init__(self, chemin, taille_tampon=TAILLE_TAMPON):
+        self.chemin = chemin
+        self.taille_tampon = taille_tampon
+        self.tampon = []
+        self.nb_evenements = 0
+        self._fichier = _ouvrir(chemin, "w")
+
+    def __enter__(self):
+        activer(self)
+        return self
+
+    def __exit__(self, *exception):
+        desactiver(self)
+        self.fermer()
+        return False
+
+    def evenement(self, type_evenement, donnees):
+        """
+        Ajoute un événement au tampon (écrit quand le tampon est plein).
+        """
+        self.tampon.append(json.dumps({"type": type_evenement, **donnees}, separators=(",", ":")))
+        self.nb_evenements += 1
+        if len(self.tampon) >= self.taille_tampon:
+            self.vider()
+
+    def vider(self):
+        """
+        Écrit les lignes du tampon dans le fichier.
+        """
+        if self.tampon:
+            self._fichier.write("\n".join(self.tampon) + "\n")
+            self.tampon.clear()
+
+    def fermer(self):
+        """
+        Écrit le reste du tampon et ferme le fichier (rien si déjà fermé).
+        """
+        if self._fichier is None:
+            return
+        self.vider()
+        self._fichier.close()
+        self._fichier = None
+
+
+def lire_evenements(chemin):
+    """
+    Relit un journal, un événement à la fois.
+
+    Args:
+        chemin (str): Journal écrit par EcrivainEvenements
+
+    Yields:
+        dict: Événements, dans l'ordre de la partie
+    """
+    with _ouvrir(chemin, "r") as fichier:
+        for ligne in fichier:
+            if ligne.strip():
+                yield json.loads(ligne)
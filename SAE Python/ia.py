@@ -1,7 +1,11 @@
 # ia.py - Intelligence artificielle pour BZZZ
 
+import os
 import random
 from model import *
+from cartes import NOTE_ZONE, PENALITE_ENNEMI, POIDS_FLEUR, cartes_fixes, cartes_ia
+
+TYPES_IA = ("glouton", "affectation", "mcts") # types acceptés par creer_ia()
 
 class IA_BZZZ:
     """
@@ -13,13 +17,18 @@ class IA_BZZZ:
     - Butinage : Butine avec toutes les abeilles qui le peuvent
     """
     
-    def __init__(self):
+    def __init__(self, rng=None):
         """
         Crée une nouvelle instance d'IA.
         
-        L'IA n'a pas besoin de mémoire entre les tours, donc __init__ est vide.
+        L'IA n'a pas besoin de mémoire entre les tours, elle garde seulement
+        le générateur aléatoire de sa partie.
+        
+        Args:
+            rng (random.Random): Générateur de la partie (None = module random,
+                                 le moteur donne le sien à ses IA)
         """
-        pass
+        self.rng = rng
     
     def jouer_tour_ponte(self, plateau, ruche):
         """
@@ -27,7 +36,7 @@ class IA_BZZZ:
         
         Args:
             plateau (list): Le plateau de jeu (liste 2D de cases)
-            ruche (dict): La ruche de l'IA avec ses informations (nectar, abeilles)
+            ruche (Ruche): La ruche de l'IA avec ses informations (nectar, abeilles)
         
         Returns:
             str ou None: Type d'abeille à pondre ("ouvriere", "eclaireuse", "bourdon")
@@ -40,22 +49,23 @@ class IA_BZZZ:
             - Maintient un ratio optimal : 50% ouvrières, 25% éclaireuses, reste bourdons
         """
         # Vérifier si on a assez de nectar pour pondre
-        if ruche["nectar"] < COUT_PONTE:
+        if ruche.nectar < COUT_PONTE:
             return None
         
         # Compter les abeilles actives
         nb_actives = 0
-        for a in ruche["abeilles"]:
-            if a["etat"] == "OK":
+        for a in ruche.abeilles:
+            if a.etat == "OK":
                 nb_actives += 1
         
         # Si aucune abeille active, on DOIT pondre (situation critique)
         if nb_actives == 0:
             types = ["ouvriere", "eclaireuse", "bourdon"]
-            return random.choice(types)
+            rng = self.rng if self.rng is not None else random
+            return rng.choice(types)
         
         # Garder une marge de sécurité (ne pas tout dépenser)
-        if ruche["nectar"] < COUT_PONTE + 15:
+        if ruche.nectar < COUT_PONTE + 15:
             return None
         
         # Début de partie : rush ouvrières pour collecter du nectar rapidement
@@ -67,13 +77,13 @@ class IA_BZZZ:
         nb_eclaireuses = 0
         nb_bourdons = 0
         
-        for abeille in ruche["abeilles"]:
-            if abeille["etat"] == "OK":
-                if abeille["role"] == "ouvriere":
+        for abeille in ruche.abeilles:
+            if abeille.etat == "OK":
+                if abeille.role == "ouvriere":
                     nb_ouvrieres += 1
-                elif abeille["role"] == "eclaireuse":
+                elif abeille.role == "eclaireuse":
                     nb_eclaireuses += 1
-                elif abeille["role"] == "bourdon":
+                elif abeille.role == "bourdon":
                     nb_bourdons += 1
         
         # Calculer le total pour les ratios
@@ -94,7 +104,7 @@ class IA_BZZZ:
             return "eclaireuse"
         
         # Quelques bourdons pour la défense (si assez de nectar)
-        if ruche["nectar"] > 30 and nb_bourdons < 2:
+        if ruche.nectar > 30 and nb_bourdons < 2:
             return "bourdon"
         
         # Par défaut, créer des ouvrières
@@ -106,7 +116,7 @@ class IA_BZZZ:
         
         Args:
             plateau (list): Le plateau de jeu
-            ruche (dict): La ruche de l'IA
+            ruche (Ruche): La ruche de l'IA
             ruches (list): Liste de toutes les ruches du jeu
         
         Returns:
@@ -115,123 +125,106 @@ class IA_BZZZ:
         Stratégie:
             - Ne bouge pas les abeilles déjà sur une fleur (si elles ont de la place)
             - Pour les autres, calcule le meilleur mouvement via système de scoring
+              (cartes de chaleur calculées une fois par phase, voir cartes.py)
+        
+        Note:
+            Les mouvements sont joués après la décision : le plateau ne change
+            pas pendant la phase, les cartes donnent les notes de _evaluer_case
         """
         mouvements = []
+        cartes = None
         
-        for abeille in ruche["abeilles"]:
+        for abeille in ruche.abeilles:
             # Vérifier si l'abeille peut bouger
-            if abeille["etat"] == "OK" and abeille["a_bouge"] == False:
-                x, y = abeille["position"]
+            if abeille.etat == "OK" and abeille.a_bouge == False:
+                x, y = abeille.position
                 fleurs = fleurs_accessibles(plateau, x, y)
                 
                 # Capacité max de l'abeille
-                max_cap = CAPACITE_NECTAR[abeille["role"]]
+                max_cap = CAPACITE_NECTAR[abeille.role]
                 
                 # Si une fleur est accessible ET qu'on a de la place
                 # → On reste là pour butiner au prochain tour
-                if len(fleurs) > 0 and abeille["nectar"] < max_cap:
+                if len(fleurs) > 0 and abeille.nectar < max_cap:
                     continue
                 
-                # Sinon, trouver le meilleur mouvement
-                mouvement = self._trouver_meilleur_mouvement(plateau, abeille, ruche, ruches)
+                # Sinon, trouver le meilleur mouvement (cartes calculées au premier besoin)
+                if cartes is None:
+                    cartes = cartes_ia(plateau, ruche.joueur, ruches)
+                mouvement = self._trouver_meilleur_mouvement(plateau, abeille, ruche, ruches, cartes)
                 if mouvement:
                     mouvements.append((abeille, mouvement))
         
         return mouvements
     
-    def _trouver_meilleur_mouvement(self, plateau, abeille, ruche, ruches):
+    def _trouver_meilleur_mouvement(self, plateau, abeille, ruche, ruches, cartes=None):
         """
         Trouve le meilleur mouvement pour une abeille selon un système de scoring.
         
         Args:
             plateau (list): Le plateau de jeu (liste 2D de cases)
-            abeille (dict): L'abeille à déplacer
-            ruche (dict): La ruche du joueur actuel
+            abeille (Abeille): L'abeille à déplacer
+            ruche (Ruche): La ruche du joueur actuel
             ruches (list): Liste de toutes les ruches
+            cartes (CartesIA): Notes de toutes les cases pour cette ruche
+                               (cartes_ia, None = chaque case est notée par
+                               _evaluer_case)
         
         Returns:
             tuple ou None: (x, y) position du meilleur mouvement,
                            ou None si aucun mouvement possible
         
         Fonctionnement:
-            1. Liste toutes les cases adjacentes accessibles
-            2. Élimine les cases hors plateau, occupées ou en zone ennemie
-            3. Calcule un score pour chaque case restante
-            4. Retourne la case avec le meilleur score
+            1. Liste les cases adjacentes accessibles (calculer_cases_disponibles :
+               dans le plateau, libres et hors zone ennemie)
+            2. Calcule un score pour chaque case (lu dans les cartes, ou
+               calculé par _evaluer_case)
+            3. Retourne la case avec le meilleur score
         """
-        x, y = abeille["position"]
-        joueur = int(ruche["id"][-1])  # Extraire le numéro du joueur (0-3)
-        
-        # Directions possibles selon le type d'abeille
-        if abeille["role"] == "eclaireuse":
-            # Éclaireuse : 8 directions (peut aller en diagonale)
-            directions = [(-1,-1), (-1,0), (-1,1), (0,-1), (0,1), (1,-1), (1,0), (1,1)]
-        else:
-            # Ouvrière et Bourdon : 4 directions (pas de diagonale)
-            directions = [(-1,0), (1,0), (0,-1), (0,1)]
-        
-        cases_valides = []
-        
-        # Pour chaque direction possible
-        for dx, dy in directions:
-            nx = x + dx
-            ny = y + dy
-            
-            # Vérifier si la case est dans le plateau
-            if nx < 0 or nx >= NCASES or ny < 0 or ny >= NCASES:
-                continue
-            
-            # Vérifier si la case est libre (pas d'abeille dessus)
-            case_libre = True
-            for elem in plateau[nx][ny]:
-                if isinstance(elem, dict) and elem.get("type") == "abeille":
-                    case_libre = False
-                    break
-            
-            if case_libre == False:
-                continue
-            
-            # Vérifier qu'on n'est pas dans une zone ennemie
-            zone_ennemie = False
-            for i in range(4):
-                if i != joueur and dans_zone_ruche((nx, ny), i):
-                    zone_ennemie = True
-                    break
-            
-            if zone_ennemie == False:
-                # Case valide ! Calculer son score
+        joueur = ruche.joueur  # Numéro du joueur (0-3)
+        
+        notes = None
+        if cartes is not None:
+            # Abeille chargée → retour à la ruche, abeille vide → recherche de fleurs
+            if abeille.nectar > 0:
+                notes = cartes.chargee
+            else:
+                notes = cartes.vide
+        
+        # Cases adjacentes dans le plateau, hors zone ennemie et libres
+        # (8 directions pour l'éclaireuse, 4 pour les autres)
+        meilleure_case = None
+        meilleur_score = None
+        for nx, ny in calculer_cases_disponibles(abeille, plateau):
+            if notes is not None:
+                score = notes[nx][ny]
+            else:
                 score = self._evaluer_case(plateau, (nx, ny), abeille, ruche, joueur)
-                cases_valides.append(((nx, ny), score))
-        
-        # Si aucune case valide, rester sur place
-        if len(cases_valides) == 0:
-            return None
+            if meilleur_score is None or score > meilleur_score:
+                meilleure_case = (nx, ny)
+                meilleur_score = score
         
-        # Choisir la case avec le meilleur score
-        meilleure_case = cases_valides[0]
-        for case_info in cases_valides:
-            if case_info[1] > meilleure_case[1]:
-                meilleure_case = case_info
-        
-        return meilleure_case[0]
+        # Si aucune case valide, rester sur place (None)
+        return meilleure_case
     
-    def _evaluer_case(self, plateau, position, abeille, ruche, joueur):
+    def _evaluer_case(self, plateau, position, abeille, ruche, joueur, cartes=None):
         """
         Évalue l'intérêt d'une case pour le déplacement d'une abeille.
         
         Args:
             plateau (list): Le plateau de jeu
             position (tuple): Position (x, y) à évaluer
-            abeille (dict): L'abeille qui se déplace
-            ruche (dict): La ruche du joueur
+            abeille (Abeille): L'abeille qui se déplace
+            ruche (Ruche): La ruche du joueur
             joueur (int): Numéro du joueur (0-3)
+            cartes (CartesIA): Notes des cases pour ce joueur (None = calculées ici)
         
         Returns:
             int: Score de la case (plus élevé = mieux)
         
-        Système de scoring:
+        Système de scoring (constantes dans cartes.py):
             Si l'abeille a du nectar (doit rentrer) :
-                - +1000 si dans la zone de ruche (priorité absolue)
+                - 1000 si dans la zone de ruche (priorité absolue, sans pénalité)
                 - +score proportionnel à la proximité de la ruche
             
             Si l'abeille n'a pas de nectar (doit chercher fleurs) :
@@ -240,84 +233,59 @@ class IA_BZZZ:
             
             Dans tous les cas :
                 - -15 par ennemi adjacent (zones dangereuses)
+        
+        Note:
+            jouer_tour_mouvement lit les notes dans les cartes (cartes_ia) ;
+            ce calcul case par case sert sans cartes (IA_AFFECTATION) et de
+            référence aux cartes
         """
         x, y = position
+        if cartes is not None:
+            if abeille.nectar > 0:
+                return cartes.chargee[x][y]
+            return cartes.vide[x][y]
+        
+        fixes = cartes_fixes(len(plateau))
         score = 0
         
         # CAS 1 : Abeille a du nectar → PRIORITÉ au retour à la ruche
-        if abeille["nectar"] > 0:
+        if abeille.nectar > 0:
             # Si on est dans la zone de ruche, c'est PARFAIT
-            if dans_zone_ruche(position, joueur):
-                return 1000  # Score très élevé
+            if plateau.tables.zones[x][y] == joueur:
+                return NOTE_ZONE  # Score très élevé
             
-            # Sinon, se rapprocher de la ruche
-            ruche_pos = self._get_position_ruche(joueur)
-            distance_ruche = abs(x - ruche_pos[0]) + abs(y - ruche_pos[1])
-            score = score + (32 - distance_ruche) * 3  # Plus on est proche, mieux c'est
+            # Sinon, se rapprocher de la ruche (distance précalculée)
+            score = score + fixes.retour[joueur][x][y]  # Plus on est proche, mieux c'est
         
         # CAS 2 : Abeille sans nectar → Chercher des fleurs
         else:
-            # Vérifier s'il y a des fleurs dans les 8 cases adjacentes
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    nx = x + dx
-                    ny = y + dy
-                    
-                    if 0 <= nx < NCASES and 0 <= ny < NCASES:
-                        for elem in plateau[nx][ny]:
-                            if isinstance(elem, dict) and elem.get("type") == "fleur":
-                                if elem["nectar"] > 0:
-                                    score = score + 80  # Fleur proche = très bien
+            # Fleurs avec nectar dans les 8 cases adjacentes (table du plateau)
+            score = score + plateau.nb_fleurs_nectar[x][y] * POIDS_FLEUR  # Fleur proche = très bien
             
             # Se rapprocher du centre du plateau (statistiquement plus de fleurs)
-            distance_centre = abs(x - 8) + abs(y - 8)
-            score = score + (16 - distance_centre) * 2
+            score = score + fixes.centre[x][y]
         
         # PÉNALITÉ : Éviter les zones dangereuses (ennemis proches)
         nb_ennemis = 0
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                nx = x + dx
-                ny = y + dy
-                
-                if 0 <= nx < NCASES and 0 <= ny < NCASES:
-                    for elem in plateau[nx][ny]:
-                        if isinstance(elem, dict) and elem.get("type") == "abeille":
-                            if elem["camp"] != abeille["camp"] and elem["etat"] == "OK":
-                                nb_ennemis = nb_ennemis + 1
+        occupation = plateau.occupation
+        for nx, ny in fixes.blocs[x][y]:
+            voisine = occupation[nx][ny]
+            if voisine is not None and voisine.joueur != abeille.joueur and voisine.etat == "OK":
+                nb_ennemis = nb_ennemis + 1
         
         # Pénalité selon le nombre d'ennemis adjacents
         if nb_ennemis > 0:
-            score = score - (nb_ennemis * 15)
+            score = score - (nb_ennemis * PENALITE_ENNEMI)
         
         return score
     
-    def _get_position_ruche(self, joueur):
-        """
-        Retourne la position de la ruche d'un joueur.
-        
-        Args:
-            joueur (int): Numéro du joueur (0, 1, 2 ou 3)
-        
-        Returns:
-            tuple: Position (x, y) de la ruche
-        """
-        if joueur == 0:
-            return (0, 0)      # Ruche 0 : coin haut-gauche
-        elif joueur == 1:
-            return (0, 15)     # Ruche 1 : coin haut-droite
-        elif joueur == 2:
-            return (15, 0)     # Ruche 2 : coin bas-gauche
-        else:  # joueur == 3
-            return (15, 15)    # Ruche 3 : coin bas-droite
-    
     def jouer_tour_butinage(self, plateau, ruche):
         """
         Décide quelles abeilles doivent butiner.
         
         Args:
             plateau (list): Le plateau de jeu
-            ruche (dict): La ruche de l'IA
+            ruche (Ruche): La ruche de l'IA
         
         Returns:
             list: Liste des abeilles qui vont butiner
@@ -329,31 +297,51 @@ class IA_BZZZ:
         """
         abeilles_a_butiner = []
         
-        for abeille in ruche["abeilles"]:
+        for abeille in ruche.abeilles:
             # Vérifier si l'abeille peut butiner
-            if abeille["etat"] == "OK" and abeille["a_bouge"] == False:
-                x, y = abeille["position"]
+            if abeille.etat == "OK" and abeille.a_bouge == False:
+                x, y = abeille.position
                 fleurs = fleurs_accessibles(plateau, x, y)
                 
                 # Si des fleurs sont disponibles
                 if len(fleurs) > 0:
                     # Vérifier si l'abeille a de la place dans sa réserve
-                    max_cap = CAPACITE_NECTAR[abeille["role"]]
-                    if abeille["nectar"] < max_cap:
+                    max_cap = CAPACITE_NECTAR[abeille.role]
+                    if abeille.nectar < max_cap:
                         abeilles_a_butiner.append(abeille)
         
         return abeilles_a_butiner
 
 
-def creer_ia():
+def creer_ia(rng=None, type_ia="glouton", nb_joueurs=4):
     """
     Crée une instance d'IA pour jouer à BZZZ.
     
+    Args:
+        rng (random.Random): Générateur de la partie (optionnel)
+        type_ia (str): "glouton" (IA_BZZZ), "affectation" (IA_AFFECTATION, voir
+                       ia_affectation.py) ou "mcts" (IA_MCTS, voir ia_mcts.py)
+        nb_joueurs (int): Nombre de ruches qui jouent (utile à IA_MCTS)
+    
+    Note:
+        IA_MCTS cherche sur tous les cœurs de la machine (un processus par cœur)
+    
     Returns:
         IA_BZZZ: Une nouvelle instance d'IA
     
+    Raises:
+        ValueError: Si le type d'IA est inconnu
+    
     Exemple d'utilisation:
         ia = creer_ia()
         type_abeille = ia.jouer_tour_ponte(plateau, ruche)
     """
-    return IA_BZZZ()
\ No newline at end of file
+    if type_ia == "glouton":
+        return IA_BZZZ(rng)
+    if type_ia == "affectation":
+        from ia_affectation import IA_AFFECTATION # import ici : ia_affectation importe ia
+        return IA_AFFECTATION(rng)
+    if type_ia == "mcts":
+        from ia_mcts import IA_MCTS # import ici : ia_mcts importe ia
+        return IA_MCTS(rng, nb_joueurs=nb_joueurs, processus=os.cpu_count() or 1)
+    raise ValueError(f"Type d'IA inconnu : {type_ia!r} (attendu : 'glouton', 'affectation' ou 'mcts')")
@@ -0,0 +1,301 @@
+# ia_affectation.py - IA par affectation des abeilles aux fleurs pour BZZZ
+"""
+IA qui répartit ses abeilles entre les fleurs et la ruche par une affectation
+de coût minimal.
+
+IA_AFFECTATION a la même interface que IA_BZZZ (jouer_tour_ponte,
+jouer_tour_mouvement, jouer_tour_butinage) : elle se choisit dans le menu
+("IA affectation") ou dans un tournoi ("ia_affectation:IA_AFFECTATION").
+
+Phase de mouvement:
+    IA_BZZZ choisit la case de chaque abeille à part : plusieurs ouvrières
+    courent vers la même fleur pendant que d'autres tournent en rond. Ici,
+    chaque abeille libre reçoit une cible, au plus une abeille par cible :
+
+    - une case d'où butiner (case qui voit une fleur, voir
+      plateau.fleurs_voisines), pour une abeille qui a encore de la place
+    - la zone de sa ruche, pour une abeille qui porte du nectar
+
+    La valeur d'une cible est le nectar rapporté par tour : nectar livré
+    (CAPACITE_NECTAR pour une fleur, nectar porté pour la ruche) divisé par
+    les tours du trajet (aller par le plus court chemin, tours de butinage
+    au gain de la fleur, retour à la zone). Le problème est résolu par la
+    méthode hongroise (affectation_min_cout).
+
+    Les cibles sont gardées d'un tour à l'autre : seules les abeilles dont
+    la cible n'est plus valable (case prise, abeille pleine ou vidée, KO)
+    sont réaffectées, et au plus MAX_AFFECTATION par tour. Les abeilles
+    sans cible jouent comme IA_BZZZ.
+
+Ponte et butinage restent ceux de IA_BZZZ.
+
+Exemple:
+    >>> ia = IA_AFFECTATION()
+    >>> mouvements = ia.jouer_tour_mouvement(plateau, ruche, ruches)
+"""
+import math
+
+from model import *
+from chemins import INACCESSIBLE, distances_terrain
+from ia import IA_BZZZ
+
+RUCHE = "ruche" # cible : la zone de la ruche (déposer le nectar)
+MAX_AFFECTATION = 16 # abeilles réaffectées au plus par tour
+
+
+def affectation_min_cout(couts):
+    """
+    Affectation de coût minimal (méthode hongroise, O(n² m)).
+
+    Args:
+        couts (list): couts[i][j] = coût de donner la colonne j à la ligne i
+                      (n lignes, m >= n colonnes)
+
+    Returns:
+        list: Colonne donnée à chaque ligne (toutes différentes)
+
+    Exemple:
+        >>> affectation_min_cout([[4, 1, 3], [2, 0, 5]])
+        [1, 0]
+    """
+    n = len(couts)
+    if n == 0:
+        return []
+    m = len(couts[0])
+    infini = float("inf")
+    u = [0.0] * (n + 1) # potentiels des lignes
+    v = [0.0] * (m + 1) # potentiels des colonnes
+    ligne_de = [0] * (m + 1) # ligne (1..n) qui tient chaque colonne, 0 = libre
+    precedente = [0] * (m + 1)
+
+    for i in range(1, n + 1):
+        ligne_de[0] = i
+        j0 = 0
+        minimum = [infini] * (m + 1)
+        vue = [False] * (m + 1)
+        while True:
+            vue[j0] = True
+            i0 = ligne_de[j0]
+            cout_ligne = couts[i0 - 1]
+            delta = infini
+            j1 = 0
+            for j in range(1, m + 1):
+                if not vue[j]:
+                    reduit = cout_ligne[j - 1] - u[i0] - v[j]
+                    if reduit < minimum[j]:
+                        minimum[j] = reduit
+                        precedente[j] = j0
+                    if minimum[j] < delta:
+                        delta = minimum[j]
+                        j1 = j
+            for j in range(m + 1):
+                if vue[j]:
+                    u[ligne_de[j]] += delta
+                    v[j] -= delta
+                else:
+                    minimum[j] -= delta
+            j0 = j1
+            if ligne_de[j0] == 0:
+                break
+        # Chemin augmentant : décaler les colonnes jusqu'à la colonne libre trouvée
+        while j0:
+            j1 = precedente[j0]
+            ligne_de[j0] = ligne_de[j1]
+            j0 = j1
+
+    colonnes = [0] * n
+    for j in range(1, m + 1):
+        if ligne_de[j]:
+            colonnes[ligne_de[j] - 1] = j - 1
+    return colonnes
+
+
+def distance_zone(position, joueur, diagonale, taille=NCASES):
+    """
+    Nombre de pas d'une case jusqu'à la zone de la ruche d'un joueur.
+
+    La zone est dans le coin du joueur : aucune zone ennemie sur le chemin.
+
+    Args:
+        position (tuple): Case de départ (x, y)
+        joueur (int): Joueur propriétaire de la zone
+        diagonale (bool): True pour une éclaireuse (8 directions)
+        taille (int): Taille du plateau
+
+    Returns:
+        int: Pas jusqu'à la première case de la zone (0 si déjà dedans)
+    """
+    x, y = position
+    coin_x, coin_y = POSITIONS_RUCHES[joueur]
+    dx = max(0, abs(x - coin_x) - (TAILLE_ZONE - 1))
+    dy = max(0, abs(y - coin_y) - (TAILLE_ZONE - 1))
+    if diagonale:
+        return max(dx, dy)
+    return dx + dy
+
+
+class IA_AFFECTATION(IA_BZZZ):
+    """
+    IA qui affecte ses abeilles aux fleurs et à la ruche (méthode hongroise).
+
+    Attributs:
+        cibles (dict): Cible gardée de chaque abeille (case d'où butiner, ou
+                       RUCHE), réutilisée tant qu'elle reste valable
+        derniere_affectation (int): Abeilles réaffectées au dernier tour
+    """
+
+    def __init__(self, rng=None):
+        """
+        Crée une IA par affectation.
+
+        Args:
+            rng (random.Random): Générateur de la partie (voir IA_BZZZ)
+        """
+        super().__init__(rng)
+        self.cibles = {}
+        self.derniere_affectation = 0
+
+    def jouer_tour_mouvement(self, plateau, ruche, ruches):
+        """
+        Décide comment déplacer les abeilles : chaque abeille va vers sa cible.
+
+        Args:
+            plateau (Plateau): Le plateau de jeu
+            ruche (Ruche): La ruche de l'IA
+            ruches (list): Liste de toutes les ruches du jeu
+
+        Returns:
+            list: Liste de tuples (abeille, nouvelle_position)
+
+        Stratégie:
+            - Ne bouge pas les abeilles déjà près d'une fleur (si elles ont
+              de la place), comme IA_BZZZ
+            - Garde les cibles encore valables, affecte les autres abeilles
+              (affectation de coût minimal), au plus MAX_AFFECTATION par tour
+            - Vers une fleur : un pas sur le plus court chemin ; vers la ruche
+              ou sans cible : le mouvement de IA_BZZZ
+        """
+        libres = []
+        for abeille in ruche.abeilles:
+            if abeille.etat != "OK" or abeille.a_bouge:
+                self.cibles.pop(abeille, None)
+                continue
+            x, y = abeille.position
+            if plateau.fleurs_voisines[x][y] and abeille.nectar < CAPACITE_NECTAR[abeille.role]:
+                continue # butine au prochain tour (cible gardée)
+            libres.append(abeille)
+
+        # Cibles gardées : encore valables et pas prises par une autre abeille
+        prises = set()
+        a_affecter = []
+        for abeille in libres:
+            cible = self.cibles.get(abeille)
+            if cible is not None and cible not in prises and self._cible_valable(plateau, abeille, cible):
+                if cible != RUCHE:
+                    prises.add(cible)
+            else:
+                self.cibles.pop(abeille, None)
+                a_affecter.append(abeille)
+        a_affecter = a_affecter[:MAX_AFFECTATION]
+        self.derniere_affectation = len(a_affecter)
+        self._affecter(plateau, ruche, a_affecter, prises)
+
+        mouvements = []
+        visees = set()
+        for abeille in libres:
+            cible = self.cibles.get(abeille)
+            if cible is None or cible == RUCHE:
+                case = self._trouver_meilleur_mouvement(plateau, abeille, ruche, ruches)
+            else:
+                case = self._pas_vers(plateau, abeille, cible, visees)
+            if case is not None and case not in visees:
+                visees.add(case)
+                mouvements.append((abeille, case))
+        return mouvements
+
+    def _cible_valable(self, plateau, abeille, cible):
+        """
+        Vérifie qu'une cible gardée convient encore à l'abeille.
+        """
+        if cible == RUCHE:
+            return abeille.nectar > 0
+        x, y = cible
+        occupante = plateau.occupation[x][y]
+        return abeille.nectar < CAPACITE_NECTAR[abeille.role] and (occupante is None or occupante is abeille)
+
+    def _cases_fleurs(self, plateau, joueur, prises):
+        """
+        Cases d'où butiner encore libres, avec le gain de nectar par tour.
+        """
+        tables = plateau.tables
+        occupation = plateau.occupation
+        cases = []
+        for x, fleurs_ligne in enumerate(plateau.fleurs_voisines):
+            for y, fleurs in enumerate(fleurs_ligne):
+                if (fleurs and occupation[x][y] is None and (x, y) not in prises
+                        and tables.zones[x][y] in (-1, joueur)):
+                    cases.append(((x, y), gain_nectar(fleurs[0]))) # la première fleur est butinée
+        return cases
+
+    def _affecter(self, plateau, ruche, abeilles, prises):
+        """
+        Affecte des cibles aux abeilles (affectation de coût minimal).
+
+        Colonnes : les cases d'où butiner, puis pour chaque abeille sa propre
+        colonne "ruche" et sa colonne "sans cible" (coût 0). Coût d'une cible
+        = - nectar rapporté par tour.
+        """
+        if not abeilles:
+            return
+        joueur = ruche.joueur
+        taille = len(plateau)
+        cases = self._cases_fleurs(plateau, joueur, prises)
+        nb_cases = len(cases)
+        nb = len(abeilles)
+        infini = float("inf")
+        # Retour à la zone depuis chaque case, selon le type de déplacement
+        retours = {diagonale: [distance_zone(case, joueur, diagonale, taille) for case, _ in cases]
+                   for diagonale in (False, True)}
+
+        couts = []
+        for i, abeille in enumerate(abeilles):
+            x, y = abeille.position
+            diagonale = abeille.role == ECLAIREUSE
+            capacite = CAPACITE_NECTAR[abeille.role]
+            place = capacite - abeille.nectar
+            ligne = [infini] * (nb_cases + 2 * nb)
+            if place > 0:
+                for j, (case, gain) in enumerate(cases):
+                    aller = distances_terrain(taille, case, joueur, diagonale)[x][y]
+                    if aller != INACCESSIBLE:
+                        tours = aller + math.ceil(place / gain) + retours[diagonale][j]
+                        ligne[j] = -capacite / tours
+            if abeille.nectar > 0:
+                ligne[nb_cases + i] = -abeille.nectar / max(1, distance_zone(abeille.position, joueur, diagonale, taille))
+            ligne[nb_cases + nb + i] = 0.0
+            couts.append(ligne)
+
+        for abeille, j in zip(abeilles, affectation_min_cout(couts)):
+            if j < nb_cases:
+                self.cibles[abeille] = cases[j][0]
+            elif j < nb_cases + nb:
+                self.cibles[abeille] = RUCHE
+
+    def _pas_vers(self, plateau, abeille, cible, visees):
+        """
+        Case voisine libre qui rapproche le plus l'abeille de sa cible.
+        """
+        joueur = abeille.joueur
+        diagonale = abeille.role == ECLAIREUSE
+        distances = distances_terrain(len(plateau), cible, joueur, diagonale)
+        x, y = abeille.position
+        meilleure = None
+        meilleure_distance = distances[x][y]
+        occupation = plateau.occupation
+        for nx, ny in plateau.tables.voisins[(joueur, diagonale)][x][y]:
+            distance = distances[nx][ny]
+            if (distance != INACCESSIBLE and distance < meilleure_distance
+                    and occupation[nx][ny] is None and (nx, ny) not in visees):
+                meilleure = (nx, ny)
+                meilleure_distance = distance
+        return meilleure
@@ -0,0 +1,509 @@
+# ia_mcts.py - IA par recherche arborescente Monte-Carlo pour BZZZ
+"""
+IA qui choisit ses déplacements par recherche arborescente Monte-Carlo (MCTS).
+
+IA_MCTS a la même interface que IA_BZZZ (jouer_tour_ponte,
+jouer_tour_mouvement, jouer_tour_butinage) : elle se choisit dans le menu
+("IA MCTS") ou dans un tournoi ("ia_mcts:IA_MCTS").
+
+Phase de mouvement:
+    L'arbre décide le coup de chaque abeille l'une après l'autre (un niveau
+    par abeille, "rester" compris). Sous le dernier niveau, un nœud de hasard
+    tire l'escarmouche (esquives réussies ou ratées) : chaque résultat tiré
+    a son propre enfant. Chaque itération joue ensuite une partie rapide
+    (playout) : fin du tour et tours des adversaires avec la stratégie de
+    IA_BZZZ, pendant `horizon` tours de jeu, puis évalue la part de l'IA
+    (nectar et abeilles, voir _evaluer()).
+
+    Les abeilles hors de l'arbre jouent le coup que IA_BZZZ a choisi sur la
+    position de départ, et l'IA ne s'écarte d'un de ces coups que si les
+    playouts le montrent nettement meilleur (voir Noeud.meilleur_enfant()) :
+    avec une seule itération, elle joue exactement comme IA_BZZZ.
+
+    Tout est joué sur le plateau de la partie avec le journal des coups
+    (coups.py) puis annulé : aucune copie du plateau. La recherche s'arrête
+    au bout de `temps` secondes (ou de `iterations` itérations).
+
+Ponte et butinage restent ceux de IA_BZZZ : butiner ne coûte rien, et l'effet
+d'une ponte (5 nectar tout de suite, une abeille utile plus tard) dépasse
+l'horizon des playouts.
+
+Exemple:
+    >>> ia = IA_MCTS(temps=0.5)
+    >>> mouvements = ia.jouer_tour_mouvement(plateau, ruche, ruches)
+"""
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from model import *
+from coups import Journal
+from ia import IA_BZZZ
+from sauvegarde import decoder_position, encoder_position
+
+_executeur = None # processus de recherche partagés par toutes les IA_MCTS
+
+
+class Noeud:
+    """
+    Nœud de l'arbre de recherche.
+
+    Attributs:
+        coup (tuple ou None): Case choisie pour l'abeille de ce niveau
+                              (None = l'abeille reste sur place)
+        enfants (list): Nœuds déjà développés (le premier est le coup de IA_BZZZ)
+        a_essayer (list ou None): Coups pas encore développés (None = pas
+                                  encore calculés)
+        hasard (dict): Pour le nœud de hasard (toutes les abeilles décidées),
+                       enfant de chaque résultat d'escarmouche tiré
+        visites (int): Nombre d'itérations passées par ce nœud
+        total (float): Somme des valeurs obtenues
+        carres (float): Somme des carrés des valeurs (variance des playouts)
+    """
+    __slots__ = ("coup", "enfants", "a_essayer", "hasard", "visites", "total", "carres")
+
+    def __init__(self, coup=None):
+        self.coup = coup
+        self.enfants = []
+        self.a_essayer = None
+        self.hasard = {}
+        self.visites = 0
+        self.total = 0.0
+        self.carres = 0.0
+
+    def choisir_enfant(self, exploration):
+        """
+        Choisit l'enfant à explorer (UCB1 : valeur moyenne + bonus des
+        enfants peu visités).
+
+        Args:
+            exploration (float): Poids du bonus d'exploration
+
+        Returns:
+            Noeud: Enfant choisi
+        """
+        log_visites = math.log(self.visites)
+        meilleur = None
+        meilleur_score = None
+        for enfant in self.enfants:
+            score = enfant.total / enfant.visites + exploration * math.sqrt(log_visites / enfant.visites)
+            if meilleur_score is None or score > meilleur_score:
+                meilleur = enfant
+                meilleur_score = score
+        return meilleur
+
+    def meilleur_enfant(self, confiance):
+        """
+        Choisit le coup à jouer parmi les enfants.
+
+        Le premier enfant est le coup de IA_BZZZ. Un autre coup ne le remplace
+        que si sa valeur moyenne est plus haute de `confiance` écarts-types
+        (les playouts sont bruités par les esquives : sans ce seuil, l'IA
+        suivrait surtout la chance des tirages). Le 1e-9 écarte les
+        différences d'arrondi entre valeurs égales.
+
+        Args:
+            confiance (float): Nombre d'écarts-types exigés
+
+        Returns:
+            Noeud: Enfant choisi
+        """
+        defaut = self.enfants[0]
+        meilleur = defaut
+        for enfant in self.enfants[1:]:
+            if enfant.visites < 2 or enfant.total / enfant.visites <= meilleur.total / meilleur.visites:
+                continue
+            ecart = math.sqrt(enfant.variance() / enfant.visites + defaut.variance() / max(defaut.visites, 1))
+            if enfant.total / enfant.visites - defaut.total / defaut.visites > confiance * ecart + 1e-9:
+                meilleur = enfant
+        return meilleur
+
+    def exporter(self):
+        """
+        Arbre sous ce nœud en tuples (sans les nœuds de hasard), pour le
+        renvoyer d'un processus à l'autre.
+
+        Returns:
+            tuple: (coup, visites, total, carres, enfants exportés)
+        """
+        return (self.coup, self.visites, self.total, self.carres,
+                tuple(enfant.exporter() for enfant in self.enfants))
+
+    def fusionner(self, arbre):
+        """
+        Ajoute à ce nœud les statistiques d'un arbre exporté (même position).
+
+        Les enfants sont retrouvés par leur coup ; ceux qui manquent sont
+        ajoutés à la fin (le premier enfant reste le coup de IA_BZZZ).
+
+        Args:
+            arbre (tuple): Arbre créé par exporter()
+        """
+        _, visites, total, carres, enfants = arbre
+        self.visites += visites
+        self.total += total
+        self.carres += carres
+        par_coup = {enfant.coup: enfant for enfant in self.enfants}
+        for sous_arbre in enfants:
+            enfant = par_coup.get(sous_arbre[0])
+            if enfant is None:
+                enfant = Noeud(sous_arbre[0])
+                self.enfants.append(enfant)
+            enfant.fusionner(sous_arbre)
+
+    def variance(self):
+        """
+        Variance des valeurs des playouts passés par ce nœud.
+        """
+        if self.visites < 2:
+            return 0.0
+        moyenne = self.total / self.visites
+        return max(self.carres / self.visites - moyenne * moyenne, 0.0)
+
+
+class IA_MCTS(IA_BZZZ):
+    """
+    IA qui cherche ses déplacements par MCTS dans un temps donné.
+
+    Attributs:
+        temps (float): Temps de recherche par phase de mouvement (secondes)
+        iterations (int ou None): Nombre d'itérations par processus (remplace
+                                  le temps, utile pour des parties reproductibles)
+        horizon (int): Tours de jeu (tous les joueurs) simulés par playout
+        exploration (float): Poids de l'exploration (UCB1)
+        confiance (float): Écarts-types d'avance exigés pour préférer un coup
+                           à celui de IA_BZZZ
+        nb_joueurs (int): Nombre de ruches qui jouent
+        processus (int): Nombre de processus qui cherchent en même temps
+        derniere_recherche (dict): Itérations (tous processus) et durée de la
+                                   dernière recherche
+    """
+
+    def __init__(self, rng=None, temps=0.2, iterations=None, horizon=1, exploration=0.3, confiance=2.0,
+                 nb_joueurs=4, processus=1):
+        """
+        Crée une IA MCTS.
+
+        Args:
+            rng (random.Random): Générateur de la partie (None = module random,
+                                 le moteur donne le sien à ses IA)
+            temps (float): Temps de recherche par phase de mouvement (secondes)
+            iterations (int): Nombre fixe d'itérations par processus (None =
+                              selon le temps)
+            horizon (int): Tours de jeu simulés après le tour de l'IA
+            exploration (float): Poids de l'exploration (UCB1)
+            confiance (float): Écarts-types d'avance exigés pour préférer un
+                               coup à celui de IA_BZZZ
+            nb_joueurs (int): Nombre de ruches qui jouent
+            processus (int): Nombre de processus de recherche (1 = tout dans
+                             le processus courant, voir executeur_partage())
+        """
+        super().__init__(rng)
+        self.temps = temps
+        self.iterations = iterations
+        self.horizon = horizon
+        self.exploration = exploration
+        self.confiance = confiance
+        self.nb_joueurs = nb_joueurs
+        self.processus = processus
+        self.derniere_recherche = {"iterations": 0, "duree": 0.0}
+
+    def parametres(self):
+        """
+        Paramètres de recherche, pour recréer l'IA dans un autre processus.
+
+        Returns:
+            dict: Arguments de IA_MCTS() (sans rng ni processus)
+        """
+        return {"temps": self.temps, "iterations": self.iterations, "horizon": self.horizon,
+                "exploration": self.exploration, "confiance": self.confiance,
+                "nb_joueurs": self.nb_joueurs}
+
+    # ========== MOUVEMENT ==========
+
+    def jouer_tour_mouvement(self, plateau, ruche, ruches):
+        """
+        Décide comment déplacer les abeilles de l'IA (recherche MCTS).
+
+        Avec plusieurs processus, chacun cherche depuis la même position avec
+        sa propre graine (parallélisation à la racine) ; les visites et
+        valeurs de leurs arbres sont additionnées avant de choisir les coups.
+
+        Args:
+            plateau (list): Le plateau de jeu
+            ruche (Ruche): La ruche de l'IA
+            ruches (list): Liste de toutes les ruches du jeu
+
+        Returns:
+            list: Liste de tuples (abeille, nouvelle_position), à jouer dans
+                  cet ordre
+
+        Note:
+            Le plateau est modifié pendant la recherche puis remis exactement
+            dans son état de départ (journal des coups)
+        """
+        abeilles = self._abeilles_a_jouer(ruche)
+        if not abeilles:
+            return []
+        prevus = self._coups_prevus(plateau, ruche, ruches, abeilles)
+
+        rng = self.rng if self.rng is not None else random
+        graines = [rng.getrandbits(64) for _ in range(max(self.processus, 1))]
+        debut = time.perf_counter()
+        echeance = time.time() + self.temps
+
+        travaux = []
+        if len(graines) > 1:
+            executeur = executeur_partage(len(graines) - 1)
+            position = encoder_position(plateau, ruches)
+            travaux = [executeur.submit(_chercher_dans_processus, position, ruche.joueur, self.parametres(),
+                                        graine, echeance) for graine in graines[1:]]
+
+        racine, nb = self._chercher(plateau, ruches, abeilles, prevus, graines[0], echeance)
+        for travail in travaux:
+            arbre, nb_travail = travail.result()
+            racine.fusionner(arbre)
+            nb += nb_travail
+
+        journal = Journal(plateau, ruches)
+        try:
+            mouvements = self._meilleurs_coups(racine, abeilles, prevus, journal)
+        finally:
+            journal.annuler_jusqu_a(0)
+        self.derniere_recherche = {"iterations": nb, "duree": time.perf_counter() - debut}
+        return mouvements
+
+    def _abeilles_a_jouer(self, ruche):
+        """
+        Abeilles de la ruche qui peuvent encore bouger (une par niveau de l'arbre).
+        """
+        return [abeille for abeille in ruche.abeilles if abeille.etat == "OK" and not abeille.a_bouge]
+
+    def _coups_prevus(self, plateau, ruche, ruches, abeilles):
+        """
+        Coups de IA_BZZZ, décidés sur la position de départ : politique par
+        défaut de l'arbre (une abeille dont la case a été prise reste).
+
+        Returns:
+            list: Case prévue de chaque abeille (None = rester)
+        """
+        prevus = dict((id(abeille), case) for abeille, case in super().jouer_tour_mouvement(plateau, ruche, ruches))
+        return [prevus.get(id(abeille)) for abeille in abeilles]
+
+    def _chercher(self, plateau, ruches, abeilles, prevus, graine, echeance):
+        """
+        Construit l'arbre de recherche jusqu'à l'échéance (ou aux itérations).
+
+        Args:
+            plateau (Plateau): Plateau de jeu (remis dans son état de départ)
+            ruches (list): Les 4 ruches
+            abeilles (list): Abeilles à jouer, une par niveau
+            prevus (list): Coups de IA_BZZZ de chaque abeille
+            graine (int): Graine des tirages de cette recherche
+            echeance (float): Heure de fin (time.time())
+
+        Returns:
+            tuple: (racine, nombre d'itérations)
+        """
+        hasard = random.Random(graine) # tirages de la recherche
+        politique = IA_BZZZ(hasard) # stratégie des playouts
+        journal = Journal(plateau, ruches)
+        racine = Noeud()
+
+        nb = 0
+        try:
+            while nb < 1 or (self.iterations is not None and nb < self.iterations) \
+                    or (self.iterations is None and time.time() < echeance):
+                self._iteration(racine, abeilles, prevus, journal, politique, hasard)
+                nb += 1
+        finally:
+            journal.annuler_jusqu_a(0)
+        return racine, nb
+
+    def _coups_possibles(self, plateau, abeille, prevu):
+        """
+        Coups d'une abeille : rester ou aller sur une case libre voisine.
+
+        Le coup prévu par IA_BZZZ (rester si sa case est prise) est mis à la
+        fin de la liste : il est développé en premier.
+        """
+        coups = [None] + calculer_cases_disponibles(abeille, plateau)
+        if prevu not in coups:
+            prevu = None
+        coups.remove(prevu)
+        coups.append(prevu)
+        return coups
+
+    def _iteration(self, racine, abeilles, prevus, journal, politique, hasard):
+        """
+        Une itération : sélection, développement, hasard, playout, remontée.
+        """
+        plateau, ruches = journal.plateau, journal.ruches
+        ruche = ruches[abeilles[0].joueur]
+        chemin = [racine]
+        noeud = racine
+        niveau = 0
+
+        # Sélection et développement, une abeille par niveau
+        while niveau < len(abeilles):
+            abeille = abeilles[niveau]
+            if noeud.a_essayer is None:
+                noeud.a_essayer = self._coups_possibles(plateau, abeille, prevus[niveau])
+            if noeud.a_essayer:
+                enfant = Noeud(noeud.a_essayer.pop())
+                noeud.enfants.append(enfant)
+            else:
+                enfant = noeud.choisir_enfant(self.exploration)
+            if enfant.coup is not None:
+                journal.deplacer(abeille, enfant.coup)
+            noeud = enfant
+            chemin.append(noeud)
+            niveau += 1
+            if noeud.visites == 0:
+                break
+
+        # Abeilles hors de l'arbre : coups de IA_BZZZ
+        for abeille, coup in zip(abeilles[niveau:], prevus[niveau:]):
+            if coup is not None:
+                journal.deplacer(abeille, coup)
+
+        # Fin du tour de l'IA : butinage, puis escarmouche (nœud de hasard)
+        for abeille in politique.jouer_tour_butinage(plateau, ruche):
+            journal.butiner(abeille)
+        mises_ko = journal.escarmouche(ruche, hasard)
+        if niveau == len(abeilles) and noeud.visites > 0:
+            resultat = tuple(ruche.abeilles.index(abeille) for abeille in mises_ko)
+            enfant = noeud.hasard.get(resultat)
+            if enfant is None:
+                enfant = Noeud()
+                noeud.hasard[resultat] = enfant
+            chemin.append(enfant)
+
+        valeur = self._playout(journal, politique, hasard, ruche.joueur)
+        journal.annuler_jusqu_a(0)
+
+        for noeud in chemin:
+            noeud.visites += 1
+            noeud.total += valeur
+            noeud.carres += valeur * valeur
+
+    def _playout(self, journal, politique, hasard, joueur):
+        """
+        Joue les tours suivants avec la stratégie de IA_BZZZ puis évalue.
+
+        Returns:
+            float: Part du nectar de l'IA (entre 0 et 1)
+        """
+        plateau, ruches = journal.plateau, journal.ruches
+        for decalage in range(1, self.horizon * self.nb_joueurs + 1):
+            suivant = (joueur + decalage) % self.nb_joueurs
+            if suivant == 0:
+                journal.nouveau_tour()
+            ruche = ruches[suivant]
+
+            while True:
+                type_abeille = politique.jouer_tour_ponte(plateau, ruche)
+                if not type_abeille or journal.pondre(ruche, type_abeille)[0] is None:
+                    break
+            for abeille, case in politique.jouer_tour_mouvement(plateau, ruche, ruches):
+                journal.deplacer(abeille, case)
+            for abeille in politique.jouer_tour_butinage(plateau, ruche):
+                journal.butiner(abeille)
+            journal.escarmouche(ruche, hasard)
+
+        return self._evaluer(ruches, joueur)
+
+    def _evaluer(self, ruches, joueur):
+        """
+        Part du joueur dans le total des ruches qui jouent. Chaque ruche
+        compte son nectar, la moitié du nectar porté par ses abeilles et le
+        coût de ponte de chaque abeille (sinon une ponte, qui rapporte plus
+        tard, ferait baisser la valeur).
+
+        Returns:
+            float: Valeur entre 0 et 1
+        """
+        scores = []
+        for ruche in ruches[:self.nb_joueurs]:
+            porte = 0
+            for abeille in ruche.abeilles:
+                porte += abeille.nectar
+            scores.append(ruche.nectar + porte / 2 + COUT_PONTE * len(ruche.abeilles))
+        total = sum(scores)
+        if total == 0:
+            return 1 / self.nb_joueurs
+        return scores[joueur] / total
+
+    def _meilleurs_coups(self, racine, abeilles, prevus, journal):
+        """
+        Suit meilleur_enfant() niveau par niveau ; hors de l'arbre, coups de IA_BZZZ.
+
+        Returns:
+            list: Tuples (abeille, nouvelle_position) dans l'ordre des abeilles
+        """
+        mouvements = []
+        noeud = racine
+        for abeille, coup in zip(abeilles, prevus):
+            if noeud is not None and noeud.enfants:
+                noeud = noeud.meilleur_enfant(self.confiance)
+                coup = noeud.coup
+            else:
+                noeud = None
+            if coup is not None and journal.deplacer(abeille, coup)[0]:
+                mouvements.append((abeille, coup))
+        return mouvements
+
+
+def executeur_partage(nb_processus):
+    """
+    Retourne le groupe de processus des recherches parallèles.
+
+    Le groupe est créé à la première recherche puis gardé (et agrandi si
+    besoin) : les processus ne sont lancés qu'une fois par partie.
+
+    Args:
+        nb_processus (int): Nombre de processus nécessaires
+
+    Returns:
+        ProcessPoolExecutor: Groupe d'au moins nb_processus processus
+    """
+    global _executeur
+    if _executeur is not None and _executeur._max_workers < nb_processus:
+        fermer_executeur()
+    if _executeur is None:
+        _executeur = ProcessPoolExecutor(max_workers=nb_processus)
+    return _executeur
+
+
+def fermer_executeur():
+    """
+    Arrête les processus de recherche (relancés à la recherche suivante).
+    """
+    global _executeur
+    if _executeur is not None:
+        _executeur.shutdown()
+        _executeur = None
+
+
+def _chercher_dans_processus(position, joueur, parametres, graine, echeance):
+    """
+    Recherche d'un processus secondaire sur une position encodée.
+
+    Args:
+        position (bytes): Position (sauvegarde.encoder_position())
+        joueur (int): Numéro de la ruche qui joue
+        parametres (dict): Paramètres de l'IA (IA_MCTS.parametres())
+        graine (int): Graine des tirages de ce processus
+        echeance (float): Heure de fin (time.time())
+
+    Returns:
+        tuple: (arbre exporté, nombre d'itérations)
+    """
+    plateau, ruches = decoder_position(position)
+    ia = IA_MCTS(**parametres)
+    ruche = ruches[joueur]
+    abeilles = ia._abeilles_a_jouer(ruche)
+    prevus = ia._coups_prevus(plateau, ruche, ruches, abeilles)
+    racine, nb = ia._chercher(plateau, ruches, abeilles, prevus, graine, echeance)
+    return racine.exporter(), nb
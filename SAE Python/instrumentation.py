@@ -0,0 +1,631 @@
+# instrumentation.py - Mesures du déroulement d'une partie pour BZZZ
+"""
+Mesures du temps passé dans chaque phase et dans chaque décision d'IA.
+
+Le moteur (moteur.py) et l'interface (main.py) entourent leurs étapes de
+mesure("nom") : phases de jeu ("phase.escarmouche"...), décisions des IA
+("ia.mouvement"...) et dessin ("gui.redessiner"). Tant qu'aucun collecteur
+n'est actif, mesure() rend un contexte vide partagé : presque rien à payer.
+
+Observateurs (actifs dans un bloc with, ou avec activer()/desactiver()):
+    Collecteur : durée de chaque étape (histogramme par puissances de 2 de
+                 µs) et compteurs : appels des fonctions chaudes du modèle
+                 et de l'IA (FONCTIONS_COMPTEES, comptées seulement pendant
+                 l'activation), abeilles examinées par les phases (compter())
+    Trace : chaque étape comme un intervalle au format Chrome trace-event,
+            plus un intervalle par tour de jeu (marques "tour" du moteur),
+            à ouvrir dans chrome://tracing ou https://ui.perfetto.dev
+    Profileur : un profil cProfile par étape (fichiers pstats et résumé
+                des fonctions les plus coûteuses de chaque étape)
+    EcrivainEvenements (evenements.py) : événements de la partie (ponte,
+                mouvement, butinage, esquive...) écrits en JSONL
+
+Événements:
+    Le moteur signale les actions de la partie (signaler()) seulement si
+    un observateur les suit (evenements_suivis()) : sinon, rien n'est
+    préparé.
+
+Exemple:
+    >>> collecteur = Collecteur()
+    >>> with collecteur:
+    ...     moteur.jouer_jusqu_a_la_fin()
+    >>> print(collecteur.rapport())
+
+En ligne de commande : python main.py --stats --trace trace.json --profile profils,
+python bzzz.py partie --stats --trace trace.json --profile profils
+"""
+import contextlib
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+
+# Fonctions comptées pendant l'activation : (module, classe ou None, nom)
+FONCTIONS_COMPTEES = (
+    ("model", None, "case_libre_abeille"),
+    ("model", None, "calculer_cases_disponibles"),
+    ("model", None, "fleurs_accessibles"),
+    ("model", None, "trouver_opposantes"),
+    ("model", None, "calculer_proba_esquive"),
+    ("model", None, "tenter_deplacement"),
+    ("model", None, "tenter_butinage"),
+    ("ia", "IA_BZZZ", "_trouver_meilleur_mouvement"),
+    ("ia", "IA_BZZZ", "_evaluer_case"),
+    ("cartes", None, "cartes_ia"),
+)
+
+NB_CLASSES = 32 # classes de l'histogramme : moins de 2^k µs (et au moins 2^(k-1))
+
+_collecteurs = [] # observateurs actifs, dans l'ordre d'activation
+_originales = {} # (module, classe, nom) -> fonction d'origine, pendant l'activation
+_RIEN = contextlib.nullcontext()
+
+
+class _Mesure:
+    """
+    Contexte d'une mesure en cours (seulement si un collecteur est actif).
+    """
+    __slots__ = ("nom", "details", "debut")
+
+    def __init__(self, nom, details):
+        self.nom = nom
+        self.details = details
+
+    def __enter__(self):
+        for collecteur in _collecteurs:
+            collecteur.entrer(self.nom, self.details)
+        self.debut = time.perf_counter()
+        return self
+
+    def __exit__(self, *exception):
+        duree = time.perf_counter() - self.debut
+        for collecteur in reversed(_collecteurs):
+            collecteur.sortir(self.nom, self.debut, duree, self.details)
+        return False
+
+
+def mesure(nom, details=None):
+    """
+    Contexte qui mesure une étape pour les observateurs actifs.
+
+    Args:
+        nom (str): Nom de l'étape, ex: "phase.escarmouche"
+        details (dict): Précisions gardées par la trace, ex: {"fichier": ...}
+
+    Returns:
+        Contexte à utiliser avec with (contexte vide si rien n'est actif)
+    """
+    if not _collecteurs:
+        return _RIEN
+    return _Mesure(nom, details)
+
+
+def marquer(nom, details=None):
+    """
+    Signale un moment de la partie aux observateurs actifs.
+
+    Le moteur marque "tour" au début de chaque nouveau tour et "fin" à la
+    fin de la partie.
+
+    Args:
+        nom (str): Nom de la marque
+        details (dict): Précisions, ex: {"tour": 12}
+    """
+    if _collecteurs:
+        instant = time.perf_counter()
+        for collecteur in _collecteurs:
+            collecteur.marquer(nom, instant, details)
+
+
+def compter(nom, nombre=1):
+    """
+    Ajoute nombre au compteur nom des collecteurs actifs.
+
+    Args:
+        nom (str): Nom du compteur, ex: "abeilles.escarmouche"
+        nombre (int): Valeur à ajouter
+    """
+    for collecteur in _collecteurs:
+        collecteur.compter(nom, nombre)
+
+
+def evenements_suivis():
+    """
+    Indique si un observateur actif suit les événements de la partie.
+
+    Returns:
+        bool: True s'il faut préparer et signaler les événements
+    """
+    return any(collecteur.suit_evenements for collecteur in _collecteurs)
+
+
+def signaler(type_evenement, donnees):
+    """
+    Transmet un événement de la partie aux observateurs qui les suivent.
+
+    Args:
+        type_evenement (str): Type d'événement, ex: "butinage"
+        donnees (dict): Contenu de l'événement (valeurs JSON)
+    """
+    for collecteur in _collecteurs:
+        if collecteur.suit_evenements:
+            collecteur.evenement(type_evenement, donnees)
+
+
+def _compteur_appels(fonction, nom):
+    """
+    Enveloppe une fonction pour compter ses appels.
+    """
+    @functools.wraps(fonction)
+    def enveloppe(*args, **kwargs):
+        for collecteur in _collecteurs:
+            collecteur.compter(nom)
+        return fonction(*args, **kwargs)
+    enveloppe.originale = fonction
+    return enveloppe
+
+
+def _envelopper_fonctions():
+    """
+    Remplace les FONCTIONS_COMPTEES par leur compteur d'appels.
+
+    Les modules qui ont importé une fonction (from model import *) en ont
+    leur propre copie : elle est remplacée dans tous les modules chargés.
+    """
+    for nom_module, nom_classe, nom in FONCTIONS_COMPTEES:
+        module = sys.modules.get(nom_module)
+        if module is None:
+            continue
+        if nom_classe is not None:
+            classe = getattr(module, nom_classe)
+            originale = classe.__dict__[nom]
+            setattr(classe, nom, _compteur_appels(originale, f"appels.{nom_classe}.{nom}"))
+        else:
+            originale = getattr(module, nom)
+            enveloppe = _compteur_appels(originale, f"appels.{nom}")
+            for autre in list(sys.modules.values()):
+                if getattr(autre, nom, None) is originale:
+                    setattr(autre, nom, enveloppe)
+        _originales[(nom_module, nom_classe, nom)] = originale
+
+
+def _restaurer_fonctions():
+    """
+    Remet les fonctions d'origine (fin de la dernière activation).
+    """
+    for (nom_module, nom_classe, nom), originale in _originales.items():
+        module = sys.modules[nom_module]
+        if nom_classe is not None:
+            setattr(getattr(module, nom_classe), nom, originale)
+            continue
+        for autre in list(sys.modules.values()):
+            if getattr(getattr(autre, nom, None), "originale", None) is originale:
+                setattr(autre, nom, originale)
+    _originales.clear()
+
+
+def _compte_appels():
+    """
+    Indique si un observateur actif compte les appels des fonctions chaudes.
+    """
+    return any(collecteur.compte_appels for collecteur in _collecteurs)
+
+
+def activer(collecteur):
+    """
+    Active un observateur : il reçoit les mesures jusqu'à desactiver().
+
+    Args:
+        collecteur (Observateur): Observateur à activer
+    """
+    if collecteur.compte_appels and not _compte_appels():
+        _envelopper_fonctions()
+    _collecteurs.append(collecteur)
+
+
+def desactiver(collecteur):
+    """
+    Désactive un observateur (rien si déjà inactif).
+
+    Args:
+        collecteur (Observateur): Observateur à désactiver
+    """
+    if collecteur in _collecteurs:
+        _collecteurs.remove(collecteur)
+        if collecteur.compte_appels and not _compte_appels():
+            _restaurer_fonctions()
+
+
+@contextlib.contextmanager
+def observer(*observateurs):
+    """
+    Active des observateurs le temps d'un bloc with (les None sont ignorés).
+
+    Args:
+        observateurs (Observateur): Observateurs à activer
+
+    Exemple:
+        >>> with observer(Collecteur() if stats else None, trace):
+        ...     moteur.jouer_jusqu_a_la_fin()
+    """
+    actifs = [observateur for observateur in observateurs if observateur is not None]
+    for observateur in actifs:
+        activer(observateur)
+    try:
+        yield actifs
+    finally:
+        for observateur in reversed(actifs):
+            desactiver(observateur)
+
+
+class Observateur:
+    """
+    Base des observateurs : reçoit les mesures tant qu'il est actif.
+
+    Les sous-classes redéfinissent ce qui les intéresse (entrer, sortir,
+    compter, marquer, evenement), le reste ne fait rien.
+
+    Attributs:
+        compte_appels (bool): True pour compter les appels des
+                              FONCTIONS_COMPTEES pendant l'activation
+        suit_evenements (bool): True pour recevoir les événements de la
+                                partie (evenement())
+    """
+    compte_appels = False
+    suit_evenements = False
+
+    def __enter__(self):
+        activer(self)
+        return self
+
+    def __exit__(self, *exception):
+        desactiver(self)
+        return False
+
+    def entrer(self, nom, details):
+        """
+        Début d'une étape.
+        """
+
+    def sortir(self, nom, debut, duree, details):
+        """
+        Fin d'une étape.
+
+        Args:
+            nom (str): Nom de l'étape
+            debut (float): Début (time.perf_counter())
+            duree (float): Durée (secondes)
+            details (dict ou None): Précisions données à mesure()
+        """
+
+    def compter(self, nom, nombre=1):
+        """
+        Ajoute nombre au compteur nom.
+        """
+
+    def marquer(self, nom, instant, details):
+        """
+        Moment de la partie (voir marquer()).
+        """
+
+    def evenement(self, type_evenement, donnees):
+        """
+        Événement de la partie (voir signaler()), si suit_evenements.
+        """
+
+
+class Histogramme:
+    """
+    Durées d'une étape, rangées par puissances de 2 de microsecondes.
+
+    Attributs:
+        nombre (int): Nombre de mesures
+        total (float): Durée totale (secondes)
+        maximum (float): Plus longue mesure (secondes)
+        classes (list): classes[k] = mesures de moins de 2^k µs (et au
+                        moins 2^(k-1) µs)
+    """
+    __slots__ = ("nombre", "total", "maximum", "classes")
+
+    def __init__(self):
+        self.nombre = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.classes = [0] * NB_CLASSES
+
+    def ajouter(self, duree):
+        """
+        Ajoute une durée (secondes).
+        """
+        self.nombre += 1
+        self.total += duree
+        if duree > self.maximum:
+            self.maximum = duree
+        classe = min(NB_CLASSES - 1, max(0, int(duree * 1e6)).bit_length())
+        self.classes[classe] += 1
+
+    def quantile(self, q):
+        """
+        Borne haute (µs) de la classe qui contient le quantile q (0 à 1).
+        """
+        seuil = q * self.nombre
+        cumul = 0
+        for classe, nombre in enumerate(self.classes):
+            cumul += nombre
+            if nombre and cumul >= seuil:
+                return float(2 ** classe)
+        return self.maximum * 1e6
+
+    def resume(self):
+        """
+        Résumé de l'histogramme.
+
+        Returns:
+            dict: nombre, total_ms, moyenne_us, p50_us, p90_us, p99_us,
+                  max_us et histogramme {"<2^k µs": nombre}
+        """
+        return {
+            "nombre": self.nombre,
+            "total_ms": self.total * 1000,
+            "moyenne_us": self.total / self.nombre * 1e6 if self.nombre else 0.0,
+            "p50_us": self.quantile(0.5),
+            "p90_us": self.quantile(0.9),
+            "p99_us": self.quantile(0.99),
+            "max_us": self.maximum * 1e6,
+            "histogramme": {f"<{2 ** classe}": nombre for classe, nombre in enumerate(self.classes) if nombre}
+        }
+
+
+class Collecteur(Observateur):
+    """
+    Collecteur en mémoire des mesures : un histogramme par étape, des compteurs.
+
+    Attributs:
+        durees (dict): Histogramme de chaque étape mesurée, par nom
+        compteurs (dict): Valeur de chaque compteur, par nom
+    """
+    compte_appels = True
+
+    def __init__(self):
+        self.durees = {}
+        self.compteurs = {}
+
+    def sortir(self, nom, debut, duree, details):
+        """
+        Fin d'une étape : ajoute sa durée à son histogramme.
+        """
+        histogramme = self.durees.get(nom)
+        if histogramme is None:
+            histogramme = self.durees[nom] = Histogramme()
+        histogramme.ajouter(duree)
+
+    def compter(self, nom, nombre=1):
+        """
+        Ajoute nombre au compteur nom.
+        """
+        self.compteurs[nom] = self.compteurs.get(nom, 0) + nombre
+
+    def resume(self):
+        """
+        Résumé des mesures, prêt à écrire en JSON.
+
+        Returns:
+            dict: {"durees": {nom: résumé de l'histogramme}, "compteurs": {...}}
+        """
+        return {
+            "durees": {nom: histogramme.resume() for nom, histogramme in sorted(self.durees.items())},
+            "compteurs": dict(sorted(self.compteurs.items()))
+        }
+
+    def rapport(self):
+        """
+        Résumé des mesures en texte (tableau des étapes puis compteurs).
+
+        Returns:
+            str: Rapport sur plusieurs lignes
+        """
+        lignes = [f"{'étape':<22} {'nombre':>8} {'total ms':>10} {'moy. µs':>9} {'p50':>7} "
+                  f"{'p90':>7} {'p99':>7} {'max µs':>9}"]
+        for nom, resume in self.resume()["durees"].items():
+            lignes.append(f"{nom:<22} {resume['nombre']:>8} {resume['total_ms']:>10.1f} "
+                          f"{resume['moyenne_us']:>9.1f} {resume['p50_us']:>7.0f} {resume['p90_us']:>7.0f} "
+                          f"{resume['p99_us']:>7.0f} {resume['max_us']:>9.0f}")
+        for nom, valeur in sorted(self.compteurs.items()):
+            lignes.append(f"{nom:<44} {valeur:>10}")
+        return "\n".join(lignes)
+
+
+class Trace(Observateur):
+    """
+    Trace des étapes au format Chrome trace-event (JSON).
+
+    Chaque étape mesurée devient un intervalle ("ph": "X") sur le fil qui
+    l'a jouée ; les intervalles imbriqués (phase > décision d'IA > dessin)
+    s'affichent les uns sous les autres. Les tours de jeu sont sur une
+    ligne à part ("tours"), d'une marque "tour" à la suivante : les trous
+    entre les étapes d'un tour sont l'attente de l'interface
+    (fenetre.after).
+
+    Attributs:
+        evenements (list): Événements de la trace, dans l'ordre d'arrivée
+        origine (float): Instant zéro de la trace (time.perf_counter())
+        debut_tour (float ou None): Début du tour en cours (None hors partie)
+        tour (int ou None): Numéro du tour en cours
+    """
+    PID = 1
+    TID_TOURS = 0 # ligne des tours dans la trace
+
+    def __init__(self):
+        self.evenements = []
+        self.origine = time.perf_counter()
+        self.debut_tour = None
+        self.tour = None
+
+    def _us(self, instant):
+        return (instant - self.origine) * 1e6
+
+    def sortir(self, nom, debut, duree, details):
+        """
+        Fin d'une étape : ajoute son intervalle à la trace.
+        """
+        evenement = {"name": nom, "cat": nom.partition(".")[0], "ph": "X", "ts": self._us(debut),
+                     "dur": duree * 1e6, "pid": self.PID, "tid": threading.get_ident()}
+        if details:
+            evenement["args"] = details
+        self.evenements.append(evenement)
+
+    def marquer(self, nom, instant, details):
+        """
+        Marque de la partie : "tour" ferme le tour en cours et en ouvre un
+        autre, "fin" ferme le tour en cours. Les marques deviennent des
+        événements instantanés ("ph": "i") sur la ligne des tours.
+        """
+        if nom in ("tour", "fin") and self.debut_tour is not None:
+            self.evenements.append(self._intervalle_tour(instant))
+        if nom == "tour":
+            self.tour = (details or {}).get("tour")
+            self.debut_tour = instant
+            return
+        if nom == "fin":
+            self.debut_tour = None
+        self.evenements.append({"name": nom, "cat": "partie", "ph": "i", "s": "g", "ts": self._us(instant),
+                                "pid": self.PID, "tid": self.TID_TOURS, "args": details or {}})
+
+    def _intervalle_tour(self, instant):
+        """
+        Intervalle du tour en cours, de son début jusqu'à instant.
+        """
+        return {"name": f"tour {self.tour}", "cat": "tour", "ph": "X", "ts": self._us(self.debut_tour),
+                "dur": (instant - self.debut_tour) * 1e6, "pid": self.PID, "tid": self.TID_TOURS}
+
+    def en_json(self):
+        """
+        Trace complète (tour en cours fermé maintenant).
+
+        Returns:
+            dict: {"traceEvents": [...], "displayTimeUnit": "ms"}
+        """
+        evenements = self.evenements
+        if self.debut_tour is not None:
+            evenements = evenements + [self._intervalle_tour(time.perf_counter())]
+        noms = [{"name": "process_name", "ph": "M", "pid": self.PID, "args": {"name": f"BZZZ ({os.getpid()})"}},
+                {"name": "thread_name", "ph": "M", "pid": self.PID, "tid": self.TID_TOURS, "args": {"name": "tours"}}]
+        return {"traceEvents": noms + evenements, "displayTimeUnit": "ms"}
+
+    def ecrire(self, chemin):
+        """
+        Écrit la trace dans un fichier JSON (chrome://tracing, Perfetto).
+
+        Args:
+            chemin (str): Fichier à écrire
+        """
+        with open(chemin, "w", encoding="utf-8") as fichier:
+            json.dump(self.en_json(), fichier)
+
+
+class Profileur(Observateur):
+    """
+    Profils cProfile séparés pour chaque étape mesurée.
+
+    Une étape imbriquée dans une autre (décision d'IA dans sa phase, dessin
+    après une action d'IA) met en pause le profil de l'étape englobante :
+    chaque profil ne garde que le code propre à son étape. Profiler toute
+    l'interface mélangerait les fonctions du modèle à la boucle de Tk.
+
+    Attributs:
+        profils (dict): Profil (cProfile.Profile) de chaque étape, par nom
+        pile (list): Profils des étapes en cours, le dernier est actif
+    """
+
+    def __init__(self):
+        self.profils = {}
+        self.pile = []
+
+    def entrer(self, nom, details):
+        """
+        Début d'une étape : son profil prend la main.
+        """
+        if self.pile:
+            self.pile[-1].disable()
+        profil = self.profils.get(nom)
+        if profil is None:
+            profil = self.profils[nom] = cProfile.Profile()
+        self.pile.append(profil)
+        profil.enable()
+
+    def sortir(self, nom, debut, duree, details):
+        """
+        Fin d'une étape : le profil de l'étape englobante reprend.
+        """
+        self.pile.pop().disable()
+        if self.pile:
+            self.pile[-1].enable()
+
+    def statistiques(self, nom):
+        """
+        Statistiques du profil d'une étape.
+
+        Args:
+            nom (str): Nom de l'étape
+
+        Returns:
+            pstats.Stats: Statistiques (None si l'étape n'a pas été jouée)
+        """
+        profil = self.profils.get(nom)
+        if profil is None:
+            return None
+        return pstats.Stats(profil, stream=io.StringIO())
+
+    def resume(self, nom, nb_lignes=20, tri="tottime"):
+        """
+        Fonctions les plus coûteuses d'une étape, en texte.
+
+        Args:
+            nom (str): Nom de l'étape
+            nb_lignes (int): Nombre de fonctions affichées
+            tri (str): Critère de tri de pstats ("tottime", "cumulative"...)
+
+        Returns:
+            str: Tableau de pstats ("" si l'étape n'a pas été jouée)
+        """
+        statistiques = self.statistiques(nom)
+        if statistiques is None:
+            return ""
+        statistiques.stream = io.StringIO()
+        statistiques.strip_dirs().sort_stats(tri).print_stats(nb_lignes)
+        return statistiques.stream.getvalue()
+
+    def ecrire(self, dossier, nb_lignes=20):
+        """
+        Écrit un fichier pstats et un résumé texte par étape.
+
+        Fichiers: <dossier>/<étape>.pstats (à ouvrir avec pstats ou
+        snakeviz), <dossier>/<étape>.txt, et <dossier>/resume.txt qui
+        rassemble les résumés de toutes les étapes.
+
+        Args:
+            dossier (str): Dossier des fichiers (créé si besoin)
+            nb_lignes (int): Nombre de fonctions par résumé
+
+        Returns:
+            list: Chemins des fichiers pstats écrits
+        """
+        os.makedirs(dossier, exist_ok=True)
+        chemins = []
+        resumes = []
+        for nom in sorted(self.profils):
+            chemin = os.path.join(dossier, f"{nom}.pstats")
+            self.profils[nom].dump_stats(chemin)
+            chemins.append(chemin)
+            texte = self.resume(nom, nb_lignes)
+            with open(os.path.join(dossier, f"{nom}.txt"), "w", encoding="utf-8") as fichier:
+                fichier.write(texte)
+            resumes.append(f"===== {nom} =====\n{texte}")
+        with open(os.path.join(dossier, "resume.txt"), "w", encoding="utf-8") as fichier:
+            fichier.write("\n".join(resumes))
+        return chemins
@@ -9,13 +9,17 @@ Ce fichier gère tout l'affichage et les interactions :
 - Animations et messages
 - Menu de démarrage
 
-La logique du jeu est dans model.py !
+La logique du jeu est dans model.py, le déroulement de la partie dans moteur.py !
 """
 
 
+import argparse
 from tkinter import *
 from model import *
 from ia import *
+from moteur import *
+from instrumentation import Collecteur, Profileur, Trace, mesure, observer
+from evenements import EcrivainEvenements
 
 # =================================
 # CONSTANTES GLOBALES
@@ -30,13 +34,7 @@ COULEURS_RUCHES = {
 
 TAILLE_SPRITE_ORIGINALE = 1024
 
-POSITIONS_RUCHES = {
-    0: (0, 0),
-    1: (0, 15),
-    2: (15, 0),
-    3: (15, 15)
-}
-
+FICHIER_SAUVEGARDE = "partie.bzzz" # écrit par Ctrl+S pendant la partie
 
 # =================================
 # CHARGEMENT DES IMAGES
@@ -68,8 +66,9 @@ def charger_image(chemin, taille_case):
         if ratio < 1:
             ratio = 1
         
-        image = PhotoImage(file=chemin)
-        image = image.subsample(ratio, ratio)
+        with mesure("gui.image", {"fichier": chemin}):
+            image = PhotoImage(file=chemin)
+            image = image.subsample(ratio, ratio)
         
         return image
         
@@ -144,23 +143,24 @@ def charger_toutes_images(taille_case):
     """
     print("Chargement des images...")
     
-    images_ruches = {}
-    for ruche_id in COULEURS_RUCHES.keys():
-        images_ruches[ruche_id] = charger_ruche(ruche_id, taille_case)
+    with mesure("gui.images"):
+        images_ruches = {}
+        for ruche_id in COULEURS_RUCHES.keys():
+            images_ruches[ruche_id] = charger_ruche(ruche_id, taille_case)
     
-    image_fleur = charger_image("image/fleur.png", taille_case)
-    image_terre = charger_image("image/terre_seamless.png", taille_case)
+        image_fleur = charger_image("image/fleur.png", taille_case)
+        image_terre = charger_image("image/terre_seamless.png", taille_case)
     
-    images_abeilles = {}
-    types_abeilles = ["bourdon", "ouvriere", "eclaireuse"]
-    camps = ["ruche0", "ruche1", "ruche2", "ruche3"]
-    directions = ["droite", "gauche"]
+        images_abeilles = {}
+        types_abeilles = ["bourdon", "ouvriere", "eclaireuse"]
+        camps = ["ruche0", "ruche1", "ruche2", "ruche3"]
+        directions = ["droite", "gauche"]
     
-    for role in types_abeilles:
-        for ruche_id in camps:
-            for direction in directions:
-                cle = f"{role}_{ruche_id}_{direction}"
-                images_abeilles[cle] = charger_abeille(role, ruche_id, direction, taille_case)
+        for role in types_abeilles:
+            for ruche_id in camps:
+                for direction in directions:
+                    cle = f"{role}_{ruche_id}_{direction}"
+                    images_abeilles[cle] = charger_abeille(role, ruche_id, direction, taille_case)
     
     print("Images chargées !")
     
@@ -364,7 +364,7 @@ def dessiner_plateau(canvas, plateau, taille_case, images_ruches, image_fleur, i
             # Vérifier abeille KO
             abeille_ko = False
             for elem in case:
-                if isinstance(elem, dict) and elem.get("type") == "abeille" and elem.get("etat") == "KO":
+                if isinstance(elem, EntiteCompat) and elem.get("type") == "abeille" and elem.get("etat") == "KO":
                     abeille_ko = True
                     break
             
@@ -373,7 +373,7 @@ def dessiner_plateau(canvas, plateau, taille_case, images_ruches, image_fleur, i
             
             # Dessiner les éléments
             for element in case:
-                if isinstance(element, dict):
+                if isinstance(element, EntiteCompat):
                     if element["type"] == "ruche":
                         image = images_ruches.get(element["id"])
                         if image:
@@ -401,7 +401,7 @@ def dessiner_cases_disponibles(canvas, abeille, plateau, taille_case):
     
     Args:
         canvas (Canvas): Canvas tkinter où dessiner
-        abeille (dict): Abeille sélectionnée
+        abeille (Abeille): Abeille sélectionnée
         plateau (list): Plateau de jeu
         taille_case (float): Taille d'une case en pixels
     
@@ -432,7 +432,7 @@ def dessiner_selection_abeille(canvas, abeille, taille_case):
     
     Args:
         canvas (Canvas): Canvas tkinter où dessiner
-        abeille (dict): Abeille sélectionnée
+        abeille (Abeille): Abeille sélectionnée
         taille_case (float): Taille d'une case en pixels
     
     Style:
@@ -475,18 +475,23 @@ def afficher_message(label_message, texte, couleur, fenetre):
     fenetre.after(2500, lambda: label_message.config(text=""))
 
 
-def mettre_a_jour_label_tour(label_tour, tour_actuel):
+def mettre_a_jour_label_tour(label_tour, tour_actuel, nectar_en_jeu=None):
     """
     Met à jour l'affichage du numéro de tour.
     
     Args:
         label_tour (Label): Label à mettre à jour
         tour_actuel (int): Numéro du tour en cours
+        nectar_en_jeu (int): Nectar restant sur fleurs et abeilles (optionnel)
     
     Format:
         "TOUR X / 300" (où 300 = TIME_OUT)
+        "TOUR X / 300 - NECTAR EN JEU : N" si nectar_en_jeu est donné
     """
-    label_tour.config(text=f"TOUR {tour_actuel} / {TIME_OUT}")
+    texte = f"TOUR {tour_actuel} / {TIME_OUT}"
+    if nectar_en_jeu is not None:
+        texte = f"{texte} - NECTAR EN JEU : {nectar_en_jeu}"
+    label_tour.config(text=texte)
 
 
 def mettre_a_jour_label_phase(label_phase, phase, joueur_actuel, est_ia):
@@ -554,7 +559,7 @@ def mettre_a_jour_label_ruche(label, ruche, joueur_num, est_actif, est_joueur_ac
     
     Args:
         label (Label): Label de la ruche à mettre à jour
-        ruche (dict): Dictionnaire de la ruche
+        ruche (Ruche): Ruche à afficher
         joueur_num (int): Numéro du joueur (0-3)
         est_actif (bool): True si le joueur participe à la partie
         est_joueur_actuel (bool): True si c'est le tour de ce joueur
@@ -606,213 +611,6 @@ def mettre_a_jour_label_ruche(label, ruche, joueur_num, est_actif, est_joueur_ac
         label.config(text=texte, font=("Arial", 11, "bold"), relief="raised", borderwidth=3)
 
 
-# =================================
-# GESTION DES DÉPLACEMENTS AUTOMATIQUES
-# =================================
-
-def calculer_prochaine_case(abeille, destination, plateau):
-    """
-    Calcule la prochaine case pour se rapprocher d'une destination.
-    
-    Utilisé pour le système de prémove : l'abeille avance d'une case
-    par tour vers sa destination programmée.
-    
-    Args:
-        abeille (dict): Abeille qui se déplace
-        destination (tuple): Position finale (x, y)
-        plateau (list): Plateau de jeu
-    
-    Returns:
-        tuple ou None: (x, y) de la prochaine case, ou None si impossible
-    
-    Algorithme:
-        1. Calculer dx et dy (direction à prendre)
-        2. Si éclaireuse : aller en diagonale si possible
-        3. Sinon : avancer sur l'axe avec la plus grande distance
-        4. Vérifier que la case est valide (libre, pas zone ennemie)
-    
-    Note:
-        Retourne None si déjà arrivé, case bloquée ou zone ennemie
-    """
-
-    x_actuel, y_actuel = abeille["position"]
-    x_dest, y_dest = destination
-    
-    if (x_actuel, y_actuel) == (x_dest, y_dest):
-        return None
-    
-    # Calculer dx (direction horizontale)
-    if x_dest == x_actuel:
-        dx = 0
-    elif x_dest > x_actuel:
-        dx = 1
-    else:
-        dx = -1
-    
-    # Calculer dy (direction verticale)
-    if y_dest == y_actuel:
-        dy = 0
-    elif y_dest > y_actuel:
-        dy = 1
-    else:
-        dy = -1
-    
-    # Choisir la prochaine case selon le type d'abeille
-    if abeille["role"] == "eclaireuse":
-        prochaine = (x_actuel + dx, y_actuel + dy)
-    else:
-        dist_x = abs(x_dest - x_actuel)
-        dist_y = abs(y_dest - y_actuel)
-        
-        if dist_x >= dist_y:
-            prochaine = (x_actuel + dx, y_actuel)
-        else:
-            prochaine = (x_actuel, y_actuel + dy)
-    
-    x_new, y_new = prochaine
-    
-    if not (0 <= x_new < NCASES and 0 <= y_new < NCASES):
-        return None
-    
-    if not case_libre_abeille(plateau, x_new, y_new):
-        return None
-    
-    joueur = int(abeille["camp"][-1])
-    for i in range(4):
-        if i != joueur and dans_zone_ruche(prochaine, i):
-            return None
-    
-    return prochaine
-
-
-def executer_deplacements_automatiques(ruche, plateau, ruches):
-    """
-    Exécute un pas de déplacement pour toutes les abeilles programmées.
-    
-    Pour chaque abeille de la ruche qui a une destination programmée
-    (attribut "destination_automatique"), tente de la déplacer d'une
-    case vers sa destination.
-    
-    Args:
-        ruche (dict): Ruche dont on déplace les abeilles
-        plateau (list): Plateau de jeu
-        ruches (list): Liste des 4 ruches
-    
-    Returns:
-        bool: True si au moins une abeille a bougé, False sinon
-    
-    Note:
-        Supprime "destination_automatique" de l'abeille quand elle arrive
-    """
-    abeilles_bougees = False
-    
-    for abeille in ruche["abeilles"]:
-        if abeille["etat"] != "OK" or abeille["a_bouge"] or "destination_automatique" not in abeille:
-            continue
-        
-        destination_finale = abeille["destination_automatique"]
-        x_actuel, y_actuel = abeille["position"]
-        
-        prochaine_case = calculer_prochaine_case(abeille, destination_finale, plateau)
-        
-        if prochaine_case is None:
-            continue
-        
-        x_new, y_new = prochaine_case
-        
-        if y_new > y_actuel:
-            abeille["direction"] = "droite"
-        elif y_new < y_actuel:
-            abeille["direction"] = "gauche"
-        
-        succes, _ = tenter_deplacement(plateau, abeille, prochaine_case, ruches)
-        
-        if succes:
-            abeilles_bougees = True
-            if prochaine_case == destination_finale:
-                del abeille["destination_automatique"]
-    
-    return abeilles_bougees
-
-
-# =================================
-# VERIFICATIONS AUTOMATIQUES
-# =================================
-
-def verifier_auto_skip_mouvement(ruche):
-    """
-    Vérifie si toutes les abeilles de la ruche ont bougé.
-    
-    Permet de passer automatiquement à la phase suivante si plus
-    aucune abeille ne peut bouger.
-    
-    Args:
-        ruche (dict): Ruche à vérifier
-    
-    Returns:
-        bool: True si toutes les abeilles OK ont bougé, False sinon
-    """
-    for a in ruche["abeilles"]:
-        if a["etat"] == "OK" and not a["a_bouge"]:
-            return False
-    return True
-
-
-def verifier_auto_skip_butinage(ruche, plateau):
-    """
-    Vérifie si toutes les abeilles disponibles ont butiné.
-    
-    Permet de passer automatiquement à la phase suivante si plus
-    aucune abeille ne peut butiner (pas de fleur accessible).
-    
-    Args:
-        ruche (dict): Ruche à vérifier
-        plateau (list): Plateau de jeu
-    
-    Returns:
-        bool: True si toutes les abeilles OK ont butiné ou n'ont
-              pas de fleur accessible, False sinon
-    """
-    for abeille in ruche["abeilles"]:
-        if abeille["etat"] == "OK" and not abeille["a_bouge"]:
-            x, y = abeille["position"]
-            if fleurs_accessibles(plateau, x, y):
-                return False
-    return True
-
-
-def verifier_peut_ponte(ruche):
-    """
-    Vérifie si la ruche a assez de nectar pour pondre.
-    
-    Args:
-        ruche (dict): Ruche à vérifier
-    
-    Returns:
-        bool: True si nectar >= COUT_PONTE (5), False sinon
-    """
-    return ruche["nectar"] >= COUT_PONTE
-
-
-def verifier_a_abeille_active(ruche):
-    """
-    Vérifie si la ruche a au moins une abeille en état OK.
-    
-    Args:
-        ruche (dict): Ruche à vérifier
-    
-    Returns:
-        bool: True si au moins une abeille est active, False sinon
-    
-    Note:
-        Utilisé pour sauter la phase de mouvement si plus d'abeilles
-    """
-    for abeille in ruche["abeilles"]:
-        if abeille["etat"] == "OK":
-            return True
-    return False
-
-
 # =================================
 # GESTION DES CLICS
 # =================================
@@ -826,12 +624,12 @@ def gerer_clic_selection_abeille(case, ruche, message_func, redessiner_func):
     
     Args:
         case (list): Éléments présents sur la case cliquée
-        ruche (dict): Ruche du joueur actuel
+        ruche (Ruche): Ruche du joueur actuel
         message_func (function): Fonction pour afficher un message
         redessiner_func (function): Fonction pour redessiner (non utilisée ici)
     
     Returns:
-        dict ou None: Abeille sélectionnée, ou None si aucune trouvée
+        Abeille ou None: Abeille sélectionnée, ou None si aucune trouvée
     
     Conditions pour sélectionner une abeille:
         - Type = "abeille"
@@ -840,7 +638,7 @@ def gerer_clic_selection_abeille(case, ruche, message_func, redessiner_func):
         - a_bouge = False (n'a pas encore bougé)
     """
     for element in case:
-        if (isinstance(element, dict) and 
+        if (isinstance(element, EntiteCompat) and 
             element.get("type") == "abeille" and
             element["camp"] == ruche["id"] and
             element["etat"] == "OK" and
@@ -852,7 +650,7 @@ def gerer_clic_selection_abeille(case, ruche, message_func, redessiner_func):
     return None
 
 
-def gerer_clic_deplacement(abeille, x, y, plateau, ruches, message_func, redessiner_func):
+def gerer_clic_deplacement(abeille, x, y, moteur, message_func, redessiner_func):
     """
     Gère le déplacement d'une abeille vers une case cliquée.
     
@@ -860,11 +658,10 @@ def gerer_clic_deplacement(abeille, x, y, plateau, ruches, message_func, redessi
     Si la case est lointaine : programmation d'un déplacement automatique
     
     Args:
-        abeille (dict): Abeille sélectionnée à déplacer
+        abeille (Abeille): Abeille sélectionnée à déplacer
         x (int): Ligne de la case de destination
         y (int): Colonne de la case de destination
-        plateau (list): Plateau de jeu
-        ruches (list): Liste des 4 ruches
+        moteur (MoteurBZZZ): Partie en cours (le déplacement passe par lui)
         message_func (function): Fonction pour afficher un message
         redessiner_func (function): Fonction pour redessiner (non utilisée ici)
     
@@ -875,7 +672,7 @@ def gerer_clic_deplacement(abeille, x, y, plateau, ruches, message_func, redessi
     Fonctionnement:
         1. Met à jour la direction de l'abeille (droite/gauche)
         2. Vérifie si la case est adjacente (distance = 1)
-        3. Si oui : déplacement immédiat
+        3. Si oui : déplacement immédiat (moteur.deplacer)
         4. Si non : ajoute "destination_automatique" à l'abeille
     """
     x_old, y_old = abeille["position"]
@@ -889,7 +686,7 @@ def gerer_clic_deplacement(abeille, x, y, plateau, ruches, message_func, redessi
     est_adjacent = distance_valide((x_old, y_old), (x, y), distance_max=1, diagonale_autorisee=diagonale_ok)
     
     if est_adjacent:
-        succes, erreur = tenter_deplacement(plateau, abeille, (x, y), ruches)
+        succes, erreur = moteur.deplacer(abeille, (x, y))
         
         if not succes:
             message_func(erreur, "#FF4444")
@@ -904,7 +701,7 @@ def gerer_clic_deplacement(abeille, x, y, plateau, ruches, message_func, redessi
         return False
 
 
-def gerer_clic_butinage(case, ruche, plateau, message_func, redessiner_func):
+def gerer_clic_butinage(case, moteur, message_func, redessiner_func):
     """
     Gère le clic pour faire butiner une abeille en phase butinage.
     
@@ -913,8 +710,7 @@ def gerer_clic_butinage(case, ruche, plateau, message_func, redessiner_func):
     
     Args:
         case (list): Éléments présents sur la case cliquée
-        ruche (dict): Ruche du joueur actuel
-        plateau (list): Plateau de jeu
+        moteur (MoteurBZZZ): Partie en cours (le butinage passe par lui)
         message_func (function): Fonction pour afficher un message
         redessiner_func (function): Fonction pour redessiner le plateau
     
@@ -927,14 +723,15 @@ def gerer_clic_butinage(case, ruche, plateau, message_func, redessiner_func):
         - N'a pas bougé ce tour
         - Fleur accessible
     """
+    ruche = moteur.ruche_actuelle()
     for element in case:
-        if (isinstance(element, dict) and
+        if (isinstance(element, EntiteCompat) and
             element.get("type") == "abeille" and
             element["camp"] == ruche["id"] and
             element["etat"] == "OK" and
             not element["a_bouge"]):
             
-            succes, resultat = tenter_butinage(plateau, element, ruche)
+            succes, resultat = moteur.faire_butiner(element)
             
             if not succes:
                 message_func(resultat, "#FF4444")
@@ -951,34 +748,28 @@ def gerer_clic_butinage(case, ruche, plateau, message_func, redessiner_func):
 # FONCTION PRINCIPALE
 # =================================
 
-def afficher_plateau(plateau, ruches, tour_actuel, nectar_total_initial, config):
+def afficher_plateau(moteur):
     """
     Crée et lance la fenêtre principale du jeu.
     
     C'est la fonction centrale qui initialise toute l'interface graphique
-    et gère le déroulement de la partie.
+    et affiche le déroulement de la partie gérée par le moteur.
     
     Args:
-        plateau (list): Plateau de jeu 16x16
-        ruches (list): Liste des 4 ruches
-        tour_actuel (int): Numéro du tour de départ (toujours 1)
-        nectar_total_initial (int): Nectar total au début (pour victoire)
-        config (dict): Configuration {"nb_joueurs": int, "ia": [bool, bool, bool, bool]}
+        moteur (MoteurBZZZ): Partie à afficher (plateau, ruches, tour, phase,
+                             joueur actuel, file de pontes, IA)
     
     Fonctionnement:
         1. Crée la fenêtre tkinter 1360x990 pixels
         2. Charge toutes les images
-        3. Initialise les variables d'état (joueur, phase, abeille sélectionnée...)
+        3. Initialise les variables d'affichage (abeille sélectionnée...)
         4. Crée les labels, canvas et boutons
         5. Définit toutes les fonctions locales (message, pondre, passer_phase...)
         6. Lance la boucle principale tkinter
     
     Variables d'état:
-        - joueur_actuel : 0 à 3 (qui joue)
-        - phase : "ponte", "mouvement" ou "butinage"
+        - moteur : état de la partie (joueur_actuel, phase, tour, file_pontes, ias)
         - abeille_cliquee : None ou abeille sélectionnée
-        - file_pontes : liste des pontes automatiques en attente
-        - ias : [None ou IA_BZZZ] pour chaque joueur
     
     Fonctions imbriquées:
         - message() : affiche un message temporaire
@@ -986,11 +777,16 @@ def afficher_plateau(plateau, ruches, tour_actuel, nectar_total_initial, config)
         - afficher_boutons_ponte() : affiche/cache les boutons de ponte
         - pondre() : tente de pondre une abeille
         - passer_phase() : passe à la phase suivante
-        - executer_escarmouche() : lance l'escarmouche et passe au joueur suivant
+        - sauvegarder() : sauvegarde la partie (Ctrl+S)
+        - afficher_fin_partie() : affiche le gagnant
         - clic_plateau() : gère les clics sur le plateau
         - verifier_auto_skip() : vérifie si on peut auto-skip
         - jouer_ia_si_necessaire() : lance l'IA si c'est son tour
         - executer_tour_ia() : fait jouer l'IA pour la phase actuelle
+    
+    Note:
+        La logique du tour (phases, escarmouche, joueur suivant) est dans
+        moteur.py, les fonctions locales ne font qu'afficher le résultat
     """
     
     # ========== CREATION DE LA FENÊTRE ==========
@@ -1009,20 +805,11 @@ def afficher_plateau(plateau, ruches, tour_actuel, nectar_total_initial, config)
     images_ruches, image_fleur, images_abeilles, image_terre = charger_toutes_images(taille_case)
     
     # ========== VARIABLES D'ETAT ==========
-    joueur_actuel = 0 # Joueur qui joue (0, 1, 2 ou 3)
-    phase = "ponte" # Phase actuelle ("ponte", "mouvement", "butinage")
+    plateau = moteur.plateau
+    ruches = moteur.ruches
     abeille_cliquee = None # Abeille sélectionnée pour déplacement
-    config_ia = config["ia"] # [bool, bool, bool, bool] : qui est IA
-    nb_joueurs_actifs = config["nb_joueurs"] # Combien de joueurs (vrai humain) participent
-    file_pontes = []  # File d'attente des pontes automatiques
-
-    # Création des IAs (None si joueur humain)
-    ias = []
-    for i in range(4):
-        if config_ia[i]:
-            ias.append(creer_ia())
-        else:
-            ias.append(None)
+    ias = moteur.ias # [None ou IA_BZZZ] pour chaque joueur
+    nb_joueurs_actifs = moteur.nb_joueurs # Combien de ruches participent
     
     # ========== CREATION DE L'INTERFACE ==========
     
@@ -1094,34 +881,34 @@ def afficher_plateau(plateau, ruches, tour_actuel, nectar_total_initial, config)
     
     def redessiner():
         """Redessine tout le plateau et l'interface."""
-        nonlocal joueur_actuel, phase, abeille_cliquee
-        # Effacer le canvas
-        canvas.delete("all")
-        # Redessiner tout dans l'ordre
-        dessiner_zones_protegees(canvas, taille_case, width, height)
-        dessiner_plateau(canvas, plateau, taille_case, images_ruches, image_fleur, images_abeilles, image_terre)
-        dessiner_quadrillage(canvas, width, height, taille_case)
+        with mesure("gui.redessiner"):
+            # Effacer le canvas
+            canvas.delete("all")
+            # Redessiner tout dans l'ordre
+            dessiner_zones_protegees(canvas, taille_case, width, height)
+            dessiner_plateau(canvas, plateau, taille_case, images_ruches, image_fleur, images_abeilles, image_terre)
+            dessiner_quadrillage(canvas, width, height, taille_case)
         
-        # Si une abeille est sélectionnée, montrer les cases disponibles
-        if abeille_cliquee:
-            if phase == "mouvement":
-                dessiner_cases_disponibles(canvas, abeille_cliquee, plateau, taille_case)
-            dessiner_selection_abeille(canvas, abeille_cliquee, taille_case)
-
-        # Mettre à jour tous les labels
-        mettre_a_jour_label_tour(label_tour, tour_actuel)
+            # Si une abeille est sélectionnée, montrer les cases disponibles
+            if abeille_cliquee:
+                if moteur.phase == "mouvement":
+                    dessiner_cases_disponibles(canvas, abeille_cliquee, plateau, taille_case)
+                dessiner_selection_abeille(canvas, abeille_cliquee, taille_case)
+
+            # Mettre à jour tous les labels
+            mettre_a_jour_label_tour(label_tour, moteur.tour, calculer_nectar_disponible(plateau, ruches))
         
-        est_ia = (ias[joueur_actuel] is not None)
-        mettre_a_jour_label_phase(label_phase, phase, joueur_actuel, est_ia)
+            joueur_actuel = moteur.joueur_actuel
+            mettre_a_jour_label_phase(label_phase, moteur.phase, joueur_actuel, moteur.est_tour_ia())
         
-        for i in range(len(labels_ruches)):
-            est_actif = (i < nb_joueurs_actifs)
-            est_joueur_actuel = (i == joueur_actuel)
-            est_ia_joueur = (ias[i] is not None)
-            mettre_a_jour_label_ruche(labels_ruches[i], ruches[i], i, est_actif, est_joueur_actuel, est_ia_joueur)
+            for i in range(len(labels_ruches)):
+                est_actif = (i < nb_joueurs_actifs)
+                est_joueur_actuel = (i == joueur_actuel)
+                est_ia_joueur = (ias[i] is not None)
+                mettre_a_jour_label_ruche(labels_ruches[i], ruches[i], i, est_actif, est_joueur_actuel, est_ia_joueur)
         
-        # Afficher/cacher les boutons de ponte
-        afficher_boutons_ponte()
+            # Afficher/cacher les boutons de ponte
+            afficher_boutons_ponte()
     
     def afficher_boutons_ponte():
         """Affiche les boutons de ponte si nécessaire."""
@@ -1130,13 +917,13 @@ def afficher_plateau(plateau, ruches, tour_actuel, nectar_total_initial, config)
             widget.destroy()
         
         # Si c'est une IA, ne rien afficher
-        if ias[joueur_actuel] is not None:
+        if moteur.est_tour_ia():
             return
         
         # Afficher la file de ponte si elle existe
-        if len(file_pontes) > 0:
+        if len(moteur.file_pontes) > 0:
             Label(frame_boutons_ponte,
-                  text=f"File de ponte: {len(file_pontes)} en attente",
+                  text=f"File de ponte: {len(moteur.file_pontes)} en attente",
                   font=("Arial", 10, "bold"),
                   bg="#2C2C2C", fg="#FFD700").pack(side=TOP, pady=(0, 5))
         
@@ -1163,113 +950,65 @@ def afficher_plateau(plateau, ruches, tour_actuel, nectar_total_initial, config)
 
     def pondre(type_abeille):
         """Gère la ponte d'une abeille."""
-        ruche = ruches[joueur_actuel]
-        pos = POSITIONS_RUCHES[joueur_actuel]
-        
-        if phase == "ponte":
-            abeille, erreur = tenter_ponte(plateau, ruche, type_abeille, pos)
+        if moteur.phase == "ponte":
+            abeille, erreur = moteur.pondre(type_abeille)
             if erreur:
                 message(erreur, "#FF4444")
             else:
                 message(f"{type_abeille} pondu(e) !", "#00FF00")
                 redessiner()
         else:
-            file_pontes.append(type_abeille)
-            message(f"{type_abeille} ajouté(e) à la file de ponte ({len(file_pontes)} en attente)", "#FFD700")
+            nb_attente = moteur.programmer_ponte(type_abeille)
+            message(f"{type_abeille} ajouté(e) à la file de ponte ({nb_attente} en attente)", "#FFD700")
             redessiner()
     
     def passer_phase():
         """Passe à la phase suivante."""
-        nonlocal joueur_actuel, phase, tour_actuel, abeille_cliquee
+        nonlocal abeille_cliquee
         
         abeille_cliquee = None # Désélectionner l'abeille
-        ruche = ruches[joueur_actuel]
-        
-        if phase == "ponte":
-            # 1. Gérer file de pontes automatiques
-            if file_pontes:
-                type_abeille = file_pontes[0]
-                pos = POSITIONS_RUCHES[joueur_actuel]
-                abeille, erreur = tenter_ponte(plateau, ruche, type_abeille, pos)
-                
-                if abeille:
-                    file_pontes.pop(0)
-                    message(f"{type_abeille} a rejoint la GUERRE automatiquement !", "#00FF00")
-                    redessiner()
-                    return
-                else:
-                    file_pontes.clear()
-            
-            # 2. Passage à la phase mouvement (TOUJOURS, même si pas assez de nectar)
-            phase = "mouvement"
-            
-            if not verifier_a_abeille_active(ruche):
-                passer_phase()
-                return
-        
-        elif phase == "mouvement":
-            abeilles_bougees = executer_deplacements_automatiques(ruche, plateau, ruches)
-            
-            if abeilles_bougees:
-                redessiner()
-                fenetre.update()
-            
-            phase = "butinage"
-            
-            peut_butiner = False
-            for abeille in ruche["abeilles"]:
-                if abeille["etat"] == "OK" and not abeille["a_bouge"]:
-                    x, y = abeille["position"]
-                    if fleurs_accessibles(plateau, x, y):
-                        peut_butiner = True
-                        break
-            
-            if not peut_butiner:
-                passer_phase()
-                return
         
-        elif phase == "butinage":
-            executer_escarmouche()
+        abeille_pondue = moteur.passer_phase()
+        if abeille_pondue:
+            # Ponte depuis la file d'attente : on reste en phase de ponte
+            message(f"{abeille_pondue['role']} a rejoint la GUERRE automatiquement !", "#00FF00")
+            redessiner()
             return
         
         redessiner()
+        if moteur.fini:
+            afficher_fin_partie()
+            return
         jouer_ia_si_necessaire()
     
-    def executer_escarmouche():
-        """Exécute l'escarmouche et passe au joueur suivant."""
-        nonlocal joueur_actuel, phase, tour_actuel
-        
-        phase_escarmouche(plateau, ruches[joueur_actuel])
-        
-        fini, gagnant, raison = fin_de_partie(plateau, ruches, tour_actuel, nectar_total_initial)
-        if fini:
-            label_gagnant = Label(fenetre, text="", font=("Arial", 20, "bold"),
-                                bg="#FF6262", fg="#FFFFFF")
-            label_gagnant.grid(row=0, column=0, columnspan=5, sticky="")
-            
-            messages_fin = {
-                "timeout": f"{tour_actuel} tours terminés ! Joueur {int(gagnant['id'][-1])+1} gagne avec {gagnant['nectar']} nectar !",
-                "blitzkrieg": f"VICTOIRE PAR DOMINATION ! Joueur {int(gagnant['id'][-1])+1} gagne avec {gagnant['nectar']} nectar !",
-                "epuisement": f"RUPTURE DE STOCK ! Joueur {int(gagnant['id'][-1])+1} gagne avec {gagnant['nectar']} nectar !"
-            }
-            
-            label_gagnant.config(text=messages_fin.get(raison, "FIN"))
-            btn_passer.config(state="disabled")
+    def sauvegarder(event=None):
+        """Sauvegarde la partie dans FICHIER_SAUVEGARDE (Ctrl+S)."""
+        try:
+            moteur.sauvegarder(FICHIER_SAUVEGARDE)
+        except OSError as erreur:
+            message(f"Sauvegarde impossible : {erreur}", "#FF4444")
             return
+        message(f"Partie sauvegardée dans {FICHIER_SAUVEGARDE} (python main.py {FICHIER_SAUVEGARDE} pour reprendre)", "#00FF00")
+    
+    def afficher_fin_partie():
+        """Affiche le gagnant et bloque le bouton de passage."""
+        gagnant = moteur.gagnant
+        label_gagnant = Label(fenetre, text="", font=("Arial", 20, "bold"),
+                            bg="#FF6262", fg="#FFFFFF")
+        label_gagnant.grid(row=0, column=0, columnspan=5, sticky="")
         
-        joueur_actuel = (joueur_actuel + 1) % nb_joueurs_actifs
+        messages_fin = {
+            "timeout": f"{moteur.tour} tours terminés ! Joueur {gagnant['joueur']+1} gagne avec {gagnant['nectar']} nectar !",
+            "blitzkrieg": f"VICTOIRE PAR DOMINATION ! Joueur {gagnant['joueur']+1} gagne avec {gagnant['nectar']} nectar !",
+            "epuisement": f"RUPTURE DE STOCK ! Joueur {gagnant['joueur']+1} gagne avec {gagnant['nectar']} nectar !"
+        }
         
-        if joueur_actuel == 0:
-            tour_actuel += 1
-            nouveau_tour(ruches)
-        
-        phase = "ponte"
-        redessiner()
-        jouer_ia_si_necessaire()
+        label_gagnant.config(text=messages_fin.get(moteur.raison, "FIN"))
+        btn_passer.config(state="disabled")
     
     def clic_plateau(event):
         """Gère les clics sur le plateau."""
-        if ias[joueur_actuel] is not None:
+        if moteur.est_tour_ia() or moteur.fini:
             return
         
         nonlocal abeille_cliquee
@@ -1280,99 +1019,67 @@ def afficher_plateau(plateau, ruches, tour_actuel, nectar_total_initial, config)
         if not (0 <= x < NCASES and 0 <= y < NCASES):
             return
         
-        ruche = ruches[joueur_actuel]
+        ruche = moteur.ruche_actuelle()
         case = plateau[x][y]
         
-        if phase == "mouvement":
+        if moteur.phase == "mouvement":
             if abeille_cliquee is None:
                 abeille_cliquee = gerer_clic_selection_abeille(case, ruche, message, redessiner)
                 if abeille_cliquee:
                     redessiner()
             else:
-                succes = gerer_clic_deplacement(abeille_cliquee, x, y, plateau, ruches, message, redessiner)
+                succes = gerer_clic_deplacement(abeille_cliquee, x, y, moteur, message, redessiner)
                 if succes: # Si succes == False (déplacement auto ou échec), on garde abeille_cliquee sélectionnée
                     abeille_cliquee = None
                     redessiner()
                     verifier_auto_skip()
         
-        elif phase == "butinage":
-            if gerer_clic_butinage(case, ruche, plateau, message, redessiner):
+        elif moteur.phase == "butinage":
+            if gerer_clic_butinage(case, moteur, message, redessiner):
                 verifier_auto_skip()
     
     def verifier_auto_skip():
         """Vérifie si on doit automatiquement passer à la phase suivante."""
-        ruche = ruches[joueur_actuel]
+        ruche = moteur.ruche_actuelle()
         
-        if phase == "mouvement" and verifier_auto_skip_mouvement(ruche):
+        if moteur.phase == "mouvement" and verifier_auto_skip_mouvement(ruche):
             fenetre.after(20, passer_phase)
         
-        elif phase == "butinage" and verifier_auto_skip_butinage(ruche, plateau):
+        elif moteur.phase == "butinage" and verifier_auto_skip_butinage(ruche, plateau):
             fenetre.after(20, passer_phase)
     
     def jouer_ia_si_necessaire():
         """Vérifie si le joueur actuel est une IA et lance son tour."""
-        if ias[joueur_actuel] is not None:
+        if moteur.est_tour_ia():
             fenetre.after(20, executer_tour_ia)
     
-    def executer_tour_ia():
-        """Fait jouer l'IA pour la phase actuelle."""
-        nonlocal phase, abeille_cliquee
+    def apres_action_ia(nom_action, detail):
+        """Affiche chaque action de l'IA au fur et à mesure."""
+        joueur_num = moteur.joueur_actuel + 1
         
-        ia = ias[joueur_actuel]
-        ruche = ruches[joueur_actuel]
+        if nom_action == "ponte":
+            message(f"IA {joueur_num} a pondu un(e) {detail} !", "#FFA500")
+        elif nom_action == "butinage":
+            message(f"IA {joueur_num} a butiné +{detail} !", "#FFA500")
         
-        if phase == "ponte":
-            file_pontes.clear()
-            type_abeille = ia.jouer_tour_ponte(plateau, ruche)
-            if type_abeille:
-                pos = POSITIONS_RUCHES[joueur_actuel]
-                abeille, erreur = tenter_ponte(plateau, ruche, type_abeille, pos)
-                if not erreur:
-                    message(f"IA {joueur_actuel+1} a pondu un(e) {type_abeille} !", "#FFA500")
-                    redessiner()
-                    fenetre.after(20, jouer_ia_si_necessaire)
-                    return
-            fenetre.after(20, passer_phase)
-        
-        elif phase == "mouvement":
-            for abeille in ruche["abeilles"]:
-                if "destination_automatique" in abeille:
-                    del abeille["destination_automatique"]
-            
-            mouvements = ia.jouer_tour_mouvement(plateau, ruche, ruches)
-            for abeille, nouvelle_pos in mouvements:
-                x_old, y_old = abeille["position"]
-                x_new, y_new = nouvelle_pos
-                
-                if y_new > y_old:
-                    abeille["direction"] = "droite"
-                elif y_new < y_old:
-                    abeille["direction"] = "gauche"
-                
-                succes, _ = tenter_deplacement(plateau, abeille, nouvelle_pos, ruches)
-                if succes:
-                    redessiner()
-                    fenetre.update()
-            
-            fenetre.after(20, passer_phase)
-        
-        elif phase == "butinage":
-            abeilles = ia.jouer_tour_butinage(plateau, ruche)
-            for abeille in abeilles:
-                succes, resultat = tenter_butinage(plateau, abeille, ruche)
-                if succes:
-                    message(f"IA {joueur_actuel+1} a butiné +{resultat} !", "#FFA500")
-                    redessiner()
-                    fenetre.update()
-            
-            fenetre.after(20, passer_phase)
+        redessiner()
+        fenetre.update()
+    
+    def executer_tour_ia():
+        """Fait jouer l'IA pour la phase actuelle."""
+        moteur.jouer_phase_ia(apres_action_ia)
+        fenetre.after(20, passer_phase)
     
     # ========== LANCEMENT ==========
     
     btn_passer.config(command=passer_phase)
     canvas.bind("<Button-1>", clic_plateau)
+    fenetre.bind("<Control-s>", sauvegarder)
     redessiner()
-    jouer_ia_si_necessaire()
+    if moteur.fini: # partie reprise déjà terminée
+        afficher_fin_partie()
+    else:
+        jouer_ia_si_necessaire()
     fenetre.mainloop()
 
 
@@ -1389,13 +1096,14 @@ def menu_demarrage():
     - Modes avec IA (1-3 joueurs + IA, ou 4 IA)
     
     Returns:
-        dict: Configuration choisie {"nb_joueurs": int, "ia": [bool, bool, bool, bool]}
+        dict: Configuration choisie {"nb_joueurs": int, "ia": [bool, bool, bool, bool],
+              "type_ia": "glouton", "affectation" ou "mcts"}
     
     Exemple:
         >>> config = menu_demarrage()
         >>> # Utilisateur choisit "2 JOUEURS + 2 IA"
         >>> config
-        {"nb_joueurs": 4, "ia": [False, False, True, True]}
+        {"nb_joueurs": 4, "ia": [False, False, True, True], "type_ia": "glouton"}
     
     Note:
         La fenêtre se ferme automatiquement quand un mode est choisi
@@ -1407,7 +1115,8 @@ def menu_demarrage():
     menu.resizable(False, False)
     menu.configure(bg="#2C2C2C")
     
-    choix_mode = {"nb_joueurs": 4, "ia": [False, False, False, False]}
+    choix_mode = {"nb_joueurs": 4, "ia": [False, False, False, False], "type_ia": "glouton"}
+    type_ia = StringVar(menu, value="glouton")
     
     Label(menu, text="BZZZ - GUERRE DES ABEILLES", 
           font=("Arial", 24, "bold"), 
@@ -1423,6 +1132,7 @@ def menu_demarrage():
     def lancer_mode(nb_joueurs, config_ia):
         choix_mode["nb_joueurs"] = nb_joueurs
         choix_mode["ia"] = config_ia
+        choix_mode["type_ia"] = type_ia.get()
         menu.destroy()
     
     boutons = [
@@ -1454,6 +1164,17 @@ def menu_demarrage():
               width=25, height=2, relief="raised", borderwidth=4,
               cursor="hand2", command=lambda c=ia_config: lancer_mode(4, c)).pack(pady=6)
     
+    types_ia = [
+        ("IA classique", "glouton"),
+        ("IA affectation (répartit ses abeilles entre les fleurs)", "affectation"),
+        ("IA MCTS (recherche Monte-Carlo, plus lente)", "mcts"),
+    ]
+    
+    for text, valeur in types_ia:
+        Radiobutton(frame_boutons, text=text, variable=type_ia, value=valeur,
+                    font=("Arial", 11), bg="#2C2C2C", fg="white", selectcolor="#2C2C2C",
+                    activebackground="#2C2C2C", activeforeground="white").pack(anchor="w")
+    
     Label(menu, text="Choisissez votre configuration", 
           font=("Arial", 10, "italic"), 
           bg="#2C2C2C", fg="#888888", pady=20).pack(side=BOTTOM)
@@ -1463,36 +1184,96 @@ def menu_demarrage():
     return choix_mode
 
 
-def lancer_partie():
+def lancer_partie(reprise=None, stats=False, trace=None, profil=None, evenements=None):
     """
     Lance une partie complète de BZZZ.
     
     C'est le point d'entrée du programme. Cette fonction :
     1. Affiche le menu de démarrage
     2. Récupère la configuration choisie
-    3. Crée le plateau, les ruches et les fleurs
-    4. Calcule le nectar total initial
-    5. Lance l'interface graphique
+    3. Crée la partie (plateau, ruches, fleurs, nectar initial) via le moteur
+    4. Lance l'interface graphique
+    
+    Args:
+        reprise (str): Fichier de sauvegarde à reprendre (Ctrl+S en cours de
+                       partie). Le menu n'est alors pas affiché. Un fichier
+                       absent ou abîmé est signalé dans la console.
+        stats (bool): Mesurer les phases, les IA et le dessin (voir
+                      instrumentation.py), rapport affiché à la fermeture
+        trace (str): Fichier où écrire la trace Chrome (tours, phases, IA,
+                     dessin, chargement des images) à la fermeture
+        profil (str): Dossier où écrire un profil cProfile par phase et par
+                      décision d'IA (pstats + résumé texte) à la fermeture
+        evenements (str): Fichier où journaliser les événements de la partie
+                          (JSONL, écrit au fil de la partie, voir evenements.py)
     
     Affiche des informations de démarrage dans la console.
     """
+    if reprise is not None:
+        try:
+            moteur = charger_moteur(reprise)
+        except (OSError, ValueError) as erreur:
+            print(f"Impossible de reprendre {reprise} : {erreur}")
+            return
+        print(f"Reprise de {reprise} : tour {moteur.tour}, joueur {moteur.joueur_actuel + 1}, phase {moteur.phase}")
+        afficher_partie(moteur, stats, trace, profil, evenements)
+        return
+    
     config = menu_demarrage()
     
     print("="*50)
     print("Lancement du jeu...")
     print(f"Nombre de joueurs humains: {config['nb_joueurs']}")
-    print(f"Configuration IA: {config['ia']}")
+    print(f"Configuration IA: {config['ia']} ({config['type_ia']})")
     print("="*50)
     
-    plateau = creer_plateau()
-    ruches = creer_ruche(plateau)
-    fleurs = creer_fleurs(NFLEURS)
-    placer_fleurs(plateau, fleurs)
+    moteur = MoteurBZZZ(config)
 
-    nectar_total_initial = calculer_nectar_total_initial(plateau)
+    afficher_partie(moteur, stats, trace, profil, evenements)
 
-    afficher_plateau(plateau, ruches, 1, nectar_total_initial, config)
+
+def afficher_partie(moteur, stats=False, trace=None, profil=None, evenements=None):
+    """
+    Affiche la partie, en mesurant son déroulement si demandé.
+
+    Args:
+        moteur (MoteurBZZZ): Partie à afficher
+        stats (bool): Mesurer la partie et afficher le rapport à la fermeture
+        trace (str): Fichier de la trace Chrome, écrit à la fermeture
+        profil (str): Dossier des profils par étape, écrits à la fermeture
+        evenements (str): Fichier du journal des événements (JSONL)
+    """
+    collecteur = Collecteur() if stats else None
+    traceur = Trace() if trace else None
+    profileur = Profileur() if profil else None
+    ecrivain = EcrivainEvenements(evenements) if evenements else None
+    with observer(collecteur, traceur, profileur, ecrivain):
+        moteur.demarrer() # partie créée (ou reprise) avant les mesures
+        afficher_plateau(moteur)
+
+    if collecteur is not None:
+        print(collecteur.rapport())
+    if traceur is not None:
+        traceur.ecrire(trace)
+        print(f"Trace écrite dans {trace} (chrome://tracing ou https://ui.perfetto.dev)")
+    if profileur is not None:
+        profileur.ecrire(profil)
+        print(f"Profils écrits dans {profil} (un fichier pstats par étape, résumé dans resume.txt)")
+    if ecrivain is not None:
+        ecrivain.fermer()
+        print(f"Événements écrits dans {evenements} ({ecrivain.nb_evenements} événements)")
 
 
 if __name__ == "__main__":
-    lancer_partie()
+    analyseur = argparse.ArgumentParser(description="BZZZ - Guerre des Abeilles")
+    analyseur.add_argument("reprise", nargs="?", help="partie sauvegardée à reprendre (Ctrl+S)")
+    analyseur.add_argument("--stats", action="store_true",
+                           help="mesurer phases, IA et dessin (rapport à la fermeture)")
+    analyseur.add_argument("--trace", metavar="FICHIER",
+                           help="écrire une trace Chrome de la partie (JSON) à la fermeture")
+    analyseur.add_argument("--profile", metavar="DOSSIER",
+                           help="profiler chaque phase et décision d'IA (pstats) à la fermeture")
+    analyseur.add_argument("--evenements", metavar="FICHIER",
+                           help="journaliser les événements de la partie (JSONL, .gz pour compresser)")
+    arguments = analyseur.parse_args()
+    lancer_partie(arguments.reprise, arguments.stats, arguments.trace, arguments.profile, arguments.evenements)
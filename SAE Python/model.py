@@ -10,6 +10,10 @@ Ce fichier gère le modèle de données et les règles du jeu :
 Aucun code graphique ici, uniquement de la logique pure !
 """
 import random
+from entites import *
+from deplacements import *
+from zobrist import *
+from chemins import planifier_deplacements
 
 NCASES = 16 # taille plateau
 NECTAR_INITIAL = 10 #au lancement
@@ -28,15 +32,72 @@ FORCE = {
     "ouvriere":1,
     "bourdon":5
 }
+POSITIONS_RUCHES = { #case de ponte de chaque joueur (coins du plateau)
+    0: (0, 0),
+    1: (0, NCASES-1),
+    2: (NCASES-1, 0),
+    3: (NCASES-1, NCASES-1)
+}
 
 #----Création des paramètres de bases----
+class Plateau(list):
+    """
+    Plateau de jeu : liste 2D de cases, plus un index d'occupation des abeilles.
+    
+    Se manipule exactement comme une liste de listes (plateau[x][y] est la
+    liste des éléments de la case). En plus, plateau.occupation[x][y] donne
+    directement l'abeille posée sur la case (ou None), sans parcourir la case.
+    
+    Attributs:
+        occupation (list): Grille NCASES x NCASES, abeille ou None par case
+        fleurs_voisines (list): Pour chaque case, les fleurs des 9 cases autour
+        nb_fleurs_nectar (list): Pour chaque case, combien de ces fleurs
+                                 ont encore du nectar
+        nectar_fleurs (int): Nectar total restant sur les fleurs
+        nectar_abeilles (int): Nectar total transporté par les abeilles
+        tables (TablesDeplacement): Voisins autorisés et zones des ruches,
+                                    précalculés pour la taille du plateau
+        zobrist (ClesZobrist): Clés de hachage des éléments d'une position
+                               (None tant que activer_hachage() n'est pas appelé)
+        cle (int): Clé de Zobrist (64 bits) de la position : abeilles, fleurs
+                   et nectar des ruches (voir zobrist.py), 0 sans hachage
+    
+    Note:
+        L'index est tenu à jour par placer_abeille() et tenter_deplacement(),
+        il ne faut pas ajouter/retirer une abeille d'une case à la main.
+        Les tables de fleurs sont construites par placer_fleurs() (les fleurs
+        ne bougent plus ensuite) et mises à jour par butiner().
+        Les totaux de nectar sont tenus à jour par butiner(), deposer_nectar()
+        et phase_escarmouche() (le nectar des ruches est dans ruche.nectar).
+        La clé est tenue à jour par les mêmes fonctions, plus creer_ruche(),
+        placer_fleurs(), tenter_ponte() et nouveau_tour(), seulement si le
+        hachage est activé : une partie ordinaire ne paie ni les clés en
+        mémoire ni leur mise à jour
+    """
+    def __init__(self, taille=NCASES):
+        super().__init__()
+        for _ in range(taille):
+            ligne = []
+            for _ in range(taille):
+                ligne.append([])
+            self.append(ligne)
+        self.occupation = [[None] * taille for _ in range(taille)]
+        self.fleurs_voisines = [[[] for _ in range(taille)] for _ in range(taille)]
+        self.nb_fleurs_nectar = [[0] * taille for _ in range(taille)]
+        self.nectar_fleurs = 0
+        self.nectar_abeilles = 0
+        self.tables = tables_deplacement(taille)
+        self.zobrist = None
+        self.cle = 0
+
 def creer_plateau():
     """
     Crée un plateau de jeu vide de taille NCASES x NCASES (16x16).
     
     Returns:
-        list: Plateau de jeu, liste 2D où chaque case est une liste vide.
-              Structure : plateau[ligne][colonne] = []
+        Plateau: Plateau de jeu, liste 2D où chaque case est une liste vide.
+                 Structure : plateau[ligne][colonne] = []
+                 plateau.occupation[ligne][colonne] = abeille ou None
     
     Exemple:
         >>> plateau = creer_plateau()
@@ -47,13 +108,26 @@ def creer_plateau():
         >>> plateau[0][0]  # Case vide au départ
         []
     """
-    plateau = []
-    for _ in range(NCASES):
-        ligne = []
-        for _ in range(NCASES):
-            ligne.append([])
-        plateau.append(ligne)
-    return plateau
+    return Plateau(NCASES)
+
+def activer_hachage(plateau, ruches):
+    """
+    Active la clé de Zobrist du plateau (pour une IA qui retrouve des positions).
+    
+    Tire les clés de la taille du plateau (une fois par taille) et calcule la
+    clé de la position : le modèle la tient ensuite à jour à chaque action.
+    
+    Args:
+        plateau (Plateau): Plateau de jeu
+        ruches (list): Les 4 ruches
+    
+    Exemple:
+        >>> activer_hachage(plateau, ruches)
+        >>> table.enregistrer(plateau.cle, 2, 37.5)
+    """
+    if plateau.zobrist is None:
+        plateau.zobrist = cles_zobrist(len(plateau), ROLES, MAX_NECTAR, max(CAPACITE_NECTAR.values()), TIME_KO)
+    plateau.cle = calculer_cle(plateau, ruches)
 
 def creer_ruche(plateau):
     """
@@ -75,39 +149,24 @@ def creer_ruche(plateau):
         - Ruche 3 : coin bas-droite (15, 15)    - Joueur jaune
     
     Note:
-        Chaque ruche contient : type, id, nectar initial, liste d'abeilles vide
-    """
-    ruche0 = {
-        "type": "ruche",
-        "id": "ruche0",
-        "nectar": NECTAR_INITIAL,
-        "abeilles": []
-    }
-    ruche1 = {
-        "type": "ruche",
-        "id": "ruche1",
-        "nectar": NECTAR_INITIAL,
-        "abeilles": []
-    }
-    ruche2 = {
-        "type": "ruche",
-        "id": "ruche2",
-        "nectar": NECTAR_INITIAL,
-        "abeilles": []
-    }
-    ruche3 = {
-        "type": "ruche",
-        "id": "ruche3",
-        "nectar": NECTAR_INITIAL,
-        "abeilles": []
-    }
+        Chaque ruche (objet Ruche) contient : type, id, joueur, nectar initial,
+        liste d'abeilles vide
+    """
+    ruche0 = Ruche(0, NECTAR_INITIAL)
+    ruche1 = Ruche(1, NECTAR_INITIAL)
+    ruche2 = Ruche(2, NECTAR_INITIAL)
+    ruche3 = Ruche(3, NECTAR_INITIAL)
     #placer les ruches
+    N = len(plateau)
     plateau[0][0].append(ruche0)
-    plateau[0][NCASES-1].append(ruche1)
-    plateau[NCASES-1][0].append(ruche2)
-    plateau[NCASES-1][NCASES-1].append(ruche3)
+    plateau[0][N-1].append(ruche1)
+    plateau[N-1][0].append(ruche2)
+    plateau[N-1][N-1].append(ruche3)
     
     ruches = [ruche0, ruche1, ruche2, ruche3]
+    if plateau.zobrist is not None:
+        for ruche in ruches:
+            plateau.cle ^= cle_ruche(ruche)
     return ruches
 
 def creer_fleurs(NFLEURS):
@@ -121,24 +180,19 @@ def creer_fleurs(NFLEURS):
         NFLEURS (int): Nombre de fleurs à créer (par défaut 4)
     
     Returns:
-        list: Liste de dictionnaires représentant les fleurs
-              Chaque fleur : {"type": "fleur", "id": "fleurX", 
-                             "nectar": 0, "position": None}
+        list: Liste de fleurs (objets Fleur)
+              Chaque fleur : type "fleur", id "fleurX", 
+                             nectar 0, position None
     
     Note:
         Le nectar sera attribué aléatoirement lors du placement
     """
     fleurs = []
     for i in range(NFLEURS):
-        fleurs.append({
-            "type": "fleur",
-            "id": f"fleur{i}",
-            "nectar": 0,
-            "position": None
-        })
+        fleurs.append(Fleur(f"fleur{i}"))
     return fleurs
 
-def placer_fleurs(plateau, fleurs):
+def placer_fleurs(plateau, fleurs, rng=random):
     """
     Place les fleurs symétriquement sur le plateau et leur attribue du nectar.
     
@@ -149,6 +203,8 @@ def placer_fleurs(plateau, fleurs):
     Args:
         plateau (list): Plateau de jeu 16x16
         fleurs (list): Fleurs créées par creer_fleurs()
+        rng (random.Random): Générateur de la partie (par défaut le module
+                             random, partagé par tout le programme)
     
     Algorithme:
         1. Pour chaque fleur, tirer (x, y) aléatoire dans le quart supérieur-gauche
@@ -170,8 +226,8 @@ def placer_fleurs(plateau, fleurs):
     for fleur in fleurs: #Pour chaque fleur
         position_valide = False
         while position_valide == False:
-            x = random.randint(0, N//2) #on divise N par 2 pour ne prendre en compte que 1/4 du terrain (symétrie)
-            y = random.randint(0, N//2)
+            x = rng.randint(0, N//2) #on divise N par 2 pour ne prendre en compte que 1/4 du terrain (symétrie)
+            y = rng.randint(0, N//2)
             if x < zone_protegee and y < zone_protegee: #si l'aléatoire est DANS la zone protegees (ce qu'on ne veut pas)
                 continue #recommencer le while jusqu'à position valide 
             positions = [ #pour créer la symétrie
@@ -184,7 +240,7 @@ def placer_fleurs(plateau, fleurs):
             toutes_libres = True
             for px, py in positions: #symétrie 
                 for element in plateau[px][py]:
-                    if element.get("type") == "fleur": #si la case est déjà occupé par une fleur
+                    if element.type == "fleur": #si la case est déjà occupé par une fleur
                         toutes_libres = False
                         break
                 if toutes_libres == False:
@@ -193,19 +249,104 @@ def placer_fleurs(plateau, fleurs):
                 continue
             else:
                 position_valide = True
-                nectar = random.randint(1,MAX_NECTAR)
-                #mettre à jour la fleur(dict) de base 
-                fleur["nectar"] = nectar
-                fleur["position"] = (x,y)
+                nectar = rng.randint(1,MAX_NECTAR)
+                #mettre à jour la fleur de base 
+                fleur.nectar = nectar
+                fleur.position = (x,y)
                 #Créer les 3 symétriques
-                fleur2 = {"type": "fleur", "id": fleur["id"], "nectar": nectar, "position": (N-1-x, y)}
-                fleur3 = {"type": "fleur", "id": fleur["id"], "nectar": nectar, "position": (x, N-1-y)}
-                fleur4 = {"type": "fleur", "id": fleur["id"], "nectar": nectar, "position": (N-1-x, N-1-y)}
+                fleur2 = Fleur(fleur.id, nectar, (N-1-x, y))
+                fleur3 = Fleur(fleur.id, nectar, (x, N-1-y))
+                fleur4 = Fleur(fleur.id, nectar, (N-1-x, N-1-y))
                 #Placer les 4 fleurs
                 plateau[x][y].append(fleur)
                 plateau[N-1-x][y].append(fleur2)
                 plateau[x][N-1-y].append(fleur3)
                 plateau[N-1-x][N-1-y].append(fleur4)
+                if plateau.zobrist is not None:
+                    for fleur_placee in (fleur, fleur2, fleur3, fleur4):
+                        plateau.cle ^= cle_fleur(plateau.zobrist, fleur_placee)
+    #Les fleurs ne bougeront plus : on calcule une fois les fleurs accessibles de chaque case
+    indexer_fleurs(plateau)
+    plateau.nectar_fleurs = calculer_nectar_total_initial(plateau)
+
+def indexer_fleurs(plateau, fleurs=None):
+    """
+    Construit les tables de fleurs accessibles de chaque case du plateau.
+    
+    Pour chaque case (x, y), plateau.fleurs_voisines[x][y] reçoit la liste des
+    fleurs des 9 cases autour (diagonales et case elle-même comprises), et
+    plateau.nb_fleurs_nectar[x][y] le nombre de ces fleurs qui ont du nectar.
+    
+    Args:
+        plateau (Plateau): Plateau avec ses fleurs placées
+        fleurs (list): Fleurs du plateau dans l'ordre des cases (ligne par
+                       ligne), si on les connaît déjà (None = parcours du plateau)
+    
+    Note:
+        Appelée par placer_fleurs(). L'ordre des fleurs est celui du parcours
+        ligne par ligne des 9 cases (la première fleur est celle butinée) :
+        chaque fleur, prise dans l'ordre des cases, est ajoutée aux 9 cases
+        qui la voient
+    """
+    N = len(plateau)
+    if fleurs is None:
+        fleurs = []
+        for x in range(N):
+            for y in range(N):
+                for element in plateau[x][y]:
+                    if element.type == "fleur":
+                        fleurs.append(element)
+    
+    fleurs_voisines = [[[] for _ in range(N)] for _ in range(N)]
+    nb_fleurs_nectar = [[0] * N for _ in range(N)]
+    for fleur in fleurs:
+        x, y = fleur.position
+        for nx in range(max(x - 1, 0), min(x + 2, N)):
+            for ny in range(max(y - 1, 0), min(y + 2, N)):
+                fleurs_voisines[nx][ny].append(fleur)
+                if fleur.nectar > 0:
+                    nb_fleurs_nectar[nx][ny] += 1
+    plateau.fleurs_voisines = fleurs_voisines
+    plateau.nb_fleurs_nectar = nb_fleurs_nectar
+
+def retirer_fleur_videe(plateau, fleur):
+    """
+    Met à jour les tables quand une fleur vient d'être vidée.
+    
+    Décrémente nb_fleurs_nectar des 9 cases qui voient la fleur.
+    
+    Args:
+        plateau (Plateau): Plateau de jeu
+        fleur (Fleur): Fleur dont le nectar vient de passer à 0
+    """
+    N = len(plateau)
+    x, y = fleur.position
+    for dx in [-1, 0, 1]:
+        for dy in [-1, 0, 1]:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < N and 0 <= ny < N:
+                plateau.nb_fleurs_nectar[nx][ny] -= 1
+
+def remettre_fleur_videe(plateau, fleur):
+    """
+    Annule retirer_fleur_videe() quand une fleur vidée retrouve du nectar.
+    
+    Incrémente nb_fleurs_nectar des 9 cases qui voient la fleur.
+    
+    Args:
+        plateau (Plateau): Plateau de jeu
+        fleur (Fleur): Fleur dont le nectar vient de repasser au-dessus de 0
+    
+    Note:
+        Utilisé pour annuler un butinage (coups.py)
+    """
+    N = len(plateau)
+    x, y = fleur.position
+    for dx in [-1, 0, 1]:
+        for dy in [-1, 0, 1]:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < N and 0 <= ny < N:
+                plateau.nb_fleurs_nectar[nx][ny] += 1
 
 def creer_abeille(type_abeille, position, camp):
     """
@@ -214,38 +355,28 @@ def creer_abeille(type_abeille, position, camp):
     Args:
         type_abeille (str): "ouvriere", "eclaireuse" ou "bourdon"
         position (tuple): Position (x, y) sur le plateau
-        camp (str): ID de la ruche propriétaire ("ruche0", "ruche1", etc.)
+        camp (str ou int): ID de la ruche propriétaire ("ruche0", "ruche1", etc.)
+                           ou directement le numéro du joueur (0-3)
     
     Returns:
-        dict: Dictionnaire représentant l'abeille avec ses attributs :
+        Abeille: Objet représentant l'abeille avec ses attributs :
               - type : "abeille"
               - role : type d'abeille (ouvriere/eclaireuse/bourdon)
-              - camp : ruche propriétaire
+              - joueur : numéro de la ruche propriétaire (camp = "ruche{joueur}")
               - position : (x, y)
               - direction : "droite" (par défaut)
               - nectar : 0 (l'abeille ne transporte rien au départ)
               - etat : "OK" (active) ou "KO" (assommée)
               - a_bouge : False (peut bouger ce tour)
               - tours_ko_restants : 0
+              - destination_automatique : None (pas de prémove)
     
     Caractéristiques par type:
         - Ouvrière : capacité 12 nectar, force 1, 4 directions
         - Éclaireuse : capacité 3 nectar, force 1, 8 directions (diagonales)
         - Bourdon : capacité 1 nectar, force 5, 4 directions
     """
-    abeille = {
-        "type": "abeille",
-        "role": type_abeille,
-        "camp": camp,
-        "position": position,
-        "direction": "droite",
-        "nectar": 0,
-        "etat": "OK",
-        "a_bouge": False,
-        "tours_ko_restants": 0
-
-    }
-    return abeille
+    return Abeille(type_abeille, position, numero_camp(camp))
 
 def placer_abeille(plateau,abeille):
     """
@@ -253,13 +384,17 @@ def placer_abeille(plateau,abeille):
     
     Args:
         plateau (list): Plateau de jeu
-        abeille (dict): Abeille créée par creer_abeille()
+        abeille (Abeille): Abeille créée par creer_abeille()
     
     Note:
-        L'abeille est ajoutée à la liste des éléments de sa case
+        L'abeille est ajoutée à la liste des éléments de sa case,
+        enregistrée dans l'index d'occupation et dans la clé du plateau
     """
-    x, y = abeille["position"]
+    x, y = abeille.position
     plateau[x][y].append(abeille)
+    plateau.occupation[x][y] = abeille
+    if plateau.zobrist is not None:
+        plateau.cle ^= cle_abeille(plateau.zobrist, abeille)
 
 def case_libre_abeille(plateau, x,y):
     """
@@ -274,12 +409,10 @@ def case_libre_abeille(plateau, x,y):
         bool: True si la case est libre (pas d'abeille), False sinon
     
     Note:
-        Les fleurs et ruches ne bloquent pas, seules les abeilles comptent
+        Les fleurs et ruches ne bloquent pas, seules les abeilles comptent.
+        Lecture directe de l'index d'occupation : pas de parcours de la case
     """
-    for element in plateau[x][y]: #parcours les éléments dans la case
-        if type(element) == dict and element.get("type") == "abeille": #si case == abeille
-            return False
-    return True
+    return plateau.occupation[x][y] is None
 
 def distance_valide(pos1, pos2, distance_max=1, diagonale_autorisee=True):
     """
@@ -318,13 +451,14 @@ def distance_valide(pos1, pos2, distance_max=1, diagonale_autorisee=True):
         # Distance de Manhattan (4 directions)
         return abs(x2 - x1) + abs(y2 - y1) <= distance_max
     
-def dans_zone_ruche(position, joueur):
+def dans_zone_ruche(position, joueur, taille=NCASES):
     """
     Vérifie si une position est dans la zone protégée d'une ruche (4x4).
     
     Args:
         position (tuple): Position à vérifier (x, y)
         joueur (int): Numéro du joueur (0, 1, 2 ou 3)
+        taille (int): Taille du plateau (NCASES par défaut)
     
     Returns:
         bool: True si la position est dans la zone de la ruche du joueur
@@ -334,23 +468,19 @@ def dans_zone_ruche(position, joueur):
         - Joueur 1 : x < 4 et y >= 12 (haut-droite)
         - Joueur 2 : x >= 12 et y < 4 (bas-gauche)
         - Joueur 3 : x >= 12 et y >= 12 (bas-droite)
+    
+    Note:
+        Les zones sont définies dans deplacements.py (proprietaire_zone)
     """
     x, y = position
-    if joueur == 0:
-        return x < 4 and y < 4
-    elif joueur == 1:
-        return x < 4 and y >= 12
-    elif joueur == 2:
-        return x >= 12 and y < 4
-    elif joueur == 3:
-        return x >= 12 and y >= 12
+    return proprietaire_zone(x, y, taille) == joueur
 
 def calculer_cases_disponibles(abeille, plateau):
     """
     Calcule toutes les cases où l'abeille peut se déplacer.
     
     Args:
-        abeille (dict): Abeille dont on veut connaître les déplacements possibles
+        abeille (Abeille): Abeille dont on veut connaître les déplacements possibles
         plateau (list): Plateau de jeu
     
     Returns:
@@ -363,42 +493,11 @@ def calculer_cases_disponibles(abeille, plateau):
     
     Note:
         Les éclaireuses ont 8 directions (avec diagonales),
-        les ouvrières et bourdons ont 4 directions (sans diagonales)
+        les ouvrières et bourdons ont 4 directions (sans diagonales).
+        Les vérifications 1 et 3 sont précalculées (plateau.tables),
+        il ne reste qu'à tester l'occupation des cases voisines
     """
-    x_actuel, y_actuel = abeille["position"]
-    cases_disponibles = []
-    
-    # Directions possibles
-    if abeille["role"] == "eclaireuse":
-        directions = [(-1,-1), (-1,0), (-1,1), (0,-1), (0,1), (1,-1), (1,0), (1,1)]
-    else:
-        directions = [(-1,0), (1,0), (0,-1), (0,1)]
-    
-    joueur_id = int(abeille["camp"][-1]) # ex: "ruche0" -> 0
-    
-    for dx, dy in directions:
-        x_new = x_actuel + dx
-        y_new = y_actuel + dy
-        
-        # 1. Vérifier limites plateau
-        if 0 <= x_new < NCASES and 0 <= y_new < NCASES:
-            
-            # 2. Vérifier case libre 
-            if not case_libre_abeille(plateau, x_new, y_new):
-                continue
-            
-            # 3. Vérifier zones ennemies 
-            zone_ennemie = False
-            for i in range(4):
-                if i != joueur_id:
-                    if dans_zone_ruche((x_new, y_new), i):
-                        zone_ennemie = True
-                        break
-            
-            if not zone_ennemie:
-                cases_disponibles.append((x_new, y_new))
-    
-    return cases_disponibles
+    return cases_libres(plateau, abeille)
 
 # PHASE DE PONTE 
 
@@ -411,7 +510,7 @@ def tenter_ponte(plateau, ruche, type_abeille, position):
     
     Args:
         plateau (list): Plateau de jeu
-        ruche (dict): Ruche qui veut pondre
+        ruche (Ruche): Ruche qui veut pondre
         type_abeille (str): "ouvriere", "eclaireuse" ou "bourdon"
         position (tuple): Position de ponte (normalement la ruche)
     
@@ -426,16 +525,20 @@ def tenter_ponte(plateau, ruche, type_abeille, position):
         - "Case occupée !" si une abeille est déjà sur la case
     """
     #Vérifier si on a assez de nectar
-    if ruche["nectar"] < COUT_PONTE:
-        return None, f"Pas assez de nectar ! ({ruche["nectar"]}/{COUT_PONTE})"
+    if ruche.nectar < COUT_PONTE:
+        return None, f"Pas assez de nectar ! ({ruche.nectar}/{COUT_PONTE})"
     x,y = position
     #vérifier si la case est libre
     if case_libre_abeille(plateau, x,y) == False:
         return None, "Case occupée !"
     #sinon, créer l'abeille et la placer
-    ruche["nectar"] -= COUT_PONTE
-    abeille = creer_abeille(type_abeille, position, ruche["id"])
-    ruche["abeilles"].append(abeille)
+    if plateau.zobrist is not None:
+        plateau.cle ^= cle_ruche(ruche)
+    ruche.nectar -= COUT_PONTE
+    if plateau.zobrist is not None:
+        plateau.cle ^= cle_ruche(ruche)
+    abeille = creer_abeille(type_abeille, position, ruche.id)
+    ruche.abeilles.append(abeille)
     placer_abeille(plateau, abeille)
     
     return abeille, None
@@ -450,7 +553,7 @@ def tenter_deplacement(plateau, abeille, nouvelle_position, ruches):
     
     Args:
         plateau (list): Plateau de jeu
-        abeille (dict): Abeille à déplacer
+        abeille (Abeille): Abeille à déplacer
         nouvelle_position (tuple): Position de destination (x, y)
         ruches (list): Liste des 4 ruches (pour déposer le nectar)
     
@@ -473,37 +576,87 @@ def tenter_deplacement(plateau, abeille, nouvelle_position, ruches):
         - "Mhh.. y'a déjà quelqu'un sur la case"
         - "T'es un espion ? On est chez l'ennemi !"
     """
-    x_old, y_old = abeille["position"]
+    x_old, y_old = abeille.position
     x_new, y_new = nouvelle_position
 
-    # L'éclaireuse peut aller en diagonale, les autres non
-    diagonale_ok = (abeille["role"] == "eclaireuse")
-
-    # Vérifier distance
-    if not distance_valide((x_old, y_old), (x_new, y_new), distance_max=1, diagonale_autorisee=diagonale_ok):
+    # Vérifier distance (diagonale pour l'éclaireuse), case libre et zones ennemies
+    refus = verifier_deplacement(plateau, abeille, nouvelle_position)
+    if refus == "distance":
         return False, "Oula tu vas où là ? C'est trop loin !"
-
-    # Vérifier case libre
-    if not case_libre_abeille(plateau, x_new, y_new):
+    if refus == "occupee":
         return False, "Mhh.. y'a déjà quelqu'un sur la case"
-
-    # Vérifier zones ennemies et dépôt nectar dans sa ruche
-    joueur = int(abeille["camp"][-1])
-    for i in range(4):
-        if i != joueur and dans_zone_ruche(nouvelle_position, i):
-            return False, "T'es un espion ? On est chez l'ennemie !"
+    if refus == "zone_ennemie":
+        return False, "T'es un espion ? On est chez l'ennemie !"
 
     # Déplacer l'abeille
+    cles = plateau.zobrist
+    if cles is not None:
+        plateau.cle ^= cle_abeille(cles, abeille)
     plateau[x_old][y_old].remove(abeille)
-    abeille["position"] = (x_new, y_new)
-    abeille["a_bouge"] = True
+    plateau.occupation[x_old][y_old] = None
+    abeille.position = (x_new, y_new)
+    abeille.a_bouge = True
     plateau[x_new][y_new].append(abeille)
-    if dans_zone_ruche(nouvelle_position, joueur):
-        deposer_nectar(abeille, ruches[joueur])
+    plateau.occupation[x_new][y_new] = abeille
+    if cles is not None:
+        plateau.cle ^= cle_abeille(cles, abeille)
+    joueur = abeille.joueur
+    if plateau.tables.zones[x_new][y_new] == joueur:
+        deposer_nectar(abeille, ruches[joueur], plateau)
 
     return True, None
 
 
+#=== DEPLACEMENTS AUTOMATIQUES (prémove) ===
+
+def executer_deplacements_automatiques(ruche, plateau, ruches):
+    """
+    Exécute un pas de déplacement pour toutes les abeilles programmées.
+    
+    Les abeilles de la ruche qui ont une destination programmée (attribut
+    destination_automatique) sont planifiées ensemble sur quelques tours
+    (planifier_deplacements, voir chemins.py) : elles ne visent jamais la
+    même case et celles qui vont au même endroit se suivent au lieu de se
+    bloquer. Chacune avance ensuite d'une case vers sa destination.
+    
+    Args:
+        ruche (Ruche): Ruche dont on déplace les abeilles
+        plateau (list): Plateau de jeu
+        ruches (list): Liste des 4 ruches
+    
+    Returns:
+        bool: True si au moins une abeille a bougé, False sinon
+    
+    Note:
+        Remet destination_automatique à None quand l'abeille arrive
+    """
+    abeilles_bougees = False
+    programmees = []
+    for abeille in ruche.abeilles:
+        if abeille.etat != "OK" or abeille.a_bouge or abeille.destination_automatique is None:
+            continue
+        if abeille.position == abeille.destination_automatique:
+            abeille.destination_automatique = None # déjà arrivée
+        else:
+            programmees.append(abeille)
+    
+    for abeille, prochaine_case in planifier_deplacements(plateau, programmees):
+        x_actuel, y_actuel = abeille.position
+        x_new, y_new = prochaine_case
+        
+        if y_new > y_actuel:
+            abeille.direction = "droite"
+        elif y_new < y_actuel:
+            abeille.direction = "gauche"
+        
+        succes, _ = tenter_deplacement(plateau, abeille, prochaine_case, ruches)
+        
+        if succes:
+            abeilles_bougees = True
+            if prochaine_case == abeille.destination_automatique:
+                abeille.destination_automatique = None
+    
+    return abeilles_bougees
 
 #====== BUTINAGE ======
 def fleurs_accessibles(plateau, x,y):
@@ -514,25 +667,33 @@ def fleurs_accessibles(plateau, x,y):
     (diagonales comprises) de la position (x, y).
     
     Args:
-        plateau (list): Plateau de jeu
+        plateau (Plateau): Plateau de jeu
         x (int): Ligne de la position
         y (int): Colonne de la position
     
     Returns:
-        list: Liste des fleurs accessibles (dictionnaires)
+        list: Liste des fleurs accessibles (objets Fleur)
     
     Note:
-        Même les fleurs vides (nectar = 0) sont retournées
-    """
-    fleurs = [] #va contenir TOUS les fleurs accessibles
-    for dx in [-1, 0, 1]: #axe verticale
-        for dy in [-1, 0, 1]: #axe horizontale, 8 DIRECTIONS 
-            nx, ny = x + dx, y + dy #on ajoute x et y pour avoir les positions réelles de la case
-            if 0 <= nx < NCASES and 0 <= ny < NCASES: #limiter les sorties de plateau
-                for element in plateau[nx][ny]: #si il y a une fleur
-                    if element["type"] == "fleur":
-                        fleurs.append(element)
-    return fleurs
+        Même les fleurs vides (nectar = 0) sont retournées.
+        Simple lecture de la table construite par indexer_fleurs() :
+        la liste est partagée, il ne faut pas la modifier
+    """
+    return plateau.fleurs_voisines[x][y]
+
+def fleur_avec_nectar_accessible(plateau, x, y):
+    """
+    Vérifie qu'au moins une fleur accessible depuis (x, y) a encore du nectar.
+    
+    Args:
+        plateau (Plateau): Plateau de jeu
+        x (int): Ligne de la position
+        y (int): Colonne de la position
+    
+    Returns:
+        bool: True si une fleur accessible a du nectar, False sinon
+    """
+    return plateau.nb_fleurs_nectar[x][y] > 0
 
 def gain_nectar(fleur):
     """
@@ -544,7 +705,7 @@ def gain_nectar(fleur):
     - Fleur presque vide (<= 1/3) : 1 point
     
     Args:
-        fleur (dict): Fleur à butiner
+        fleur (Fleur): Fleur à butiner
     
     Returns:
         int: Nombre de points de nectar récoltés (1, 2 ou 3)
@@ -554,13 +715,13 @@ def gain_nectar(fleur):
         - 16-29 nectar : gain de 2
         - 1-15 nectar : gain de 1
     """
-    if fleur["nectar"] >= (2*MAX_NECTAR) / 3: #si la fleur a plus de 2/3 de max_nectar
+    if fleur.nectar >= (2*MAX_NECTAR) / 3: #si la fleur a plus de 2/3 de max_nectar
         return 3
-    elif fleur["nectar"] > MAX_NECTAR / 3: #si la fleur a plus de 1/3 de max_nectar
+    elif fleur.nectar > MAX_NECTAR / 3: #si la fleur a plus de 1/3 de max_nectar
         return 2
     return 1 #si la fleur a moins de 1/3 de max_nectar
 
-def butiner(abeille, fleur):
+def butiner(abeille, fleur, plateau=None):
     """
     Fait butiner une abeille sur une fleur.
     
@@ -568,8 +729,10 @@ def butiner(abeille, fleur):
     dépasser sa capacité maximale. Le surplus est perdu (vandalisme).
     
     Args:
-        abeille (dict): Abeille qui butine
-        fleur (dict): Fleur à butiner
+        abeille (Abeille): Abeille qui butine
+        fleur (Fleur): Fleur à butiner
+        plateau (Plateau): Plateau de jeu, pour mettre à jour les tables
+                           de fleurs, les totaux de nectar et la clé (optionnel)
     
     Returns:
         int: Quantité de nectar effectivement prise par l'abeille
@@ -587,21 +750,32 @@ def butiner(abeille, fleur):
         - Ouvrière : 12
     """
     #Savoir la capacité max selon le rôle
-    max_cap = CAPACITE_NECTAR[abeille["role"]] #un chiffre
+    max_cap = CAPACITE_NECTAR[abeille.role] #un chiffre
     #Gain potentiel de la fleur
     gain = gain_nectar(fleur)
     #place restante dans l'abeille
-    place_restante = max_cap - abeille["nectar"]
+    place_restante = max_cap - abeille.nectar
     #quantité réellement stockée
     pris = min(gain, place_restante) 
+    cles = plateau.zobrist if plateau is not None else None
+    if cles is not None:
+        plateau.cle ^= cle_abeille(cles, abeille) ^ cle_fleur(cles, fleur)
     #mise à jour
-    abeille["nectar"] += pris
-    fleur["nectar"] -= gain #VANDALISME
-    if fleur["nectar"] < 0: #limiter le negatif
-        fleur["nectar"] = 0 
+    abeille.nectar += pris
+    nectar_avant = fleur.nectar
+    fleur.nectar -= gain #VANDALISME
+    if fleur.nectar < 0: #limiter le negatif
+        fleur.nectar = 0 
+    if cles is not None:
+        plateau.cle ^= cle_abeille(cles, abeille) ^ cle_fleur(cles, fleur)
+    if plateau is not None:
+        plateau.nectar_fleurs -= nectar_avant - fleur.nectar
+        plateau.nectar_abeilles += pris
+        if nectar_avant > 0 and fleur.nectar == 0: #fleur vidée
+            retirer_fleur_videe(plateau, fleur)
     return pris #retourne ce qui a été ajouté à l'abeille pour l'afficher
 
-def deposer_nectar(abeille, ruche):
+def deposer_nectar(abeille, ruche, plateau=None):
     """
     Dépose le nectar d'une abeille dans sa ruche si elle y est.
     
@@ -609,22 +783,32 @@ def deposer_nectar(abeille, ruche):
     est transféré dans le stock de la ruche.
     
     Args:
-        abeille (dict): Abeille qui veut déposer
-        ruche (dict): Ruche de l'abeille
+        abeille (Abeille): Abeille qui veut déposer
+        ruche (Ruche): Ruche de l'abeille
+        plateau (Plateau): Plateau de jeu, pour mettre à jour le total
+                           de nectar transporté et la clé (optionnel)
     
     Effet:
-        - Ajoute abeille["nectar"] au stock de la ruche
-        - Remet abeille["nectar"] à 0
+        - Ajoute abeille.nectar au stock de la ruche
+        - Remet abeille.nectar à 0
     
     Note:
         Cette fonction est appelée automatiquement lors d'un déplacement
         dans la zone de ruche et à la fin de la phase de butinage
     """
-    x,y = abeille["position"]
-    joueur = int(ruche["id"][-1]) #prend le dernier caractère du dictionnaire ruche{i}
-    if dans_zone_ruche((x,y), joueur) == True:
-        ruche["nectar"] += abeille["nectar"]
-        abeille["nectar"] = 0 
+    x,y = abeille.position
+    joueur = ruche.joueur
+    taille = len(plateau) if plateau is not None else NCASES
+    if dans_zone_ruche((x,y), joueur, taille) == True and abeille.nectar > 0:
+        cles = plateau.zobrist if plateau is not None else None
+        if cles is not None:
+            plateau.cle ^= cle_abeille(cles, abeille) ^ cle_ruche(ruche)
+        if plateau is not None:
+            plateau.nectar_abeilles -= abeille.nectar
+        ruche.nectar += abeille.nectar
+        abeille.nectar = 0 
+        if cles is not None:
+            plateau.cle ^= cle_abeille(cles, abeille) ^ cle_ruche(ruche)
 
 def tenter_butinage(plateau, abeille, ruche):
     """
@@ -635,8 +819,8 @@ def tenter_butinage(plateau, abeille, ruche):
     
     Args:
         plateau (list): Plateau de jeu
-        abeille (dict): Abeille qui veut butiner
-        ruche (dict): Ruche de l'abeille (pour déposer le nectar)
+        abeille (Abeille): Abeille qui veut butiner
+        ruche (Ruche): Ruche de l'abeille (pour déposer le nectar)
     
     Returns:
         tuple: (True, nectar_pris) si succès, (False, message_erreur) sinon
@@ -654,17 +838,19 @@ def tenter_butinage(plateau, abeille, ruche):
         - "Cette abeille a bougé !"
         - "D'où voyez vous une fleur la ? Perso, j'en vois pas."
     """
-    if abeille["a_bouge"] == True:
+    if abeille.a_bouge == True:
         return False, "Cette abeille a bougé !"
-    x,y = abeille["position"]
+    x,y = abeille.position
     fleurs = fleurs_accessibles(plateau, x, y)
 
     if fleurs == []:
         return False, "D'où voyez vous une fleur la ? Perso, j'en vois pas."
-    pris = butiner(abeille, fleurs[0])
-    deposer_nectar(abeille, ruche)
+    pris = butiner(abeille, fleurs[0], plateau)
+    deposer_nectar(abeille, ruche, plateau)
 
-    abeille["a_bouge"] = True
+    abeille.a_bouge = True
+    if plateau.zobrist is not None:
+        plateau.cle ^= plateau.zobrist.a_bouge[x][y]
     
     return True, pris
 
@@ -679,28 +865,25 @@ def trouver_opposantes(plateau, abeille):
     
     Args:
         plateau (list): Plateau de jeu
-        abeille (dict): Abeille dont on cherche les opposantes
+        abeille (Abeille): Abeille dont on cherche les opposantes
     
     Returns:
         list: Liste des abeilles ennemies adjacentes (max 8)
     
     Note:
-        Les abeilles KO ne comptent pas comme opposantes
+        Les abeilles KO ne comptent pas comme opposantes.
+        Les 8 cases autour viennent de plateau.tables.adjacentes et l'abeille
+        de chaque case de l'index d'occupation (une abeille max par case)
     """
     opposantes = [] #stock tous les ennemies
-    x, y = abeille["position"]
+    x, y = abeille.position
+    joueur = abeille.joueur
+    occupation = plateau.occupation
 
-    for dx in [-1, 0, 1]:
-        for dy in [-1, 0, 1]: #les 8 directions
-            if dx == 0 and dy == 0:#car c'est elle même 
-                continue
-            nx, ny = x + dx, y + dy #vrai position
-            if 0 <= nx < NCASES and 0 <= ny < NCASES:#limiter sorti plateau
-                for element in plateau[nx][ny]: #tous les élements de la cases
-                    if (element["type"] == "abeille" and
-                        element["camp"] != abeille["camp"] and
-                        element["etat"] == "OK"): 
-                        opposantes.append(element)
+    for nx, ny in plateau.tables.adjacentes[x][y]: #les 8 directions, dans le plateau
+        voisine = occupation[nx][ny]
+        if voisine is not None and voisine.joueur != joueur and voisine.etat == "OK":
+            opposantes.append(voisine)
     return opposantes
 
 def calculer_force_effective(abeille, opposantes):
@@ -711,7 +894,7 @@ def calculer_force_effective(abeille, opposantes):
     d'opposantes, car elle divise son attaque entre toutes.
     
     Args:
-        abeille (dict): Abeille en escarmouche
+        abeille (Abeille): Abeille en escarmouche
         opposantes (list): Liste des abeilles opposantes
     
     Returns:
@@ -725,14 +908,14 @@ def calculer_force_effective(abeille, opposantes):
         - Ouvrière (force 1) contre 1 ennemie : FE = 1/1 = 1
         - Éclaireuse (force 1) sans ennemie : FE = 1 (force complète)
     """
-    force = FORCE[abeille["role"]]
+    force = FORCE[abeille.role]
     nb_opposantes = len(opposantes)
 
     if nb_opposantes == 0: #pas d'ennemie
         return force #force complète
     return force/nb_opposantes #division pour calculer FE
 
-def calculer_proba_esquive(abeille, opposantes, plateau):
+def calculer_proba_esquive(abeille, opposantes, plateau, forces=None):
     """
     Calcule la probabilité qu'une abeille esquive les attaques ennemies.
     
@@ -740,9 +923,13 @@ def calculer_proba_esquive(abeille, opposantes, plateau):
     des forces effectives de ses opposantes.
     
     Args:
-        abeille (dict): Abeille qui tente d'esquiver
+        abeille (Abeille): Abeille qui tente d'esquiver
         opposantes (list): Liste des abeilles qui l'attaquent
         plateau (list): Plateau de jeu (pour calculer les FE ennemies)
+        forces (dict): Forces effectives déjà calculées {abeille: FE},
+                       complété au fur et à mesure (optionnel). Permet de
+                       ne calculer qu'une fois la FE de chaque abeille
+                       pendant une escarmouche
     
     Returns:
         float: Probabilité d'esquive entre 0.0 et 1.0
@@ -758,12 +945,18 @@ def calculer_proba_esquive(abeille, opposantes, plateau):
     Note:
         Si force totale = 0 (cas impossible), retourne 1.0 par sécurité
     """
-    force = FORCE[abeille["role"]]
+    force = FORCE[abeille.role]
     #calcul la somme des FE des OPPOSANTES 
     somme_fe_ennemies = 0
     for opposante in opposantes:#Pour chaque opposante, trouver ses opposantes pour calculer sa FE
-        opposantes_de_opposante = trouver_opposantes(plateau, opposante)
-        fe = calculer_force_effective(opposante, opposantes_de_opposante)
+        fe = None
+        if forces is not None:
+            fe = forces.get(opposante)
+        if fe is None:
+            opposantes_de_opposante = trouver_opposantes(plateau, opposante)
+            fe = calculer_force_effective(opposante, opposantes_de_opposante)
+            if forces is not None:
+                forces[opposante] = fe
         somme_fe_ennemies += fe
     #calcul de la probabilité d'esquive
     if force + somme_fe_ennemies == 0:
@@ -771,7 +964,7 @@ def calculer_proba_esquive(abeille, opposantes, plateau):
     
     return force / (force + somme_fe_ennemies)
 
-def phase_escarmouche(plateau, ruche):
+def phase_escarmouche(plateau, ruche, rng=random, tirages=None):
     """
     Gère la phase d'escarmouche pour toutes les abeilles d'une ruche.
     
@@ -782,7 +975,12 @@ def phase_escarmouche(plateau, ruche):
     
     Args:
         plateau (list): Plateau de jeu
-        ruche (dict): Ruche dont les abeilles sont en escarmouche
+        ruche (Ruche): Ruche dont les abeilles sont en escarmouche
+        rng (random.Random): Générateur de la partie pour les tirages
+                             (par défaut le module random)
+        tirages (list): Si donnée, reçoit un tuple (abeille, proba, tirage,
+                        esquive_reussie) par abeille en escarmouche
+                        (journal des événements du moteur)
     
     Algorithme:
         1. Pour chaque abeille OK avec des opposantes :
@@ -791,17 +989,22 @@ def phase_escarmouche(plateau, ruche):
            - Stocker le résultat (réussi/raté)
         
         2. Appliquer TOUS les résultats simultanément :
-           - Les abeilles qui ont raté perdent leur nectar
+           - Les abeilles qui ont raté perdent leur nectar (retiré du
+             total plateau.nectar_abeilles)
            - Elles deviennent KO pour TIME_KO tours (5)
     
     Note:
         Les résultats sont appliqués simultanément pour éviter qu'une
-        abeille KO dans la phase affecte les calculs des autres
+        abeille KO dans la phase affecte les calculs des autres.
+        Le plateau ne change donc pas pendant les calculs : la force
+        effective de chaque opposante est calculée une seule fois et
+        partagée entre toutes les abeilles de la ruche
     """
     resultats = [] #list des resultats de chaque abeille
+    forces = {} #FE des opposantes déjà calculées pendant cette escarmouche
     
-    for abeille in ruche["abeilles"]:
-        if abeille["etat"] != "OK": #si l'abeille est mort
+    for abeille in ruche.abeilles:
+        if abeille.etat != "OK": #si l'abeille est mort
             continue
 
         opposantes = trouver_opposantes(plateau, abeille) #stocker les ennemies
@@ -810,10 +1013,12 @@ def phase_escarmouche(plateau, ruche):
             continue #pas d'escarmouche
 
         #calcul proba d'esquive
-        proba = calculer_proba_esquive(abeille, opposantes, plateau)
+        proba = calculer_proba_esquive(abeille, opposantes, plateau, forces)
         #tirage
-        tirage = random.random()#nombre entre 0 et 1
+        tirage = rng.random()#nombre entre 0 et 1
         esquive_reussie = tirage < proba #bool
+        if tirages is not None:
+            tirages.append((abeille, proba, tirage, esquive_reussie))
 
         resultat = {
             "abeille": abeille,
@@ -822,15 +1027,97 @@ def phase_escarmouche(plateau, ruche):
         resultats.append(resultat)
     
     #application des conséquences
+    cles = plateau.zobrist
     for resultat in resultats:
         abeille = resultat["abeille"]
         esquive_reussie = resultat["esquive"]
         if esquive_reussie == False: #esquive raté
-            abeille["nectar"] = 0
-            abeille["etat"] = "KO"
-            abeille["tours_ko_restants"] = TIME_KO
+            if cles is not None:
+                plateau.cle ^= cle_abeille(cles, abeille)
+            plateau.nectar_abeilles -= abeille.nectar
+            abeille.nectar = 0
+            abeille.etat = "KO"
+            abeille.tours_ko_restants = TIME_KO
+            if cles is not None:
+                plateau.cle ^= cle_abeille(cles, abeille)
+
+#=== VERIFICATIONS (auto-skip) ===
+
+def verifier_auto_skip_mouvement(ruche):
+    """
+    Vérifie si toutes les abeilles de la ruche ont bougé.
+    
+    Permet de passer automatiquement à la phase suivante si plus
+    aucune abeille ne peut bouger.
+    
+    Args:
+        ruche (Ruche): Ruche à vérifier
+    
+    Returns:
+        bool: True si toutes les abeilles OK ont bougé, False sinon
+    """
+    for a in ruche.abeilles:
+        if a.etat == "OK" and not a.a_bouge:
+            return False
+    return True
+
+
+def verifier_auto_skip_butinage(ruche, plateau):
+    """
+    Vérifie si toutes les abeilles disponibles ont butiné.
+    
+    Permet de passer automatiquement à la phase suivante si plus
+    aucune abeille ne peut butiner (pas de fleur accessible).
+    
+    Args:
+        ruche (Ruche): Ruche à vérifier
+        plateau (list): Plateau de jeu
+    
+    Returns:
+        bool: True si toutes les abeilles OK ont butiné ou n'ont
+              pas de fleur accessible, False sinon
+    """
+    for abeille in ruche.abeilles:
+        if abeille.etat == "OK" and not abeille.a_bouge:
+            x, y = abeille.position
+            if fleurs_accessibles(plateau, x, y):
+                return False
+    return True
+
+
+def verifier_peut_ponte(ruche):
+    """
+    Vérifie si la ruche a assez de nectar pour pondre.
+    
+    Args:
+        ruche (Ruche): Ruche à vérifier
+    
+    Returns:
+        bool: True si nectar >= COUT_PONTE (5), False sinon
+    """
+    return ruche.nectar >= COUT_PONTE
+
+
+def verifier_a_abeille_active(ruche):
+    """
+    Vérifie si la ruche a au moins une abeille en état OK.
+    
+    Args:
+        ruche (Ruche): Ruche à vérifier
+    
+    Returns:
+        bool: True si au moins une abeille est active, False sinon
+    
+    Note:
+        Utilisé pour sauter la phase de mouvement si plus d'abeilles
+    """
+    for abeille in ruche.abeilles:
+        if abeille.etat == "OK":
+            return True
+    return False
+
 #TOUR
-def nouveau_tour(ruches):
+def nouveau_tour(ruches, plateau=None):
     """
     Réinitialise toutes les abeilles pour un nouveau tour.
     
@@ -841,17 +1128,28 @@ def nouveau_tour(ruches):
     
     Args:
         ruches (list): Liste des 4 ruches du jeu
+        plateau (Plateau): Plateau de jeu, pour mettre à jour la clé
+                           (optionnel)
     
     Note:
         Appelé au début du tour du joueur 0 (quand tous ont joué)
     """
+    cles = plateau.zobrist if plateau is not None else None
     for ruche in ruches:#chaque ruche
-        for abeille in ruche["abeilles"]:#chaque abeille des ruches
-            abeille["a_bouge"] = False #reset du a_bouge
-            if abeille["etat"] == "KO":
-                abeille["tours_ko_restants"] -= 1
-                if abeille["tours_ko_restants"] <= 0:
-                    abeille["etat"] = "OK"
+        for abeille in ruche.abeilles:#chaque abeille des ruches
+            if cles is not None:
+                if abeille.etat == "KO":
+                    cle_avant = cle_abeille(cles, abeille)
+                elif abeille.a_bouge: #seule la clé "a bougé" change
+                    x, y = abeille.position
+                    plateau.cle ^= cles.a_bouge[x][y]
+            abeille.a_bouge = False #reset du a_bouge
+            if abeille.etat == "KO":
+                abeille.tours_ko_restants -= 1
+                if abeille.tours_ko_restants <= 0:
+                    abeille.etat = "OK"
+                if cles is not None:
+                    plateau.cle ^= cle_avant ^ cle_abeille(cles, abeille)
 
 def determiner_gagnant(ruches):
     """
@@ -861,14 +1159,14 @@ def determiner_gagnant(ruches):
         ruches (list): Liste des 4 ruches
     
     Returns:
-        dict: Ruche gagnante (celle avec le plus de nectar)
+        Ruche: Ruche gagnante (celle avec le plus de nectar)
     
     Note:
         En cas d'égalité, c'est la première ruche trouvée qui gagne
     """
     gagnant = ruches[0] #on stock juste gagnant en tant que 1e ruche
     for ruche in ruches:
-        if ruche["nectar"] > gagnant["nectar"]:
+        if ruche.nectar > gagnant.nectar:
             gagnant = ruche #changement
     return gagnant
 
@@ -894,7 +1192,7 @@ def fin_de_partie(plateau, ruches, tour, nectar_total_initial):
         >>> fin_de_partie(plateau, ruches, 300, 180)
         (True, ruche_gagnante, "timeout")
         
-        >>> ruches[0]["nectar"] = 95  # Plus de la moitié de 180
+        >>> ruches[0].nectar = 95  # Plus de la moitié de 180
         >>> fin_de_partie(plateau, ruches, 50, 180)
         (True, ruches[0], "blitzkrieg")
     """
@@ -906,7 +1204,7 @@ def fin_de_partie(plateau, ruches, tour, nectar_total_initial):
     # Condition 2 : Victoire blitzkrieg (plus de la moitié du nectar total)
     seuil_blitz = nectar_total_initial / 2
     for ruche in ruches:
-        if ruche["nectar"] > seuil_blitz:
+        if ruche.nectar > seuil_blitz:
             return True, ruche, "blitzkrieg"
     
     # Condition 1 : Plus de nectar disponible
@@ -924,30 +1222,45 @@ def calculer_nectar_disponible(plateau, ruches):
     Le nectar dans les ruches NE COMPTE PAS (déjà récupéré).
     
     Args:
-        plateau (list): Plateau de jeu
+        plateau (Plateau): Plateau de jeu
         ruches (list): Liste des 4 ruches
     
     Returns:
         int: Somme du nectar sur les fleurs et sur les abeilles
     
     Note:
-        Utilisé pour vérifier la condition de fin "epuisement"
+        Utilisé pour vérifier la condition de fin "epuisement".
+        Lecture des totaux tenus à jour par le plateau (pas de parcours),
+        recompter_nectar() refait le calcul complet si besoin
     """
-    nectar_total = 0
+    return plateau.nectar_fleurs + plateau.nectar_abeilles
+
+def recompter_nectar(plateau, ruches):
+    """
+    Recalcule entièrement les totaux de nectar du plateau.
     
-    #nectar sur les fleurs
-    for x in range(NCASES):
-        for y in range(NCASES):
-            for elem in plateau[x][y]:
-                if isinstance(elem, dict) and elem.get("type") == "fleur":
-                    nectar_total += elem["nectar"]
+    Parcourt toutes les cases (fleurs) et toutes les abeilles des ruches,
+    puis remet à jour plateau.nectar_fleurs et plateau.nectar_abeilles.
     
-    #nectar sur les abeilles
+    Args:
+        plateau (Plateau): Plateau de jeu
+        ruches (list): Liste des 4 ruches
+    
+    Returns:
+        int: Nectar total encore en jeu (fleurs + abeilles)
+    
+    Note:
+        À appeler si le nectar a été modifié sans passer par les fonctions
+        du modèle (ex: plateau reconstruit à la main)
+    """
+    nectar_abeilles = 0
     for ruche in ruches:
-        for abeille in ruche["abeilles"]:
-            nectar_total += abeille["nectar"]
+        for abeille in ruche.abeilles:
+            nectar_abeilles += abeille.nectar
     
-    return nectar_total
+    plateau.nectar_fleurs = calculer_nectar_total_initial(plateau)
+    plateau.nectar_abeilles = nectar_abeilles
+    return plateau.nectar_fleurs + plateau.nectar_abeilles
 
 def calculer_nectar_total_initial(plateau):
     """
@@ -964,11 +1277,11 @@ def calculer_nectar_total_initial(plateau):
         Sert pour calculer la victoire "blitzkrieg" (> 50% du total)
     """
     nectar_total = 0
-    for x in range(NCASES):
-        for y in range(NCASES):
+    for x in range(len(plateau)):
+        for y in range(len(plateau)):
             for elem in plateau[x][y]:
-                if isinstance(elem, dict) and elem.get("type") == "fleur":
-                    nectar_total += elem["nectar"]
+                if elem.type == "fleur":
+                    nectar_total += elem.nectar
     return nectar_total
 
 assert NCASES % 2 == 0, "NCASES doit être divisible par 2"
@@ -0,0 +1,546 @@
+# moteur.py - Moteur de partie sans interface pour BZZZ
+"""
+Moteur de partie BZZZ indépendant de l'interface graphique.
+
+Ce fichier gère le déroulement d'une partie (tours, phases, joueur actuel,
+file de pontes) sans aucun code tkinter :
+- Les règles restent dans model.py, le moteur ne fait que les enchaîner
+- main.py s'appuie sur le moteur pour l'affichage et les clics
+- Les parties IA contre IA peuvent tourner sans fenêtre (évaluations en masse)
+
+Hasard:
+    Chaque partie a son propre générateur (moteur.rng, random.Random créé
+    depuis la graine de la partie) : placement des fleurs, choix aléatoires
+    des IA et esquives de l'escarmouche. Deux parties de même graine sont
+    identiques, même jouées en même temps dans un seul processus.
+
+Exemple:
+    >>> moteur = creer_moteur({"nb_joueurs": 4, "ia": [True, True, True, True]}, graine=42)
+    >>> gagnant, raison = moteur.jouer_jusqu_a_la_fin()
+
+Sauvegarde:
+    moteur.sauvegarder("partie.bzzz") écrit un instantané binaire compact
+    (sauvegarde.py), charger_moteur("partie.bzzz") reprend la partie.
+
+Mesures:
+    Les phases et les décisions des IA sont entourées de mesure(), le début
+    de chaque tour et la fin de la partie sont marqués (marquer(), voir
+    instrumentation.py) : rien n'est mesuré sans observateur actif.
+    Le premier tour est marqué par demarrer() (premier appel d'etape()), pas
+    à la création : une partie reprise est marquée à son tour réel.
+    Les actions de la partie (ponte, mouvement, butinage, esquive...) sont
+    signalées aux observateurs qui suivent les événements (evenements.py).
+"""
+import random
+from model import *
+from ia import creer_ia
+from instrumentation import compter, evenements_suivis, marquer, mesure, signaler
+
+PHASES = ["ponte", "mouvement", "butinage"]
+
+
+class MoteurBZZZ:
+    """
+    Classe représentant l'état complet d'une partie de BZZZ.
+
+    Le moteur possède le plateau, les ruches, le tour, la phase, le joueur
+    actuel et la file de pontes. Il expose les actions d'un joueur humain
+    (pondre, deplacer, faire_butiner, passer_phase) et fait jouer les IA.
+
+    Attributs:
+        plateau (list): Plateau de jeu
+        ruches (list): Liste des 4 ruches
+        nectar_total_initial (int): Nectar total au début (pour blitzkrieg)
+        tour (int): Numéro du tour en cours (commence à 1)
+        joueur_actuel (int): Joueur qui joue (0 à nb_joueurs-1)
+        phase (str): "ponte", "mouvement" ou "butinage"
+        nb_joueurs (int): Nombre de ruches actives dans la partie
+        ias (list): Pour chaque joueur, une IA ou None si joueur humain
+        type_ia (str): Type des IA créées depuis la config (voir creer_ia()),
+                       gardé dans les sauvegardes
+        file_pontes (list): Types d'abeilles à pondre automatiquement
+        fini (bool): True quand la partie est terminée
+        gagnant (Ruche ou None): Ruche gagnante en fin de partie
+        raison (str ou None): "timeout", "blitzkrieg" ou "epuisement"
+        demarre (bool): True une fois le début signalé (voir demarrer())
+        graine (int ou None): Graine de la partie
+        rng (random.Random): Générateur aléatoire de la partie
+    """
+
+    def __init__(self, config, ias=None, plateau=None, ruches=None, nectar_total_initial=None,
+                 graine=None, rng=None):
+        """
+        Crée une partie prête à jouer.
+
+        Args:
+            config (dict): Configuration {"nb_joueurs": int, "ia": [bool, bool, bool, bool]}
+                           et en option "type_ia" ("glouton", "affectation" ou "mcts",
+                           voir creer_ia())
+            ias (list): IA déjà créées pour chaque joueur (None = créées depuis config)
+            plateau (list): Plateau existant (None = nouveau plateau avec fleurs)
+            ruches (list): Ruches du plateau existant
+            nectar_total_initial (int): Nectar initial du plateau existant
+            graine (int): Graine de la partie (None = tirée au hasard)
+            rng (random.Random): Générateur déjà créé (remplace graine)
+
+        Note:
+            Si aucun plateau n'est fourni, le moteur crée le plateau, les ruches
+            et place les fleurs comme lancer_partie().
+            Les IA sans générateur (ia.rng None) reçoivent celui de la partie
+        """
+        if rng is None:
+            rng = random.Random(graine)
+        self.graine = graine
+        self.rng = rng
+
+        if plateau is None:
+            plateau = creer_plateau()
+            ruches = creer_ruche(plateau)
+            fleurs = creer_fleurs(NFLEURS)
+            placer_fleurs(plateau, fleurs, rng)
+        if nectar_total_initial is None:
+            nectar_total_initial = calculer_nectar_total_initial(plateau)
+
+        self.type_ia = config.get("type_ia", "glouton")
+        if ias is None:
+            ias = []
+            for i in range(4):
+                if config["ia"][i]:
+                    ias.append(creer_ia(rng, self.type_ia, config["nb_joueurs"]))
+                else:
+                    ias.append(None)
+        for ia in ias:
+            if ia is not None and getattr(ia, "rng", None) is None:
+                ia.rng = rng
+
+        self.plateau = plateau
+        self.ruches = ruches
+        self.nectar_total_initial = nectar_total_initial
+        self.nb_joueurs = config["nb_joueurs"]
+        self.ias = ias
+
+        self.tour = 1
+        self.joueur_actuel = 0
+        self.phase = "ponte"
+        self.file_pontes = []
+
+        self.fini = False
+        self.gagnant = None
+        self.raison = None
+        self.demarre = False
+
+    # ========== INFORMATIONS ==========
+
+    def ruche_actuelle(self):
+        """
+        Retourne la ruche du joueur qui joue.
+
+        Returns:
+            Ruche: Ruche du joueur actuel
+        """
+        return self.ruches[self.joueur_actuel]
+
+    def est_tour_ia(self):
+        """
+        Indique si le joueur actuel est contrôlé par une IA.
+
+        Returns:
+            bool: True si c'est le tour d'une IA
+        """
+        return self.ias[self.joueur_actuel] is not None
+
+    # ========== EVENEMENTS ==========
+
+    def demarrer(self):
+        """
+        Marque le tour actuel et signale le début de la partie (graine,
+        fleurs) aux observateurs actifs, une seule fois.
+
+        Appelé par etape() au premier pas. L'interface l'appelle elle-même
+        après avoir activé ses observateurs. Une partie reprise est donc
+        marquée à son tour et son joueur réels.
+        """
+        if self.demarre:
+            return
+        self.demarre = True
+        marquer("tour", {"tour": self.tour})
+        if not evenements_suivis():
+            return
+        fleurs = [[x, y, element.nectar] for x, ligne in enumerate(self.plateau) for y, case in enumerate(ligne)
+                  for element in case if element.type == "fleur"]
+        self._signaler("debut", graine=self.graine, nb_joueurs=self.nb_joueurs,
+                       nectar_total_initial=self.nectar_total_initial, fleurs=fleurs)
+
+    def _signaler(self, type_evenement, **donnees):
+        """
+        Signale un événement de la partie, avec le tour et le joueur actuel.
+        """
+        signaler(type_evenement, {"tour": self.tour, "joueur": self.joueur_actuel, **donnees})
+
+    def _designation(self, abeille):
+        """
+        Désignation d'une abeille dans les événements : [joueur, rang dans sa ruche].
+        """
+        return [abeille.joueur, self.ruches[abeille.joueur].abeilles.index(abeille)]
+
+    def _signaler_deplacement(self, abeille, depart, nectar_avant, premove=False):
+        """
+        Signale un déplacement réussi, et le dépôt de nectar qu'il a provoqué.
+        """
+        designation = self._designation(abeille)
+        self._signaler("mouvement", abeille=designation, role=abeille.role, de=list(depart),
+                       vers=list(abeille.position), premove=premove)
+        if abeille.nectar < nectar_avant:
+            self._signaler("depot", abeille=designation, nectar=nectar_avant - abeille.nectar,
+                           nectar_ruche=self.ruches[abeille.joueur].nectar)
+
+    # ========== ACTIONS D'UN JOUEUR ==========
+
+    def pondre(self, type_abeille):
+        """
+        Pond une abeille dans la ruche du joueur actuel.
+
+        Args:
+            type_abeille (str): "ouvriere", "eclaireuse" ou "bourdon"
+
+        Returns:
+            tuple: (abeille, None) si succès, (None, message_erreur) sinon
+        """
+        pos = POSITIONS_RUCHES[self.joueur_actuel]
+        ruche = self.ruche_actuelle()
+        abeille, erreur = tenter_ponte(self.plateau, ruche, type_abeille, pos)
+        if abeille is not None and evenements_suivis():
+            self._signaler("ponte", abeille=self._designation(abeille), role=abeille.role,
+                           position=list(abeille.position), nectar_ruche=ruche.nectar)
+        return abeille, erreur
+
+    def programmer_ponte(self, type_abeille):
+        """
+        Ajoute une ponte à la file d'attente (jouée en phase de ponte).
+
+        Args:
+            type_abeille (str): "ouvriere", "eclaireuse" ou "bourdon"
+
+        Returns:
+            int: Nombre de pontes en attente
+        """
+        self.file_pontes.append(type_abeille)
+        return len(self.file_pontes)
+
+    def deplacer(self, abeille, nouvelle_position):
+        """
+        Déplace une abeille et met à jour son orientation (droite/gauche).
+
+        Args:
+            abeille (Abeille): Abeille à déplacer
+            nouvelle_position (tuple): Case de destination (x, y)
+
+        Returns:
+            tuple: (True, None) si succès, (False, message_erreur) sinon
+        """
+        x_old, y_old = abeille.position
+        x_new, y_new = nouvelle_position
+
+        if y_new > y_old:
+            abeille.direction = "droite"
+        elif y_new < y_old:
+            abeille.direction = "gauche"
+
+        suivi = evenements_suivis()
+        if suivi:
+            depart, nectar_avant = abeille.position, abeille.nectar
+        resultat = tenter_deplacement(self.plateau, abeille, nouvelle_position, self.ruches)
+        if suivi and resultat[0]:
+            self._signaler_deplacement(abeille, depart, nectar_avant)
+        return resultat
+
+    def faire_butiner(self, abeille):
+        """
+        Fait butiner une abeille du joueur actuel.
+
+        Args:
+            abeille (Abeille): Abeille qui butine
+
+        Returns:
+            tuple: (True, nectar_pris) si succès, (False, message_erreur) sinon
+        """
+        ruche = self.ruche_actuelle()
+        if not evenements_suivis():
+            return tenter_butinage(self.plateau, abeille, ruche)
+
+        x, y = abeille.position
+        fleurs = fleurs_accessibles(self.plateau, x, y)
+        nectar_avant = abeille.nectar
+        succes, resultat = tenter_butinage(self.plateau, abeille, ruche)
+        if succes:
+            fleur = fleurs[0]
+            designation = self._designation(abeille)
+            self._signaler("butinage", abeille=designation, position=[x, y], fleur=list(fleur.position),
+                           pris=resultat, reste=fleur.nectar, epuisee=fleur.nectar == 0)
+            if abeille.nectar < nectar_avant + resultat:
+                self._signaler("depot", abeille=designation, nectar=nectar_avant + resultat - abeille.nectar,
+                               nectar_ruche=ruche.nectar)
+        return succes, resultat
+
+    # ========== DEROULEMENT DE LA PARTIE ==========
+
+    def passer_phase(self):
+        """
+        Passe à la phase suivante (même logique que le bouton "PASSER LA PHASE").
+
+        Returns:
+            Abeille ou None: Abeille pondue depuis la file de pontes (la phase
+                          de ponte continue dans ce cas), None sinon
+
+        Enchaînement:
+            - Ponte : joue la première ponte en attente, sinon passe au mouvement
+            - Mouvement : exécute les prémoves, puis passe au butinage
+            - Butinage : escarmouche, fin de partie et joueur suivant
+
+        Note:
+            Les phases sans action possible sont sautées automatiquement
+            (pas d'abeille active, aucune fleur accessible)
+        """
+        if self.fini:
+            return None
+
+        ruche = self.ruche_actuelle()
+
+        if self.phase == "ponte":
+            if self.file_pontes:
+                abeille, erreur = self.pondre(self.file_pontes[0])
+                if abeille:
+                    self.file_pontes.pop(0)
+                    return abeille
+                self.file_pontes.clear()
+
+            self.phase = "mouvement"
+            if not verifier_a_abeille_active(ruche):
+                return self.passer_phase()
+
+        elif self.phase == "mouvement":
+            suivi = evenements_suivis()
+            if suivi:
+                avant = [(abeille, abeille.position, abeille.nectar) for abeille in ruche.abeilles]
+            with mesure("phase.premoves"):
+                executer_deplacements_automatiques(ruche, self.plateau, self.ruches)
+            if suivi:
+                for abeille, depart, nectar_avant in avant:
+                    if abeille.position != depart:
+                        self._signaler_deplacement(abeille, depart, nectar_avant, premove=True)
+
+            self.phase = "butinage"
+            if verifier_auto_skip_butinage(ruche, self.plateau):
+                return self.passer_phase()
+
+        elif self.phase == "butinage":
+            self.executer_escarmouche()
+
+        return None
+
+    def executer_escarmouche(self):
+        """
+        Lance l'escarmouche du joueur actuel puis passe au joueur suivant.
+
+        Vérifie la fin de partie après l'escarmouche. Quand tous les
+        joueurs ont joué, le tour avance et les abeilles sont réinitialisées.
+        """
+        ruche = self.ruche_actuelle()
+        suivi = evenements_suivis()
+        tirages = [] if suivi else None
+        if suivi:
+            nectars = {abeille: abeille.nectar for abeille in ruche.abeilles}
+        with mesure("phase.escarmouche"):
+            phase_escarmouche(self.plateau, ruche, self.rng, tirages)
+        compter("abeilles.escarmouche", len(ruche.abeilles))
+        for abeille, proba, tirage, reussie in tirages or ():
+            self._signaler("esquive", abeille=self._designation(abeille), proba=proba, tirage=tirage,
+                           reussie=reussie, nectar_perdu=0 if reussie else nectars[abeille])
+
+        with mesure("phase.fin_de_partie"):
+            fini, gagnant, raison = fin_de_partie(self.plateau, self.ruches, self.tour, self.nectar_total_initial)
+        if fini:
+            self.fini = True
+            self.gagnant = gagnant
+            self.raison = raison
+            marquer("fin", {"raison": raison, "tour": self.tour})
+            if suivi:
+                self._signaler("fin", raison=raison, gagnant=gagnant.joueur,
+                               nectar_ruches=[r.nectar for r in self.ruches])
+            return
+
+        self.joueur_actuel = (self.joueur_actuel + 1) % self.nb_joueurs
+
+        if self.joueur_actuel == 0:
+            if suivi:
+                self._signaler("fin_tour", nectar_ruches=[r.nectar for r in self.ruches])
+                assommees = [abeille for r in self.ruches for abeille in r.abeilles if abeille.etat == "KO"]
+            self.tour += 1
+            marquer("tour", {"tour": self.tour})
+            with mesure("phase.nouveau_tour"):
+                nouveau_tour(self.ruches, self.plateau)
+            if suivi:
+                for abeille in assommees:
+                    if abeille.etat == "OK":
+                        self._signaler("reveil", abeille=self._designation(abeille))
+
+        self.phase = "ponte"
+
+    def jouer_phase_ia(self, apres_action=None):
+        """
+        Fait jouer l'IA du joueur actuel pour la phase en cours.
+
+        La phase n'est pas passée : il faut appeler passer_phase() ensuite.
+
+        Args:
+            apres_action (function): Appelée après chaque action réussie avec
+                                     (nom_action, detail), ex: ("ponte", "ouvriere"),
+                                     ("mouvement", abeille), ("butinage", nectar_pris).
+                                     Sert à l'interface pour redessiner.
+
+        Note:
+            En phase de mouvement, les prémoves de l'IA sont annulés
+            (l'IA choisit elle-même tous ses déplacements)
+        """
+        ia = self.ias[self.joueur_actuel]
+        ruche = self.ruche_actuelle()
+        with mesure("phase." + self.phase):
+            self._jouer_phase_ia(ia, ruche, apres_action)
+
+    def _jouer_phase_ia(self, ia, ruche, apres_action):
+        """
+        Fait jouer une IA pour la phase en cours (voir jouer_phase_ia).
+        """
+        if self.phase == "ponte":
+            self.file_pontes.clear()
+            while True:
+                with mesure("ia.ponte"):
+                    type_abeille = ia.jouer_tour_ponte(self.plateau, ruche)
+                if not type_abeille:
+                    break
+                abeille, erreur = self.pondre(type_abeille)
+                if erreur:
+                    break
+                if apres_action:
+                    apres_action("ponte", type_abeille)
+
+        elif self.phase == "mouvement":
+            for abeille in ruche.abeilles:
+                abeille.destination_automatique = None
+
+            with mesure("ia.mouvement"):
+                mouvements = ia.jouer_tour_mouvement(self.plateau, ruche, self.ruches)
+            compter("abeilles.mouvement", len(ruche.abeilles))
+            for abeille, nouvelle_pos in mouvements:
+                succes, _ = self.deplacer(abeille, nouvelle_pos)
+                if succes and apres_action:
+                    apres_action("mouvement", abeille)
+
+        elif self.phase == "butinage":
+            with mesure("ia.butinage"):
+                abeilles = ia.jouer_tour_butinage(self.plateau, ruche)
+            compter("abeilles.butinage", len(ruche.abeilles))
+            for abeille in abeilles:
+                succes, resultat = self.faire_butiner(abeille)
+                if succes and apres_action:
+                    apres_action("butinage", resultat)
+
+    def etape(self):
+        """
+        Avance la partie d'une phase.
+
+        Si le joueur actuel est une IA, elle joue sa phase avant le passage.
+        Un joueur humain sans interface passe simplement la phase.
+
+        Returns:
+            bool: True si la partie continue, False si elle est terminée
+        """
+        if self.fini:
+            return False
+
+        self.demarrer()
+        if self.est_tour_ia():
+            self.jouer_phase_ia()
+        self.passer_phase()
+
+        return not self.fini
+
+    def jouer_jusqu_a_la_fin(self):
+        """
+        Joue la partie jusqu'à sa fin, sans interface graphique.
+
+        Returns:
+            tuple: (gagnant, raison) avec gagnant la ruche gagnante et
+                   raison "timeout", "blitzkrieg" ou "epuisement"
+
+        Note:
+            La partie s'arrête au plus tard après TIME_OUT tours
+        """
+        while self.etape():
+            pass
+        return self.gagnant, self.raison
+
+    # ========== SAUVEGARDE ==========
+
+    def sauvegarder(self, chemin=None, avec_hasard=True):
+        """
+        Prend un instantané binaire de la partie (voir sauvegarde.py).
+
+        Args:
+            chemin (str): Fichier où écrire l'instantané (None = ne rien écrire)
+            avec_hasard (bool): Inclure l'état du générateur aléatoire
+
+        Returns:
+            bytes: Instantané de la partie, à relire avec charger_moteur()
+        """
+        from sauvegarde import encoder_partie
+
+        donnees = encoder_partie(self, avec_hasard)
+        if chemin is not None:
+            with open(chemin, "wb") as fichier:
+                fichier.write(donnees)
+        return donnees
+
+
+def creer_moteur(config=None, graine=None):
+    """
+    Crée un moteur de partie prêt à jouer.
+
+    Args:
+        config (dict): Configuration {"nb_joueurs": int, "ia": [bool, bool, bool, bool]}
+                       (par défaut : 4 IA, mode spectateur)
+        graine (int): Graine de la partie (None = partie au hasard)
+
+    Returns:
+        MoteurBZZZ: Une nouvelle partie
+
+    Exemple d'utilisation:
+        moteur = creer_moteur(graine=42)
+        gagnant, raison = moteur.jouer_jusqu_a_la_fin()
+    """
+    if config is None:
+        config = {"nb_joueurs": 4, "ia": [True, True, True, True]}
+    return MoteurBZZZ(config, graine=graine)
+
+
+def charger_moteur(source, ias=None):
+    """
+    Reprend une partie sauvegardée avec MoteurBZZZ.sauvegarder().
+
+    Args:
+        source (bytes ou str): Instantané, ou chemin du fichier de sauvegarde
+        ias (list): IA de chaque joueur (None = IA du type sauvegardé pour
+                    les joueurs qui étaient des IA)
+
+    Returns:
+        MoteurBZZZ: Partie prête à continuer là où elle s'était arrêtée
+
+    Raises:
+        OSError: Si le fichier de sauvegarde ne peut pas être lu
+        ValueError: Si la source n'est pas une sauvegarde BZZZ valide
+    """
+    from sauvegarde import charger_partie, decoder_partie
+
+    if isinstance(source, (bytes, bytearray)):
+        return decoder_partie(source, ias)
+    return charger_partie(source, ias)
@@ -0,0 +1,323 @@
+# sauvegarde.py - Sauvegarde binaire compacte des parties BZZZ
+"""
+Instantanés binaires d'une partie BZZZ (plateau, ruches, fleurs, abeilles,
+tour, phase, file de pontes et générateur aléatoire).
+
+Le plateau n'est pas écrit case par case : seules les fleurs et les abeilles
+le sont (quelques octets chacune), les ruches sont toujours dans les coins.
+Au chargement, le plateau, l'index d'occupation et les tables de fleurs
+sont reconstruits (la clé de Zobrist est à réactiver, voir activer_hachage()). Une partie en cours de 60 abeilles tient en
+moins de 500 octets (2,5 Ko de plus avec l'état du générateur aléatoire), bien
+moins qu'un pickle des mêmes objets. L'encodage prend quelques dizaines de microsecondes et la
+relecture (plateau reconstruit compris) moins d'une demi-milliseconde : de
+quoi prendre des points de reprise à chaque coup (IA, rejeu).
+
+encoder_position() et decoder_position() n'écrivent que la position (ruches,
+fleurs, abeilles) sans l'état de la partie : de quoi l'envoyer à d'autres
+processus (recherche parallèle de IA_MCTS).
+
+Format (petit-boutiste, version 2):
+    En-tête : "BZZZ", version, taille, tour, joueur actuel, phase,
+              nombre de joueurs, IA (bit i = joueur i), nectar initial,
+              fin de partie, raison, gagnant, nombre de fleurs,
+              nombre de pontes en attente, générateur présent, graine,
+              type des IA (rang dans TYPES_IA)
+    Ruches  : nectar des 4 ruches, puis nombre d'abeilles de chaque ruche
+    Fleurs  : (x, y, numéro, nectar) dans l'ordre des cases
+    Abeilles: (x, y, codes, nectar, tours KO, destination x, destination y)
+              ruche par ruche, dans l'ordre de ponte ; codes = rôle (2 bits),
+              KO, a_bouge, gauche
+    Pontes  : rôle de chaque ponte en attente
+    Hasard  : état du random.Random de la partie (625 entiers), si présent
+
+Exemple:
+    >>> donnees = encoder_partie(moteur)
+    >>> copie = decoder_partie(donnees)
+    >>> copie.jouer_jusqu_a_la_fin()  # même fin que moteur.jouer_jusqu_a_la_fin()
+"""
+import random
+import struct
+
+from model import *
+from ia import TYPES_IA
+from moteur import MoteurBZZZ, PHASES
+
+MAGIE = b"BZZZ"
+VERSION = 2
+EXTENSION = ".bzzz"
+
+RAISONS = (None, "timeout", "blitzkrieg", "epuisement")
+AUCUNE = 255 # case ou joueur absent (destination, gagnant)
+
+_EN_TETE = struct.Struct("<4sBBHBBBBIBBBBBBqB")
+_RUCHES = struct.Struct("<4i4H")
+_HASARD = struct.Struct("<625I")
+_POSITION = struct.Struct("<4i4HH")
+_OCTETS_FLEUR = 4
+_OCTETS_ABEILLE = 7
+
+_ROLE_VERS_CODE = {role: i for i, role in enumerate(ROLES)}
+_KO = 4
+_A_BOUGE = 8
+_GAUCHE = 16
+
+
+def _octets_fleurs(plateau):
+    """
+    Fleurs du plateau, _OCTETS_FLEUR octets chacune, dans l'ordre des cases.
+    """
+    fleurs = []
+    for x in range(len(plateau)):
+        for y in range(len(plateau)):
+            for element in plateau[x][y]:
+                if element.type == "fleur":
+                    fleurs += (x, y, int(element.id[5:]), element.nectar)
+    return bytes(fleurs)
+
+
+def _octets_abeilles(ruches):
+    """
+    Abeilles des ruches, _OCTETS_ABEILLE octets chacune, dans l'ordre de ponte.
+    """
+    abeilles = []
+    for ruche in ruches:
+        for abeille in ruche.abeilles:
+            x, y = abeille.position
+            codes = _ROLE_VERS_CODE[abeille.role]
+            if abeille.etat == KO:
+                codes |= _KO
+            if abeille.a_bouge:
+                codes |= _A_BOUGE
+            if abeille.direction == "gauche":
+                codes |= _GAUCHE
+            destination = abeille.destination_automatique
+            if destination is None:
+                destination = (AUCUNE, AUCUNE)
+            abeilles += (x, y, codes, abeille.nectar, abeille.tours_ko_restants,
+                         destination[0], destination[1])
+    return bytes(abeilles)
+
+
+def _reconstruire(nectars, nb_abeilles, octets_fleurs, octets_abeilles):
+    """
+    Reconstruit le plateau et les ruches (index, tables de fleurs et totaux
+    de nectar compris).
+
+    Returns:
+        tuple: (plateau, ruches)
+
+    Raises:
+        ValueError: Si une case est hors du plateau ou un rôle inconnu
+    """
+    plateau = creer_plateau()
+    ruches = creer_ruche(plateau)
+    for ruche, nectar in zip(ruches, nectars):
+        ruche.nectar = nectar
+
+    fleurs = []
+    nectar_fleurs = 0
+    for x, y, numero, nectar in struct.iter_unpack("<4B", octets_fleurs):
+        if x >= NCASES or y >= NCASES:
+            raise ValueError(f"Sauvegarde BZZZ abîmée (fleur hors du plateau en {(x, y)})")
+        fleur = Fleur(f"fleur{numero}", nectar, (x, y))
+        plateau[x][y].append(fleur)
+        fleurs.append(fleur)
+        nectar_fleurs += nectar
+    indexer_fleurs(plateau, fleurs)
+
+    nectar_abeilles = 0
+    valeurs = struct.iter_unpack("<7B", octets_abeilles)
+    for ruche, nb in zip(ruches, nb_abeilles):
+        for _ in range(nb):
+            x, y, codes, nectar, tours_ko, dx, dy = next(valeurs)
+            if x >= NCASES or y >= NCASES or (dx != AUCUNE and (dx >= NCASES or dy >= NCASES)):
+                raise ValueError(f"Sauvegarde BZZZ abîmée (abeille hors du plateau en {(x, y)})")
+            if codes & 3 >= len(ROLES):
+                raise ValueError(f"Sauvegarde BZZZ abîmée (rôle d'abeille {codes & 3} inconnu)")
+            abeille = Abeille(ROLES[codes & 3], (x, y), ruche.joueur)
+            abeille.nectar = nectar
+            abeille.tours_ko_restants = tours_ko
+            if codes & _KO:
+                abeille.etat = KO
+            abeille.a_bouge = bool(codes & _A_BOUGE)
+            if codes & _GAUCHE:
+                abeille.direction = "gauche"
+            if dx != AUCUNE:
+                abeille.destination_automatique = (dx, dy)
+            ruche.abeilles.append(abeille)
+            placer_abeille(plateau, abeille)
+            nectar_abeilles += nectar
+    plateau.nectar_fleurs = nectar_fleurs
+    plateau.nectar_abeilles = nectar_abeilles
+    return plateau, ruches
+
+
+def encoder_position(plateau, ruches):
+    """
+    Encode seulement la position (ruches, fleurs, abeilles), sans la partie.
+
+    Sert à envoyer une position à d'autres processus (recherche de IA_MCTS
+    sur plusieurs cœurs).
+
+    Args:
+        plateau (Plateau): Plateau de jeu
+        ruches (list): Les 4 ruches
+
+    Returns:
+        bytes: Position encodée (mêmes enregistrements que encoder_partie())
+    """
+    fleurs = _octets_fleurs(plateau)
+    return b"".join([
+        _POSITION.pack(*[ruche.nectar for ruche in ruches], *[len(ruche.abeilles) for ruche in ruches],
+                       len(fleurs) // _OCTETS_FLEUR),
+        fleurs,
+        _octets_abeilles(ruches)
+    ])
+
+
+def decoder_position(donnees):
+    """
+    Reconstruit une position encodée par encoder_position().
+
+    Args:
+        donnees (bytes): Position encodée
+
+    Returns:
+        tuple: (plateau, ruches)
+    """
+    *nectars, n0, n1, n2, n3, nb_fleurs = _POSITION.unpack_from(donnees)
+    fin_fleurs = _POSITION.size + nb_fleurs * _OCTETS_FLEUR
+    return _reconstruire(nectars, (n0, n1, n2, n3), donnees[_POSITION.size:fin_fleurs], donnees[fin_fleurs:])
+
+
+def encoder_partie(moteur, avec_hasard=True):
+    """
+    Encode l'état complet d'une partie en octets.
+
+    Args:
+        moteur (MoteurBZZZ): Partie à sauvegarder
+        avec_hasard (bool): Inclure l'état du générateur aléatoire (la partie
+                            reprise continue alors exactement à l'identique)
+
+    Returns:
+        bytes: Instantané de la partie
+
+    Note:
+        Les IA ne sont pas sauvegardées, seulement quels joueurs sont des IA
+        et leur type (elles sont recréées au chargement)
+    """
+    plateau = moteur.plateau
+    ruches = moteur.ruches
+    fleurs = _octets_fleurs(plateau)
+
+    ias = 0
+    for i, ia in enumerate(moteur.ias):
+        if ia is not None:
+            ias |= 1 << i
+    gagnant = AUCUNE
+    if moteur.gagnant is not None:
+        gagnant = moteur.gagnant.joueur
+    graine = moteur.graine
+    avec_graine = isinstance(graine, int) and -2**63 <= graine < 2**63
+
+    morceaux = [
+        _EN_TETE.pack(MAGIE, VERSION, len(plateau), moteur.tour, moteur.joueur_actuel,
+                      PHASES.index(moteur.phase), moteur.nb_joueurs, ias,
+                      moteur.nectar_total_initial, moteur.fini, RAISONS.index(moteur.raison),
+                      gagnant, len(fleurs) // _OCTETS_FLEUR, len(moteur.file_pontes),
+                      avec_hasard | (avec_graine << 1), graine if avec_graine else 0,
+                      TYPES_IA.index(moteur.type_ia)),
+        _RUCHES.pack(*[ruche.nectar for ruche in ruches], *[len(ruche.abeilles) for ruche in ruches]),
+        fleurs,
+        _octets_abeilles(ruches),
+        bytes(_ROLE_VERS_CODE[role] for role in moteur.file_pontes)
+    ]
+    if avec_hasard:
+        morceaux.append(_HASARD.pack(*moteur.rng.getstate()[1]))
+    return b"".join(morceaux)
+
+
+def decoder_partie(donnees, ias=None):
+    """
+    Reconstruit une partie à partir d'un instantané.
+
+    Args:
+        donnees (bytes): Instantané créé par encoder_partie()
+        ias (list): IA de chaque joueur (None = IA du type sauvegardé pour
+                    les joueurs qui étaient des IA)
+
+    Returns:
+        MoteurBZZZ: Partie prête à continuer
+
+    Raises:
+        ValueError: Si les données ne sont pas un instantané BZZZ valide
+    """
+    if len(donnees) < _EN_TETE.size + _RUCHES.size or donnees[:4] != MAGIE:
+        raise ValueError("Ce n'est pas une sauvegarde BZZZ")
+    (_, version, taille, tour, joueur_actuel, phase, nb_joueurs, bits_ias, nectar_total_initial,
+     fini, raison, gagnant, nb_fleurs, nb_pontes, options, graine, type_ia) = _EN_TETE.unpack_from(donnees)
+    if version != VERSION:
+        raise ValueError(f"Sauvegarde BZZZ version {version} non gérée (version {VERSION} attendue)")
+    if taille != NCASES:
+        raise ValueError(f"Sauvegarde d'un plateau {taille}x{taille} (le jeu utilise {NCASES}x{NCASES})")
+    if type_ia >= len(TYPES_IA):
+        raise ValueError(f"Sauvegarde BZZZ abîmée (type d'IA {type_ia} inconnu)")
+    if (not 1 <= nb_joueurs <= 4 or joueur_actuel >= nb_joueurs or phase >= len(PHASES)
+            or raison >= len(RAISONS) or (gagnant != AUCUNE and gagnant >= 4)):
+        raise ValueError("Sauvegarde BZZZ abîmée (joueur, phase, raison ou gagnant invalide)")
+
+    debut = _EN_TETE.size
+    *nectars, n0, n1, n2, n3 = _RUCHES.unpack_from(donnees, debut)
+    nb_abeilles = (n0, n1, n2, n3)
+    debut += _RUCHES.size
+    fin_fleurs = debut + nb_fleurs * _OCTETS_FLEUR
+    fin_abeilles = fin_fleurs + sum(nb_abeilles) * _OCTETS_ABEILLE
+    fin_pontes = fin_abeilles + nb_pontes
+    attendu = fin_pontes + (_HASARD.size if options & 1 else 0)
+    if len(donnees) != attendu:
+        raise ValueError(f"Sauvegarde BZZZ tronquée ou abîmée ({len(donnees)} octets, {attendu} attendus)")
+
+    plateau, ruches = _reconstruire(nectars, nb_abeilles, donnees[debut:fin_fleurs],
+                                    donnees[fin_fleurs:fin_abeilles])
+
+    rng = random.Random()
+    if options & 1:
+        rng.setstate((3, _HASARD.unpack_from(donnees, fin_pontes), None))
+
+    pontes = donnees[fin_abeilles:fin_pontes]
+    if any(code >= len(ROLES) for code in pontes):
+        raise ValueError("Sauvegarde BZZZ abîmée (rôle de ponte inconnu)")
+    config = {"nb_joueurs": nb_joueurs, "ia": [bool(bits_ias >> i & 1) for i in range(4)],
+              "type_ia": TYPES_IA[type_ia]}
+    moteur = MoteurBZZZ(config, ias=ias, plateau=plateau, ruches=ruches,
+                        nectar_total_initial=nectar_total_initial,
+                        graine=graine if options & 2 else None, rng=rng)
+    moteur.tour = tour
+    moteur.joueur_actuel = joueur_actuel
+    moteur.phase = PHASES[phase]
+    moteur.file_pontes = [ROLES[code] for code in pontes]
+    moteur.fini = bool(fini)
+    moteur.raison = RAISONS[raison]
+    if gagnant != AUCUNE:
+        moteur.gagnant = ruches[gagnant]
+    return moteur
+
+
+def charger_partie(chemin, ias=None):
+    """
+    Reprend une partie sauvegardée par MoteurBZZZ.sauvegarder(chemin).
+
+    Args:
+        chemin (str): Fichier de sauvegarde
+        ias (list): IA de chaque joueur (None = IA du type sauvegardé, voir
+                    decoder_partie())
+
+    Returns:
+        MoteurBZZZ: Partie prête à continuer
+
+    Raises:
+        OSError: Si le fichier ne peut pas être lu
+        ValueError: Si le fichier n'est pas une sauvegarde BZZZ valide
+    """
+    with open(chemin, "rb") as fichier:
+        return decoder_partie(fichier.read(), ias)
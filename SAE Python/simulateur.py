@@ -0,0 +1,586 @@
+# simulateur.py - Simulation de nombreuses parties IA en parallèle (NumPy)
+"""
+Simulateur de parties BZZZ par lots, pour les études d'équilibrage.
+
+Toutes les parties d'un lot avancent ensemble : l'état de N parties est
+rangé dans des tableaux NumPy (une dimension par partie) et chaque phase
+(ponte, mouvement, butinage, escarmouche, nouveau tour) est appliquée à
+toutes les parties d'un coup.
+
+Règles et politique de jeu:
+    - Les règles viennent de model.py : gain_nectar (via une table),
+      CAPACITE_NECTAR, FORCE, TIME_KO, COUT_PONTE, zones et voisins de
+      deplacements.py, placement des fleurs par placer_fleurs()
+    - Les 4 joueurs suivent la politique de IA_BZZZ (ia.py), recopiée ici
+      sous forme vectorisée : toute modification de IA_BZZZ doit être
+      reportée dans ce fichier (test_simulateur de test_model.py le vérifie)
+
+Hasard:
+    Chaque partie a son propre générateur (random.Random), tiré dans le
+    même ordre que le moteur (placement des fleurs, ponte de secours de
+    l'IA, esquives de l'escarmouche). Une partie de graine g donne donc le
+    même résultat que creer_moteur(graine=g).jouer_jusqu_a_la_fin().
+
+Dépendance:
+    NumPy est nécessaire pour ce fichier uniquement (pip install numpy),
+    le jeu et le moteur n'en ont pas besoin.
+
+Exemple:
+    >>> simulateur = SimulateurBZZZ(range(1000))
+    >>> resultats = simulateur.jouer_jusqu_a_la_fin()
+"""
+import random
+from model import *
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+RAISONS = ("timeout", "blitzkrieg", "epuisement")
+
+
+def _somme_voisinage(grilles, centre=False):
+    """
+    Compte, pour chaque case, les cases vraies parmi ses 8 voisines.
+
+    Args:
+        grilles (ndarray): Tableau (parties, N, N) de booléens
+        centre (bool): True pour compter aussi la case elle-même (3x3)
+
+    Returns:
+        ndarray: Tableau (parties, N, N) des sommes
+    """
+    cases = grilles.astype(np.int16)
+    lignes = cases.copy()
+    lignes[:, 1:, :] += cases[:, :-1, :]
+    lignes[:, :-1, :] += cases[:, 1:, :]
+    somme = lignes.copy()
+    somme[:, :, 1:] += lignes[:, :, :-1]
+    somme[:, :, :-1] += lignes[:, :, 1:]
+    if not centre:
+        somme -= cases
+    return somme
+
+
+def _table_voisins(grille, taille):
+    """
+    Convertit une grille de tuples de cases (tables de deplacements.py) en
+    tableau (N*N, 8) de numéros de case x*N+y, complété par -1.
+    """
+    table = np.full((taille * taille, 8), -1, dtype=np.int32)
+    for x in range(taille):
+        for y in range(taille):
+            for k, (nx, ny) in enumerate(grille[x][y]):
+                table[x * taille + y, k] = nx * taille + ny
+    return table
+
+
+class SimulateurBZZZ:
+    """
+    Lot de parties BZZZ à 4 IA simulées ensemble.
+
+    Les abeilles d'une ruche sont rangées dans l'ordre de ponte (emplacement
+    0, 1, 2...), comme ruche.abeilles. Les cases sont numérotées x*N+y dans
+    les grilles aplaties.
+
+    Attributs (P = nombre de parties, A = emplacements d'abeilles par ruche):
+        graines (list): Graine de chaque partie
+        occupation (ndarray): (P, N, N) joueur de l'abeille de chaque case, ou -1
+        role_case (ndarray): (P, N, N) rôle de l'abeille de chaque case
+        active_case (ndarray): (P, N, N) True si l'abeille de la case est active
+        nectar_fleurs (ndarray): (P, F) nectar de chaque fleur
+        position_fleurs (ndarray): (P, F, 2) position de chaque fleur
+        premiere_fleur (ndarray): (P, N, N) fleur butinée depuis chaque case
+                                  (première fleur accessible), -1 si aucune
+        nb_fleurs_nectar (ndarray): (P, N, N) fleurs accessibles avec nectar
+        role (ndarray): (P, 4, A) indice du rôle dans ROLES, -1 si pas d'abeille
+        x, y (ndarray): (P, 4, A) position des abeilles
+        nectar (ndarray): (P, 4, A) nectar transporté
+        ok (ndarray): (P, 4, A) True si l'abeille est active
+        a_bouge (ndarray): (P, 4, A) True si l'abeille a agi ce tour
+        tours_ko (ndarray): (P, 4, A) tours avant le réveil
+        nb_abeilles (ndarray): (P, 4) nombre d'abeilles de chaque ruche
+        nectar_ruches (ndarray): (P, 4) nectar stocké dans chaque ruche
+        nectar_initial (ndarray): (P,) nectar total des fleurs au départ
+        actif (ndarray): (P,) True tant que la partie n'est pas finie
+        tour (int): Tour en cours (le même pour toutes les parties)
+    """
+
+    def __init__(self, graines, capacite=16):
+        """
+        Crée un lot de parties, une par graine.
+
+        Args:
+            graines (iterable): Graines des parties (int)
+            capacite (int): Emplacements d'abeilles réservés par ruche
+                            (agrandi automatiquement si besoin)
+
+        Raises:
+            ImportError: Si NumPy n'est pas installé
+        """
+        if np is None:
+            raise ImportError("simulateur.py a besoin de numpy (pip install numpy)")
+
+        self.graines = list(graines)
+        nb_parties = len(self.graines)
+        n = NCASES
+        nb_fleurs = NFLEURS * 4
+
+        self.generateurs = []
+        self.occupation = np.full((nb_parties, n, n), -1, dtype=np.int8)
+        self.role_case = np.full((nb_parties, n, n), -1, dtype=np.int8)
+        self.active_case = np.zeros((nb_parties, n, n), dtype=bool)
+        self.nectar_fleurs = np.zeros((nb_parties, nb_fleurs), dtype=np.int32)
+        self.position_fleurs = np.zeros((nb_parties, nb_fleurs, 2), dtype=np.int32)
+        self.premiere_fleur = np.full((nb_parties, n, n), -1, dtype=np.int32)
+        self.nb_fleurs_nectar = np.zeros((nb_parties, n, n), dtype=np.int32)
+
+        for p, graine in enumerate(self.graines):
+            self.generateurs.append(self._placer_fleurs(p, graine))
+
+        self.role = np.full((nb_parties, 4, capacite), -1, dtype=np.int8)
+        self.x = np.zeros((nb_parties, 4, capacite), dtype=np.int32)
+        self.y = np.zeros((nb_parties, 4, capacite), dtype=np.int32)
+        self.nectar = np.zeros((nb_parties, 4, capacite), dtype=np.int32)
+        self.ok = np.zeros((nb_parties, 4, capacite), dtype=bool)
+        self.a_bouge = np.zeros((nb_parties, 4, capacite), dtype=bool)
+        self.tours_ko = np.zeros((nb_parties, 4, capacite), dtype=np.int32)
+        self.nb_abeilles = np.zeros((nb_parties, 4), dtype=np.int32)
+
+        self.nectar_ruches = np.full((nb_parties, 4), NECTAR_INITIAL, dtype=np.int64)
+        self.nectar_initial = self.nectar_fleurs.sum(axis=1)
+
+        self.actif = np.ones(nb_parties, dtype=bool)
+        self.tour = 1
+        self.tour_fin = np.zeros(nb_parties, dtype=np.int32)
+        self.gagnant = np.full(nb_parties, -1, dtype=np.int32)
+        self.raison = np.full(nb_parties, -1, dtype=np.int32)
+
+        # Tables constantes (règles de model.py et deplacements.py), cases aplaties
+        tables = tables_deplacement(n)
+        lignes, colonnes = np.indices((n, n))
+        self._zones = np.array(tables.zones, dtype=np.int32).ravel()
+        self._adjacentes = _table_voisins(tables.adjacentes, n)
+        self._voisins = [[_table_voisins(tables.voisins[(j, diagonale)], n) for diagonale in (False, True)]
+                         for j in range(4)]
+        self._score_retour = []
+        for j in range(4):
+            rx, ry = POSITIONS_RUCHES[j]
+            distance_ruche = (np.abs(lignes - rx) + np.abs(colonnes - ry)).ravel()
+            self._score_retour.append((32 - distance_ruche) * 3)
+        self._score_centre = ((16 - (np.abs(lignes - 8) + np.abs(colonnes - 8))) * 2).ravel()
+        self._capacite = np.array([CAPACITE_NECTAR[r] for r in ROLES], dtype=np.int32)
+        self._force = np.array([FORCE[r] for r in ROLES], dtype=np.float64)
+        self._gain = np.array([gain_nectar(Fleur("", nectar)) for nectar in range(MAX_NECTAR + 1)],
+                              dtype=np.int32)
+        self._eclaireuse = ROLES.index(ECLAIREUSE)
+
+    def _placer_fleurs(self, p, graine):
+        """
+        Place les fleurs de la partie p avec placer_fleurs() du modèle.
+
+        Le générateur de la partie est créé et tiré comme dans MoteurBZZZ.
+
+        Returns:
+            random.Random: Générateur de la partie, prêt pour la suite
+        """
+        generateur = random.Random(graine)
+        plateau = creer_plateau()
+        placer_fleurs(plateau, creer_fleurs(NFLEURS), generateur)
+
+        numeros = {}
+        for x in range(NCASES):
+            for y in range(NCASES):
+                for element in plateau[x][y]:
+                    if element.type == "fleur":
+                        f = len(numeros)
+                        numeros[id(element)] = f
+                        self.nectar_fleurs[p, f] = element.nectar
+                        self.position_fleurs[p, f] = (x, y)
+        for x in range(NCASES):
+            for y in range(NCASES):
+                fleurs = plateau.fleurs_voisines[x][y]
+                if fleurs:
+                    self.premiere_fleur[p, x, y] = numeros[id(fleurs[0])]
+                self.nb_fleurs_nectar[p, x, y] = plateau.nb_fleurs_nectar[x][y]
+        return generateur
+
+    def _agrandir(self):
+        """
+        Double le nombre d'emplacements d'abeilles de chaque ruche.
+        """
+        capacite = self.role.shape[2]
+        ajout = ((0, 0), (0, 0), (0, capacite))
+        self.role = np.pad(self.role, ajout, constant_values=-1)
+        self.x = np.pad(self.x, ajout)
+        self.y = np.pad(self.y, ajout)
+        self.nectar = np.pad(self.nectar, ajout)
+        self.ok = np.pad(self.ok, ajout)
+        self.a_bouge = np.pad(self.a_bouge, ajout)
+        self.tours_ko = np.pad(self.tours_ko, ajout)
+
+    def _abeilles(self, j, condition):
+        """
+        Liste les abeilles du joueur j qui vérifient une condition.
+
+        Args:
+            j (int): Joueur
+            condition (function): Reçoit les emplacements utilisés (slice) et
+                                  retourne un masque (P, emplacements)
+
+        Returns:
+            tuple: (parties, emplacements) des abeilles retenues, dans l'ordre
+                   des parties puis de ponte
+        """
+        utilises = slice(0, int(self.nb_abeilles[:, j].max()))
+        masque = condition(utilises) & (self.role[:, j, utilises] >= 0) & self.actif[:, None]
+        return np.nonzero(masque)
+
+    # ========== PHASES ==========
+
+    def jouer_ponte(self, j):
+        """
+        Phase de ponte du joueur j (politique IA_BZZZ.jouer_tour_ponte).
+
+        Au plus une abeille est pondue : elle occupe ensuite la case de ponte.
+        """
+        role = self.role[:, j]
+        actives = (role >= 0) & self.ok[:, j]
+        nb_actives = actives.sum(axis=1)
+        nb_ouvrieres = (actives & (role == ROLES.index(OUVRIERE))).sum(axis=1)
+        nb_eclaireuses = (actives & (role == ROLES.index(ECLAIREUSE))).sum(axis=1)
+        nb_bourdons = (actives & (role == ROLES.index(BOURDON))).sum(axis=1)
+        nectar = self.nectar_ruches[:, j]
+
+        choix = np.full(len(self.graines), -1, dtype=np.int32)
+        peut = self.actif & (nectar >= COUT_PONTE)
+
+        # Aucune abeille active : ponte obligatoire d'un type au hasard
+        for p in np.nonzero(peut & (nb_actives == 0))[0]:
+            choix[p] = ROLES.index(self.generateurs[p].choice(ROLES))
+
+        marge = peut & (nb_actives > 0) & (nectar >= COUT_PONTE + 15)
+        ouvriere = (nb_actives < 4) | (2 * nb_ouvrieres < nb_actives)
+        eclaireuse = ~ouvriere & (4 * nb_eclaireuses < nb_actives)
+        bourdon = ~ouvriere & ~eclaireuse & (nectar > 30) & (nb_bourdons < 2)
+        type_marge = np.where(eclaireuse, ROLES.index(ECLAIREUSE),
+                              np.where(bourdon, ROLES.index(BOURDON), ROLES.index(OUVRIERE)))
+        choix = np.where(marge, type_marge, choix)
+
+        # Ponte sur la case de la ruche si elle est libre
+        rx, ry = POSITIONS_RUCHES[j]
+        pond = (choix >= 0) & (self.occupation[:, rx, ry] < 0)
+        parties = np.nonzero(pond)[0]
+        if len(parties) == 0:
+            return
+        if self.nb_abeilles[parties, j].max() >= self.role.shape[2]:
+            self._agrandir()
+
+        emplacements = self.nb_abeilles[parties, j]
+        self.role[parties, j, emplacements] = choix[parties]
+        self.x[parties, j, emplacements] = rx
+        self.y[parties, j, emplacements] = ry
+        self.nectar[parties, j, emplacements] = 0
+        self.ok[parties, j, emplacements] = True
+        self.a_bouge[parties, j, emplacements] = False
+        self.tours_ko[parties, j, emplacements] = 0
+        self.occupation[parties, rx, ry] = j
+        self.role_case[parties, rx, ry] = choix[parties]
+        self.active_case[parties, rx, ry] = True
+        self.nb_abeilles[parties, j] += 1
+        self.nectar_ruches[parties, j] -= COUT_PONTE
+
+    def jouer_mouvement(self, j):
+        """
+        Phase de mouvement du joueur j (politique IA_BZZZ.jouer_tour_mouvement).
+
+        Comme l'IA, tous les coups sont choisis sur le plateau d'avant la
+        phase puis joués dans l'ordre des abeilles : si deux abeilles visent
+        la même case, seule la première y va.
+        """
+        n = NCASES
+        nn = n * n
+
+        def veut_bouger(e):
+            role = self.role[:, j, e]
+            fleur = self.premiere_fleur[self._parties_colonne(), self.x[:, j, e], self.y[:, j, e]] >= 0
+            reste = fleur & (self.nectar[:, j, e] < self._capacite[role])
+            return self.ok[:, j, e] & ~self.a_bouge[:, j, e] & ~reste
+
+        ps, es = self._abeilles(j, veut_bouger)
+        if len(ps) == 0:
+            return
+        case = self.x[ps, j, es] * n + self.y[ps, j, es]
+        nectar = self.nectar[ps, j, es]
+
+        # Cases voisines autorisées (table de deplacements.py) et libres
+        diagonale = (self.role[ps, j, es] == self._eclaireuse).astype(np.int32)
+        candidates = np.where(diagonale[:, None] == 1, self._voisins[j][1][case], self._voisins[j][0][case])
+        valide = candidates >= 0
+        cases = np.where(valide, candidates, 0)
+        indices = ps[:, None] * nn + cases
+        valide &= self.occupation.ravel()[indices] < 0
+
+        # Score de chaque case candidate (IA_BZZZ._evaluer_case)
+        ennemis = _somme_voisinage(self.active_case & (self.occupation != j), centre=True).ravel()[indices]
+        score_retour = np.where(self._zones[cases] == j, 1000, self._score_retour[j][cases] - ennemis * 15)
+        score_fleurs = (self.nb_fleurs_nectar.ravel()[indices] * 80 + self._score_centre[cases]
+                        - ennemis * 15)
+        score = np.where((nectar > 0)[:, None], score_retour, score_fleurs)
+        score = np.where(valide, score, -10**9)
+
+        # Meilleure case (la première en cas d'égalité), puis coups dans l'ordre
+        k = np.argmax(score, axis=1)
+        bouge = valide.any(axis=1)
+        ps, es, case = ps[bouge], es[bouge], case[bouge]
+        cible = cases[bouge, k[bouge]]
+        _, premiers = np.unique(ps * nn + cible, return_index=True)
+        ps, es, case, cible = ps[premiers], es[premiers], case[premiers], cible[premiers]
+
+        role = self.role[ps, j, es]
+        ox, oy = case // n, case % n
+        cx, cy = cible // n, cible % n
+        self.occupation[ps, ox, oy] = -1
+        self.role_case[ps, ox, oy] = -1
+        self.active_case[ps, ox, oy] = False
+        self.occupation[ps, cx, cy] = j
+        self.role_case[ps, cx, cy] = role
+        self.active_case[ps, cx, cy] = True
+        self.x[ps, j, es] = cx
+        self.y[ps, j, es] = cy
+        self.a_bouge[ps, j, es] = True
+
+        # Dépôt du nectar en arrivant dans sa zone de ruche
+        depot = self._zones[cible] == j
+        self._deposer(ps[depot], j, es[depot])
+
+    def _parties_colonne(self):
+        """
+        Retourne les numéros de parties en colonne (P, 1), pour l'indexation.
+        """
+        return np.arange(len(self.graines))[:, None]
+
+    def jouer_butinage(self, j):
+        """
+        Phase de butinage du joueur j (politique IA_BZZZ.jouer_tour_butinage).
+
+        Chaque abeille butine la première fleur accessible. Les abeilles qui
+        butinent la même fleur passent dans l'ordre de ponte (rang 0, 1...) ;
+        à rang égal, elles touchent des fleurs différentes et passent ensemble.
+        """
+        def peut_butiner(e):
+            role = self.role[:, j, e]
+            fleur = self.premiere_fleur[self._parties_colonne(), self.x[:, j, e], self.y[:, j, e]] >= 0
+            return (self.ok[:, j, e] & ~self.a_bouge[:, j, e] & fleur
+                    & (self.nectar[:, j, e] < self._capacite[role]))
+
+        ps, es = self._abeilles(j, peut_butiner)
+        if len(ps) == 0:
+            return
+        fs = self.premiere_fleur[ps, self.x[ps, j, es], self.y[ps, j, es]]
+
+        # Rang de chaque abeille parmi celles qui butinent la même fleur
+        cle = ps * self.nectar_fleurs.shape[1] + fs
+        ordre = np.argsort(cle, kind="stable")
+        cles = cle[ordre]
+        debut = np.ones(len(cles), dtype=bool)
+        debut[1:] = cles[1:] != cles[:-1]
+        indices = np.arange(len(cles))
+        rang = np.empty(len(cles), dtype=np.int32)
+        rang[ordre] = indices - np.maximum.accumulate(np.where(debut, indices, 0))
+
+        for r in range(rang.max() + 1):
+            choisies = rang == r
+            p, e, f = ps[choisies], es[choisies], fs[choisies]
+            avant = self.nectar_fleurs[p, f]
+            gain = self._gain[avant]
+            pris = np.minimum(gain, self._capacite[self.role[p, j, e]] - self.nectar[p, j, e])
+            self.nectar[p, j, e] += pris
+            apres = np.maximum(avant - gain, 0)
+            self.nectar_fleurs[p, f] = apres
+            videe = (avant > 0) & (apres == 0)
+            self._retirer_fleurs(p[videe], f[videe])
+
+            depot = self._zones[self.x[p, j, e] * NCASES + self.y[p, j, e]] == j
+            self._deposer(p[depot], j, e[depot])
+
+        self.a_bouge[ps, j, es] = True
+
+    def _deposer(self, parties, j, emplacements):
+        """
+        Dépose le nectar des abeilles données dans la ruche du joueur j.
+        """
+        np.add.at(self.nectar_ruches, (parties, j), self.nectar[parties, j, emplacements])
+        self.nectar[parties, j, emplacements] = 0
+
+    def _retirer_fleurs(self, parties, fleurs):
+        """
+        Met à jour nb_fleurs_nectar pour des fleurs qui viennent d'être vidées.
+        """
+        if len(parties) == 0:
+            return
+        n = NCASES
+        fx = self.position_fleurs[parties, fleurs, 0]
+        fy = self.position_fleurs[parties, fleurs, 1]
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                nx = fx + dx
+                ny = fy + dy
+                dedans = (nx >= 0) & (nx < n) & (ny >= 0) & (ny < n)
+                np.subtract.at(self.nb_fleurs_nectar, (parties[dedans], nx[dedans], ny[dedans]), 1)
+
+    def escarmouche(self, j):
+        """
+        Escarmouche des abeilles du joueur j (règles de phase_escarmouche).
+
+        Les probabilités d'esquive sont calculées pour toutes les parties à
+        la fois ; seuls les tirages se font partie par partie, dans l'ordre
+        des abeilles, avec le générateur de chaque partie.
+        """
+        nn = NCASES * NCASES
+        ps, es = self._abeilles(j, lambda e: self.ok[:, j, e])
+        if len(ps) == 0:
+            return
+
+        # Cases autour de chaque abeille (ordre de trouver_opposantes)
+        case = self.x[ps, j, es] * NCASES + self.y[ps, j, es]
+        autour = self._adjacentes[case]
+        dedans = autour >= 0
+        indices = ps[:, None] * nn + np.where(dedans, autour, 0)
+        joueurs = self.occupation.ravel()[indices]
+        opposante = dedans & self.active_case.ravel()[indices] & (joueurs != j)
+        combat = opposante.any(axis=1)
+        if not combat.any():
+            return
+        ps, es, indices, joueurs, opposante = ps[combat], es[combat], indices[combat], joueurs[combat], opposante[combat]
+
+        # Force effective des opposantes : force / nombre de leurs opposantes
+        # (abeilles actives d'un autre camp autour de chaque opposante)
+        autour = np.where(opposante, autour[combat], 0)
+        autour_opposantes = self._adjacentes[autour]
+        dedans = autour_opposantes >= 0
+        voisines = ps[:, None, None] * nn + np.where(dedans, autour_opposantes, 0)
+        adverses = (dedans & self.active_case.ravel()[voisines]
+                    & (self.occupation.ravel()[voisines] != joueurs[:, :, None])).sum(axis=2)
+        forces = self._force[self.role_case.ravel()[indices]] / np.maximum(adverses, 1)
+
+        somme = np.zeros(len(ps), dtype=np.float64)
+        for k in range(8):
+            somme += np.where(opposante[:, k], forces[:, k], 0.0)
+
+        force = self._force[self.role[ps, j, es]]
+        proba = force / (force + somme)
+        tirages = np.array([self.generateurs[p].random() for p in ps])
+
+        rate = tirages >= proba
+        ps, es = ps[rate], es[rate]
+        self.nectar[ps, j, es] = 0
+        self.ok[ps, j, es] = False
+        self.tours_ko[ps, j, es] = TIME_KO
+        self.active_case[ps, self.x[ps, j, es], self.y[ps, j, es]] = False
+
+    def verifier_fin(self):
+        """
+        Termine les parties finies (règles et ordre de fin_de_partie).
+        """
+        finies = np.zeros(len(self.graines), dtype=bool)
+        raison = np.full(len(self.graines), -1, dtype=np.int32)
+        gagnant = np.argmax(self.nectar_ruches, axis=1)
+
+        if self.tour >= TIME_OUT:
+            finies = self.actif.copy()
+            raison[:] = RAISONS.index("timeout")
+        else:
+            blitz = self.nectar_ruches * 2 > self.nectar_initial[:, None]
+            par_blitz = self.actif & blitz.any(axis=1)
+            gagnant = np.where(par_blitz, np.argmax(blitz, axis=1), gagnant)
+            raison[par_blitz] = RAISONS.index("blitzkrieg")
+
+            restant = self.nectar_fleurs.sum(axis=1) + self.nectar.sum(axis=(1, 2))
+            par_epuisement = self.actif & ~par_blitz & (restant == 0)
+            raison[par_epuisement] = RAISONS.index("epuisement")
+            finies = par_blitz | par_epuisement
+
+        self.tour_fin[finies] = self.tour
+        self.gagnant[finies] = gagnant[finies]
+        self.raison[finies] = raison[finies]
+        self.actif &= ~finies
+
+    def nouveau_tour(self):
+        """
+        Nouveau tour pour toutes les parties (règles de nouveau_tour).
+        """
+        self.a_bouge[:] = False
+        ko = (self.role >= 0) & ~self.ok
+        self.tours_ko[ko] -= 1
+        reveil = ko & (self.tours_ko <= 0)
+        self.ok |= reveil
+        ps, js, es = np.nonzero(reveil)
+        self.active_case[ps, self.x[ps, js, es], self.y[ps, js, es]] = True
+
+    # ========== DEROULEMENT ==========
+
+    def jouer_tour(self):
+        """
+        Joue un tour complet (4 joueurs) dans toutes les parties en cours.
+        """
+        for j in range(4):
+            self.jouer_ponte(j)
+            self.jouer_mouvement(j)
+            self.jouer_butinage(j)
+            self.escarmouche(j)
+            self.verifier_fin()
+        self.tour += 1
+        self.nouveau_tour()
+
+    def jouer_jusqu_a_la_fin(self):
+        """
+        Joue toutes les parties jusqu'à leur fin.
+
+        Returns:
+            list: Résultat de chaque partie (voir resultats())
+        """
+        while self.actif.any():
+            self.jouer_tour()
+        return self.resultats()
+
+    def resultats(self):
+        """
+        Retourne le résultat de chaque partie terminée.
+
+        Returns:
+            list: Un dict par partie : {"graine", "tour", "gagnant" (numéro
+                  du joueur), "raison", "nectar_ruches" (liste des 4 stocks)},
+                  None pour une partie pas encore finie
+        """
+        resultats = []
+        for p, graine in enumerate(self.graines):
+            if self.actif[p]:
+                resultats.append(None)
+                continue
+            resultats.append({
+                "graine": graine,
+                "tour": int(self.tour_fin[p]),
+                "gagnant": int(self.gagnant[p]),
+                "raison": RAISONS[self.raison[p]],
+                "nectar_ruches": [int(n) for n in self.nectar_ruches[p]]
+            })
+        return resultats
+
+
+def simuler_parties(graines):
+    """
+    Simule une partie à 4 IA par graine et retourne leurs résultats.
+
+    Args:
+        graines (iterable): Graines des parties
+
+    Returns:
+        list: Résultat de chaque partie (voir SimulateurBZZZ.resultats())
+
+    Exemple d'utilisation:
+        resultats = simuler_parties(range(10000))
+        victoires = [r["gagnant"] for r in resultats]
+    """
+    return SimulateurBZZZ(graines).jouer_jusqu_a_la_fin()
@@ -13,11 +13,35 @@ Tests implémentés:
     - Déplacement d'abeilles
     - Force effective
     - Fin de partie
+    - Index d'occupation du plateau
+    - Table des fleurs accessibles
+    - Totaux de nectar incrémentaux
+    - Entités à __slots__ (accès façon dictionnaire)
+    - Moteur de partie sans interface
+    - Tables de déplacement précalculées
+    - Escarmouche (forces effectives partagées)
+    - Simulateur vectorisé (mêmes résultats que le moteur)
+    - Tournoi IA contre IA
+    - Générateur aléatoire propre à chaque partie
+    - Sauvegarde binaire et reprise d'une partie
+    - Coups joués puis annulés (journal)
+    - Clé de Zobrist incrémentale et table de transposition
+    - IA MCTS (plateau intact, coups jouables, choix dans le moteur)
+    - IA MCTS sur plusieurs processus (fusion des arbres)
+    - Cartes de chaleur de l'IA (mêmes notes que case par case)
+    - Prémoves par plus court chemin (contournement, champs de terrain partagés)
+    - Prémoves planifiés ensemble (réservations dans l'espace-temps)
+    - IA par affectation (méthode hongroise, cibles gardées)
+    - Mesures des phases et des IA (collecteur, fonctions comptées)
+    - Trace Chrome d'une partie (tours, phases, décisions d'IA)
+    - Profils cProfile par phase et par décision d'IA
+    - Journal des événements d'une partie (JSONL au fil de l'eau)
 
 Pour lancer les tests:
     python test_model.py
 """
 from model import *
+from moteur import MoteurBZZZ, charger_moteur, creer_moteur
 
 print("="*60)
 print("TESTS UNITAIRES - BZZZ")
@@ -252,6 +276,1105 @@ def test_fin_de_partie():
     return ok == 2
 
 
+# ============================================================================
+# TESTS DU MOTEUR, DES IA ET DES OUTILS
+# ============================================================================
+
+def test_index_occupation():
+    """
+    Teste l'index d'occupation du plateau (plateau.occupation).
+
+    Vérifie :
+    - La ponte enregistre l'abeille sur la case de la ruche.
+    - Le déplacement libère l'ancienne case et occupe la nouvelle.
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: index d'occupation")
+
+    plateau = creer_plateau()
+    ruches = creer_ruche(plateau)
+    abeille, _ = tenter_ponte(plateau, ruches[0], "ouvriere", (0, 0))
+    ok1 = plateau.occupation[0][0] is abeille and not case_libre_abeille(plateau, 0, 0)
+
+    tenter_deplacement(plateau, abeille, (0, 1), ruches)
+    ok2 = (
+        plateau.occupation[0][0] is None
+        and plateau.occupation[0][1] is abeille
+        and case_libre_abeille(plateau, 0, 0)
+    )
+
+    ok = ok1 + ok2
+    print(f"{ok}/2")
+    return ok == 2
+
+
+def test_table_fleurs():
+    """
+    Teste les tables de fleurs accessibles construites par placer_fleurs().
+
+    Vérifie :
+    - fleurs_accessibles() donne les fleurs des 9 cases autour de chaque case.
+    - Vider une fleur met à jour fleur_avec_nectar_accessible().
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: table des fleurs")
+
+    plateau = creer_plateau()
+    creer_ruche(plateau)
+    placer_fleurs(plateau, creer_fleurs(NFLEURS))
+
+    ok1 = True
+    for x in range(NCASES):
+        for y in range(NCASES):
+            attendues = []
+            for nx in range(max(0, x-1), min(NCASES, x+2)):
+                for ny in range(max(0, y-1), min(NCASES, y+2)):
+                    attendues += [e for e in plateau[nx][ny] if e["type"] == "fleur"]
+            if fleurs_accessibles(plateau, x, y) != attendues:
+                ok1 = False
+
+    fleurs = [e for ligne in plateau for case in ligne for e in case if e["type"] == "fleur"]
+    fleur = fleurs[0]
+    fx, fy = fleur["position"]
+    fleur["nectar"] = 1
+    avant = plateau.nb_fleurs_nectar[fx][fy]
+    butiner(creer_abeille("ouvriere", (fx, fy), "ruche0"), fleur, plateau)
+    ok2 = fleur["nectar"] == 0 and plateau.nb_fleurs_nectar[fx][fy] == avant - 1
+
+    ok = ok1 + ok2
+    print(f"{ok}/2")
+    return ok == 2
+
+
+def test_comptes_nectar():
+    """
+    Teste les totaux de nectar tenus à jour pendant une partie.
+
+    Vérifie qu'après chaque phase d'une partie 4 IA, le nectar en jeu lu
+    par calculer_nectar_disponible() est égal au recomptage complet.
+    
+    Returns:
+        bool : True si le test passe, False sinon.
+    """
+    print("\nTest: comptes de nectar")
+
+    moteur = creer_moteur()
+    ok = True
+    while moteur.etape():
+        nectar_lu = calculer_nectar_disponible(moteur.plateau, moteur.ruches)
+        if nectar_lu != recompter_nectar(moteur.plateau, moteur.ruches):
+            ok = False
+            break
+
+    print("OK" if ok else "ERREUR: totaux de nectar faux")
+    return ok
+
+
+def test_entites_compat():
+    """
+    Teste les entités à __slots__ et leur accès façon dictionnaire.
+
+    Vérifie :
+    - Le camp est un entier (joueur) et reste lisible en "rucheX".
+    - Les clés optionnelles (destination_automatique) se comportent
+      comme dans l'ancien dictionnaire (in, del).
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: entités (compatibilité)")
+
+    abeille = creer_abeille("bourdon", (2, 3), "ruche2")
+    ok1 = (
+        abeille.joueur == 2
+        and abeille["camp"] == "ruche2"
+        and abeille.get("type") == "abeille"
+        and abeille["etat"] == "OK"
+    )
+
+    abeille["destination_automatique"] = (8, 8)
+    present = "destination_automatique" in abeille
+    del abeille["destination_automatique"]
+    ok2 = present and "destination_automatique" not in abeille and abeille.destination_automatique is None
+
+    ok = ok1 + ok2
+    print(f"{ok}/2")
+    return ok == 2
+
+
+def test_moteur_partie():
+    """
+    Teste le moteur de partie sans interface graphique.
+
+    Vérifie :
+    - Un joueur humain qui passe sans abeille enchaîne toutes les phases
+      et commence le tour suivant.
+    - Une partie 4 IA se joue jusqu'à la fin sans fenêtre.
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: MoteurBZZZ")
+
+    moteur = MoteurBZZZ({"nb_joueurs": 1, "ia": [False, False, False, False]})
+    moteur.passer_phase()
+    ok1 = moteur.tour == 2 and moteur.phase == "ponte" and moteur.joueur_actuel == 0
+
+    moteur = creer_moteur()
+    gagnant, raison = moteur.jouer_jusqu_a_la_fin()
+    ok2 = (
+        moteur.fini
+        and gagnant in moteur.ruches
+        and raison in ("timeout", "blitzkrieg", "epuisement")
+        and moteur.tour <= TIME_OUT
+    )
+
+    ok = ok1 + ok2
+    print(f"{ok}/2")
+    return ok == 2
+
+
+def test_tables_deplacement():
+    """
+    Teste les tables de déplacement précalculées (deplacements.py).
+
+    Vérifie :
+    - Les voisins autorisés de chaque case sont ceux des règles (dans le
+      plateau, hors zones ennemies), pour chaque joueur et type d'abeille.
+    - tenter_deplacement refuse la zone ennemie et la sortie du plateau.
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: tables de déplacement")
+
+    plateau = creer_plateau()
+    ok1 = True
+    for joueur in range(4):
+        for role in ("ouvriere", "eclaireuse"):
+            if role == "eclaireuse":
+                directions = DIRECTIONS_8
+            else:
+                directions = DIRECTIONS_4
+            for x in range(NCASES):
+                for y in range(NCASES):
+                    attendu = []
+                    for dx, dy in directions:
+                        nx, ny = x + dx, y + dy
+                        if not (0 <= nx < NCASES and 0 <= ny < NCASES):
+                            continue
+                        ennemie = any(i != joueur and dans_zone_ruche((nx, ny), i) for i in range(4))
+                        if not ennemie:
+                            attendu.append((nx, ny))
+                    abeille = creer_abeille(role, (x, y), joueur)
+                    if list(voisins_autorises(plateau.tables, abeille)) != attendu:
+                        ok1 = False
+
+    ruches = creer_ruche(plateau)
+    abeille = creer_abeille("eclaireuse", (11, 11), 0)
+    ruches[0].abeilles.append(abeille)
+    placer_abeille(plateau, abeille)
+    succes_ennemi, erreur = tenter_deplacement(plateau, abeille, (12, 12), ruches)
+    ok2 = not succes_ennemi and "ennemi" in erreur
+
+    bord = creer_abeille("ouvriere", (15, 8), 2)
+    ruches[2].abeilles.append(bord)
+    placer_abeille(plateau, bord)
+    succes_bord, _ = tenter_deplacement(plateau, bord, (16, 8), ruches)
+    ok3 = not succes_bord and plateau.occupation[15][8] is bord
+
+    ok = ok1 + ok2 + ok3
+    print(f"{ok}/3")
+    return ok == 3
+
+
+def test_escarmouche():
+    """
+    Teste l'escarmouche avec forces effectives partagées.
+
+    Situation : un bourdon du joueur 0 entouré de 2 ouvrières du joueur 1.
+    Vérifie :
+    - Probabilités d'esquive : bourdon 5/(5+1+1), ouvrière 1/(1+5/2).
+    - La FE du bourdon n'est calculée qu'une fois pour les 2 ouvrières.
+    - phase_escarmouche met KO les mêmes abeilles que le tirage attendu.
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: escarmouche")
+
+    plateau = creer_plateau()
+    ruches = creer_ruche(plateau)
+    bourdon = creer_abeille("bourdon", (8, 8), 0)
+    ouvrieres = [creer_abeille("ouvriere", (8, 9), 1), creer_abeille("ouvriere", (9, 8), 1)]
+    ruches[0].abeilles.append(bourdon)
+    placer_abeille(plateau, bourdon)
+    for ouvriere in ouvrieres:
+        ruches[1].abeilles.append(ouvriere)
+        placer_abeille(plateau, ouvriere)
+
+    forces = {}
+    p_bourdon = calculer_proba_esquive(bourdon, trouver_opposantes(plateau, bourdon), plateau)
+    p_ouvrieres = [calculer_proba_esquive(o, trouver_opposantes(plateau, o), plateau, forces) for o in ouvrieres]
+    ok1 = abs(p_bourdon - 5 / 7) < 1e-9 and all(abs(p - 1 / 3.5) < 1e-9 for p in p_ouvrieres)
+    ok2 = list(forces) == [bourdon] and forces[bourdon] == 2.5
+
+    generateur = random.Random(3)
+    tirages = [generateur.random(), generateur.random()]
+    phase_escarmouche(plateau, ruches[1], random.Random(3))
+    ok3 = all((o.etat == "KO") == (t >= p) for o, t, p in zip(ouvrieres, tirages, p_ouvrieres))
+
+    ok = ok1 + ok2 + ok3
+    print(f"{ok}/3")
+    return ok == 3
+
+
+def test_simulateur():
+    """
+    Teste le simulateur vectorisé (simulateur.py) contre le moteur.
+
+    Vérifie que chaque partie du lot finit comme la partie du moteur de
+    même graine (tour, gagnant, raison, nectar des ruches).
+    Le test est ignoré si NumPy n'est pas installé.
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: simulateur vectorisé")
+
+    from simulateur import np, simuler_parties
+    if np is None:
+        print("numpy absent, test ignoré")
+        return True
+
+    graines = [1, 2, 5]
+    resultats = simuler_parties(graines)
+    ok = 0
+    for graine, resultat in zip(graines, resultats):
+        moteur = creer_moteur(graine=graine)
+        gagnant, raison = moteur.jouer_jusqu_a_la_fin()
+        attendu = (moteur.tour, gagnant.joueur, raison, [r.nectar for r in moteur.ruches])
+        obtenu = (resultat["tour"], resultat["gagnant"], resultat["raison"], resultat["nectar_ruches"])
+        ok += attendu == obtenu
+
+    print(f"{ok}/{len(graines)}")
+    return ok == len(graines)
+
+
+def test_tournoi():
+    """
+    Teste le lanceur de tournois (tournoi.py).
+
+    Vérifie :
+    - Une partie du tournoi donne le même résultat que le moteur avec la
+      même graine.
+    - Une désignation d'IA invalide est refusée (ValueError).
+    - Les IA MCTS du tournoi cherchent un nombre fixe d'itérations.
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: tournoi")
+
+    from tournoi import ITERATIONS_MCTS, creer_ia_tournoi, lancer_tournoi
+
+    resultats = list(lancer_tournoi([1], processus=1))
+    moteur = creer_moteur(graine=1)
+    gagnant, raison = moteur.jouer_jusqu_a_la_fin()
+    ok1 = (
+        len(resultats) == 1
+        and resultats[0]["gagnant"] == gagnant.joueur
+        and resultats[0]["raison"] == raison
+        and resultats[0]["tours"] == moteur.tour
+        and resultats[0]["nectar_ruches"] == [r.nectar for r in moteur.ruches]
+    )
+
+    try:
+        list(lancer_tournoi([1], ["ia:IA_BZZZ", "ia:IA_BZZZ", "model:Plateau", "ia:IA_BZZZ"], processus=1))
+        ok2 = False
+    except ValueError:
+        ok2 = True
+
+    ok3 = (creer_ia_tournoi("ia_mcts:IA_MCTS").iterations == ITERATIONS_MCTS
+           and not hasattr(creer_ia_tournoi("ia:IA_BZZZ"), "iterations"))
+
+    ok = ok1 + ok2 + ok3
+    print(f"{ok}/3")
+    return ok == 3
+
+
+def test_generateur_partie():
+    """
+    Teste le générateur aléatoire propre à chaque partie.
+
+    Vérifie :
+    - Deux parties de même graine jouées en alternance (étape par étape)
+      finissent comme une partie jouée seule.
+    - Une partie ne touche pas au générateur global du module random.
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: générateur par partie")
+
+    seule = creer_moteur(graine=4)
+    seule.jouer_jusqu_a_la_fin()
+
+    random.seed(7)
+    partie_a = creer_moteur(graine=4)
+    partie_b = creer_moteur(graine=4)
+    while partie_a.etape() | partie_b.etape():
+        pass
+    ok1 = all(
+        (m.tour, m.raison, [r.nectar for r in m.ruches]) == (seule.tour, seule.raison, [r.nectar for r in seule.ruches])
+        for m in (partie_a, partie_b)
+    )
+    ok2 = random.random() == random.Random(7).random()
+
+    ok = ok1 + ok2
+    print(f"{ok}/2")
+    return ok == 2
+
+
+def test_sauvegarde():
+    """
+    Teste la sauvegarde binaire des parties (sauvegarde.py).
+
+    Vérifie :
+    - Relire puis réécrire un instantané redonne exactement les mêmes octets
+      (plateau, abeilles, index d'occupation et tables de fleurs compris).
+    - Une partie reprise en cours de route finit comme la partie d'origine.
+    - Des données qui ne sont pas une sauvegarde sont refusées (ValueError).
+    - Le type des IA est gardé (une partie "affectation" reprend avec IA_AFFECTATION).
+    - Un instantané abîmé (phase, rôle, case hors du plateau) est refusé
+      avec ValueError.
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: sauvegarde")
+
+    moteur = creer_moteur(graine=5)
+    for _ in range(150):
+        moteur.etape()
+    donnees = moteur.sauvegarder()
+    reprise = charger_moteur(donnees)
+
+    occupees = [[case is not None for case in ligne] for ligne in moteur.plateau.occupation]
+    ok1 = (
+        reprise.sauvegarder() == donnees
+        and [[case is not None for case in ligne] for ligne in reprise.plateau.occupation] == occupees
+        and reprise.plateau.nb_fleurs_nectar == moteur.plateau.nb_fleurs_nectar
+        and calculer_nectar_disponible(reprise.plateau, reprise.ruches)
+            == calculer_nectar_disponible(moteur.plateau, moteur.ruches)
+    )
+
+    moteur.jouer_jusqu_a_la_fin()
+    reprise.jouer_jusqu_a_la_fin()
+    ok2 = (
+        (reprise.tour, reprise.raison, reprise.gagnant.joueur)
+        == (moteur.tour, moteur.raison, moteur.gagnant.joueur)
+        and [r.nectar for r in reprise.ruches] == [r.nectar for r in moteur.ruches]
+    )
+
+    try:
+        charger_moteur(donnees[:-1])
+        ok3 = False
+    except ValueError:
+        ok3 = True
+
+    from ia_affectation import IA_AFFECTATION
+    affectation = MoteurBZZZ({"nb_joueurs": 4, "ia": [False, True, True, True], "type_ia": "affectation"},
+                             graine=5)
+    reprise = charger_moteur(affectation.sauvegarder())
+    ok4 = (reprise.type_ia == "affectation" and reprise.ias[0] is None
+           and all(isinstance(ia, IA_AFFECTATION) for ia in reprise.ias[1:]))
+
+    from sauvegarde import _EN_TETE, _OCTETS_FLEUR, _RUCHES
+    nb_fleurs = _EN_TETE.unpack_from(donnees)[12]
+    premiere_abeille = _EN_TETE.size + _RUCHES.size + nb_fleurs * _OCTETS_FLEUR
+    abimees = []
+    for position, valeur in ((9, 7), (premiere_abeille, 200), (premiere_abeille + 2, 3)):
+        octets = bytearray(donnees)
+        octets[position] = valeur # phase 7, abeille en x = 200, rôle 3
+        abimees.append(bytes(octets))
+    refusees = 0
+    for abimee in abimees:
+        try:
+            charger_moteur(abimee)
+        except ValueError:
+            refusees += 1
+    ok5 = refusees == len(abimees)
+
+    ok = ok1 + ok2 + ok3 + ok4 + ok5
+    print(f"{ok}/5")
+    return ok == 5
+
+
+def test_journal_coups():
+    """
+    Teste le journal des coups (coups.py).
+
+    Vérifie :
+    - Après des pontes, déplacements, butinages, escarmouches et
+      changements de tour au hasard, annuler ramène exactement la partie
+      d'avant (instantané, occupation, tables de fleurs, totaux de nectar).
+    - Annuler jusqu'à une marque ne défait que les coups joués après elle.
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: journal des coups")
+
+    from coups import Journal
+
+    def etat(moteur):
+        plateau = moteur.plateau
+        return (
+            moteur.sauvegarder(avec_hasard=False),
+            [[case is not None for case in ligne] for ligne in plateau.occupation],
+            [ligne[:] for ligne in plateau.nb_fleurs_nectar],
+            plateau.nectar_fleurs,
+            plateau.nectar_abeilles
+        )
+
+    moteur = creer_moteur(graine=2)
+    for _ in range(120):
+        moteur.etape()
+    journal = Journal(moteur.plateau, moteur.ruches)
+    generateur = random.Random(2)
+    depart = etat(moteur)
+
+    for coup in range(200):
+        ruche = moteur.ruches[generateur.randrange(4)]
+        tirage = generateur.random()
+        if tirage < 0.1 or not ruche.abeilles:
+            journal.pondre(ruche, generateur.choice(ROLES))
+        elif tirage < 0.6:
+            abeille = generateur.choice(ruche.abeilles)
+            cases = calculer_cases_disponibles(abeille, moteur.plateau)
+            if cases:
+                journal.deplacer(abeille, generateur.choice(cases))
+        elif tirage < 0.8:
+            journal.butiner(generateur.choice(ruche.abeilles))
+        elif tirage < 0.95:
+            journal.escarmouche(ruche, generateur)
+        else:
+            journal.nouveau_tour()
+        if coup == 100:
+            marque, milieu = len(journal), etat(moteur)
+
+    journal.annuler_jusqu_a(marque)
+    ok1 = etat(moteur) == milieu
+    journal.annuler_jusqu_a(0)
+    ok2 = etat(moteur) == depart and len(journal) == 0
+
+    ok = ok1 + ok2
+    print(f"{ok}/2")
+    return ok == 2
+
+
+def test_zobrist():
+    """
+    Teste la clé de Zobrist des positions et la table de transposition.
+
+    Vérifie :
+    - Sans activer_hachage(), le plateau n'a ni clés ni clé de position ;
+      une fois activée, la clé tenue à jour par le modèle est égale à la
+      clé recalculée entièrement tout au long d'une partie.
+    - Deux abeilles déplacées dans un ordre puis dans l'autre donnent la même
+      clé, et annuler les coups (journal) redonne la clé de départ.
+    - La table de transposition retrouve une position, et ne remplace une
+      entrée plus profonde de la même recherche que par une aussi profonde.
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: zobrist")
+
+    from coups import Journal
+    from zobrist import TableTransposition, calculer_cle
+
+    sans_hachage = creer_moteur(graine=6)
+    sans_hachage.jouer_jusqu_a_la_fin()
+    moteur = creer_moteur(graine=6)
+    activer_hachage(moteur.plateau, moteur.ruches)
+    ok1 = sans_hachage.plateau.zobrist is None and sans_hachage.plateau.cle == 0
+    while moteur.etape():
+        if moteur.plateau.cle != calculer_cle(moteur.plateau, moteur.ruches):
+            ok1 = False
+
+    plateau = creer_plateau()
+    ruches = creer_ruche(plateau)
+    activer_hachage(plateau, ruches)
+    a = creer_abeille("ouvriere", (6, 6), 0)
+    b = creer_abeille("eclaireuse", (9, 9), 1)
+    placer_abeille(plateau, a)
+    placer_abeille(plateau, b)
+    journal = Journal(plateau, ruches)
+    depart = plateau.cle
+    journal.deplacer(a, (6, 7))
+    journal.deplacer(b, (8, 8))
+    cle_ab = plateau.cle
+    journal.annuler_jusqu_a(0)
+    ok2 = plateau.cle == depart
+    journal.deplacer(b, (8, 8))
+    journal.deplacer(a, (6, 7))
+    ok2 = ok2 and plateau.cle == cle_ab != depart
+
+    table = TableTransposition(bits=4)
+    table.enregistrer(cle_ab, 3, 12.5, "coup")
+    trouvee = table.chercher(cle_ab)
+    collision = cle_ab ^ (1 << 20) # même case de la table, autre position
+    gardee = table.enregistrer(collision, 1, 0.0)
+    table.nouvelle_recherche()
+    remplacee = table.enregistrer(collision, 1, 0.0)
+    ok3 = (
+        trouvee == (3, 12.5, "coup")
+        and not gardee and remplacee
+        and table.chercher(cle_ab) is None
+        and table.chercher(collision) == (1, 0.0, None)
+    )
+
+    ok = ok1 + ok2 + ok3
+    print(f"{ok}/3")
+    return ok == 3
+
+
+def test_ia_mcts():
+    """
+    Teste l'IA MCTS (ia_mcts.py).
+
+    Vérifie :
+    - La recherche rend le plateau exactement dans son état de départ et
+      ses déplacements sont tous jouables.
+    - Avec une seule itération, elle joue les coups de IA_BZZZ.
+    - Elle se choisit par la configuration du moteur et dans un tournoi,
+      et deux parties de même graine (itérations fixes) sont identiques.
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: IA MCTS")
+
+    from ia import IA_BZZZ
+    from ia_mcts import IA_MCTS
+    from sauvegarde import encoder_partie
+    from tournoi import charger_classe_ia
+
+    moteur = creer_moteur(graine=2)
+    while moteur.tour < 20 or moteur.phase != "mouvement":
+        moteur.etape()
+    activer_hachage(moteur.plateau, moteur.ruches)
+    ruche = moteur.ruche_actuelle()
+    avant = (encoder_partie(moteur, False), moteur.plateau.cle, moteur.plateau.nectar_fleurs,
+             [ligne[:] for ligne in moteur.plateau.nb_fleurs_nectar])
+    ia = IA_MCTS(random.Random(1), iterations=30)
+    mouvements = ia.jouer_tour_mouvement(moteur.plateau, ruche, moteur.ruches)
+    apres = (encoder_partie(moteur, False), moteur.plateau.cle, moteur.plateau.nectar_fleurs,
+             [ligne[:] for ligne in moteur.plateau.nb_fleurs_nectar])
+    glouton = IA_BZZZ().jouer_tour_mouvement(moteur.plateau, ruche, moteur.ruches)
+    une_iteration = IA_MCTS(random.Random(1), iterations=1).jouer_tour_mouvement(moteur.plateau, ruche, moteur.ruches)
+    ok1 = avant == apres and ia.derniere_recherche["iterations"] == 30 and all(
+        moteur.deplacer(abeille, case)[0] for abeille, case in mouvements)
+    ok2 = len(une_iteration) > 0 and all(mouvement in glouton for mouvement in une_iteration)
+
+    config = {"nb_joueurs": 4, "ia": [True, True, True, True], "type_ia": "mcts"}
+    parties = [creer_moteur(config, graine=3) for _ in range(2)]
+    for partie in parties:
+        for ia in partie.ias:
+            ia.iterations = 5
+        while partie.tour < 4:
+            partie.etape()
+    ok3 = (
+        isinstance(parties[0].ias[0], IA_MCTS)
+        and charger_classe_ia("ia_mcts:IA_MCTS") is IA_MCTS
+        and encoder_partie(parties[0]) == encoder_partie(parties[1])
+    )
+
+    ok = ok1 + ok2 + ok3
+    print(f"{ok}/3")
+    return ok == 3
+
+
+def test_mcts_parallele():
+    """
+    Teste la recherche MCTS sur plusieurs processus (ia_mcts.py).
+
+    Vérifie :
+    - Un arbre exporté puis fusionné dans un nœud vide garde ses statistiques
+      et l'ordre de ses enfants (coup de IA_BZZZ en premier).
+    - Avec 2 processus et des itérations fixes, chaque processus compte ses
+      itérations, le plateau est intact et le résultat est reproductible.
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: MCTS sur plusieurs processus")
+
+    from ia_mcts import IA_MCTS, Noeud, fermer_executeur
+    from sauvegarde import encoder_partie
+
+    moteur = creer_moteur(graine=2)
+    while moteur.tour < 20 or moteur.phase != "mouvement":
+        moteur.etape()
+    ruche = moteur.ruche_actuelle()
+    abeilles = [abeille for abeille in ruche.abeilles if abeille.etat == "OK" and not abeille.a_bouge]
+
+    ia = IA_MCTS(iterations=40)
+    racine, _ = ia._chercher(moteur.plateau, moteur.ruches, abeilles,
+                             ia._coups_prevus(moteur.plateau, ruche, moteur.ruches, abeilles), 5, 0)
+    copie = Noeud()
+    copie.fusionner(racine.exporter())
+    ok1 = copie.exporter() == racine.exporter() and copie.visites == 40
+
+    avant = encoder_partie(moteur, False)
+    resultats = []
+    for _ in range(2):
+        ia = IA_MCTS(random.Random(1), iterations=10, processus=2)
+        mouvements = ia.jouer_tour_mouvement(moteur.plateau, ruche, moteur.ruches)
+        resultats.append([(abeille.position, case) for abeille, case in mouvements])
+    fermer_executeur()
+    ok2 = (
+        ia.derniere_recherche["iterations"] == 20
+        and encoder_partie(moteur, False) == avant
+        and resultats[0] == resultats[1]
+    )
+
+    ok = ok1 + ok2
+    print(f"{ok}/2")
+    return ok == 2
+
+
+def test_cartes_ia():
+    """
+    Teste les cartes de chaleur de l'IA (cartes.py).
+
+    Vérifie :
+    - La pression ennemie compte les ennemis OK des 9 cases autour (bords
+      compris), pas les abeilles KO ni celles du joueur.
+    - Les notes des cartes sont celles de IA_BZZZ._evaluer_case pour toutes
+      les cases, abeille chargée ou vide.
+    - Le calcul en Python pur donne les mêmes cartes que NumPy.
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: Cartes de chaleur de l'IA")
+
+    import cartes
+    from cartes import cartes_ia
+    from ia import IA_BZZZ
+
+    plateau = creer_plateau()
+    ruches = creer_ruche(plateau)
+    placer_fleurs(plateau, creer_fleurs(NFLEURS), random.Random(4))
+    for role, position, joueur in (("bourdon", (5, 5), 1), ("ouvriere", (5, 7), 2),
+                                   ("eclaireuse", (0, 8), 3), ("ouvriere", (6, 6), 0)):
+        abeille = creer_abeille(role, position, joueur)
+        ruches[joueur].abeilles.append(abeille)
+        placer_abeille(plateau, abeille)
+    ko = creer_abeille("ouvriere", (4, 6), 1)
+    ko.etat = "KO"
+    ruches[1].abeilles.append(ko)
+    placer_abeille(plateau, ko)
+
+    c = cartes_ia(plateau, 0, ruches)
+    ok1 = (c.pression[6][6] == 2 and c.pression[5][6] == 2 and c.pression[4][4] == 1
+           and c.pression[1][8] == 1 and c.pression[0][7] == 1 and c.pression[10][10] == 0
+           and cartes_ia(plateau, 0).pression == c.pression)
+
+    ia = IA_BZZZ()
+    abeille = ruches[0].abeilles[0]
+    notes_identiques = True
+    for nectar in (0, 2):
+        abeille.nectar = nectar
+        for x in range(NCASES):
+            for y in range(NCASES):
+                note = ia._evaluer_case(plateau, (x, y), abeille, ruches[0], 0)
+                if note != ia._evaluer_case(plateau, (x, y), abeille, ruches[0], 0, c):
+                    notes_identiques = False
+    abeille.nectar = 0
+    ok2 = notes_identiques
+
+    np_cartes = cartes.np
+    cartes.np = None
+    try:
+        c_python = cartes_ia(plateau, 0, ruches)
+    finally:
+        cartes.np = np_cartes
+    ok3 = (c_python.pression, c_python.chargee, c_python.vide) == (c.pression, c.chargee, c.vide)
+
+    ok = ok1 + ok2 + ok3
+    print(f"{ok}/3")
+    return ok == 3
+
+
+def test_chemins_premove():
+    """
+    Teste les prémoves par plus court chemin (chemins.py).
+
+    Vérifie :
+    - Une abeille contourne une zone ennemie et une abeille qui lui barre
+      la route, par le plus court chemin libre (6 et 8 pas).
+    - Le champ de terrain d'une destination est calculé une seule fois.
+    - Une destination en zone ennemie est inaccessible (aucun pas).
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: Prémoves par plus court chemin")
+
+    from chemins import INACCESSIBLE, distances_terrain
+
+    plateau = creer_plateau()
+    ruches = creer_ruche(plateau)
+    voyageuse = creer_abeille("ouvriere", (5, 13), 0)
+    bloquee = creer_abeille("ouvriere", (8, 2), 0)
+    obstacle = creer_abeille("bourdon", (8, 3), 2)
+    for abeille in (voyageuse, bloquee, obstacle):
+        ruches[abeille.joueur].abeilles.append(abeille)
+        placer_abeille(plateau, abeille)
+    voyageuse.destination_automatique = (2, 10)
+    bloquee.destination_automatique = (8, 8)
+
+    # (5, 13) -> (2, 10) : la zone de la ruche 1 (x < 4, y >= 12) est sur le trajet direct
+    longueurs = (distances_terrain(NCASES, (2, 10), 0, False)[5][13],
+                 distances_terrain(NCASES, (8, 8), 0, False)[8][2])
+    tours = 0
+    while tours < 20 and (voyageuse.destination_automatique or bloquee.destination_automatique):
+        executer_deplacements_automatiques(ruches[0], plateau, ruches)
+        nouveau_tour(ruches, plateau)
+        tours += 1
+    ok1 = (voyageuse.position == (2, 10) and bloquee.position == (8, 8)
+           and longueurs == (6, 6) and tours == 8)
+
+    ok2 = distances_terrain(NCASES, (12, 12), 0, True) is distances_terrain(NCASES, (12, 12), 0, True)
+
+    voyageuse.destination_automatique = (0, 14) # zone de la ruche 1
+    nouveau_tour(ruches, plateau)
+    executer_deplacements_automatiques(ruches[0], plateau, ruches)
+    ok3 = (voyageuse.position == (2, 10)
+           and distances_terrain(NCASES, (0, 14), 0, False)[2][10] == INACCESSIBLE)
+
+    ok = ok1 + ok2 + ok3
+    print(f"{ok}/3")
+    return ok == 3
+
+
+def test_planification_groupe():
+    """
+    Teste la planification commune des prémoves d'une ruche (chemins.py).
+
+    Vérifie :
+    - Douze abeilles dont les destinations sont serrées autour d'un même
+      point (et des ennemis en obstacles) arrivent toutes, sans blocage.
+    - À chaque tour, les cases visées sont libres et toutes différentes.
+    - Sans budget d'états, aucune abeille ne bouge.
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: Prémoves planifiés ensemble")
+
+    from chemins import planifier_deplacements
+
+    rng = random.Random(7)
+    plateau = creer_plateau()
+    ruches = creer_ruche(plateau)
+    cases = [(x, y) for x in range(NCASES) for y in range(NCASES) if plateau.tables.zones[x][y] in (-1, 0)]
+    rng.shuffle(cases)
+    destinations = sorted(cases, key=lambda case: abs(case[0] - 8) + abs(case[1] - 7))[:12]
+    departs = [case for case in cases if case not in destinations]
+    abeilles = []
+    for i, destination in enumerate(destinations):
+        abeille = creer_abeille(ROLES[i % 3], departs[i], 0)
+        abeille.destination_automatique = destination
+        abeilles.append(abeille)
+    ennemis = [creer_abeille("bourdon", case, 2) for case in departs[12:22]]
+    for abeille in abeilles + ennemis:
+        ruches[abeille.joueur].abeilles.append(abeille)
+        placer_abeille(plateau, abeille)
+
+    ok3 = planifier_deplacements(plateau, abeilles, max_noeuds=0) == []
+
+    pas_valides = True
+    tours = 0
+    while tours < 60 and any(abeille.destination_automatique for abeille in abeilles):
+        pas = planifier_deplacements(plateau, [a for a in abeilles if a.destination_automatique])
+        cibles = [case for _, case in pas]
+        if len(set(cibles)) != len(cibles) or any(plateau.occupation[x][y] is not None for x, y in cibles):
+            pas_valides = False
+        executer_deplacements_automatiques(ruches[0], plateau, ruches)
+        nouveau_tour(ruches, plateau)
+        tours += 1
+    ok1 = all(abeille.position == destination for abeille, destination in zip(abeilles, destinations))
+    ok2 = pas_valides
+
+    ok = ok1 + ok2 + ok3
+    print(f"{ok}/3")
+    return ok == 3
+
+
+def test_ia_affectation():
+    """
+    Teste l'IA par affectation des abeilles aux fleurs (ia_affectation.py).
+
+    Vérifie :
+    - affectation_min_cout trouve le coût minimal (comparé à toutes les
+      affectations possibles sur de petits tableaux).
+    - Les abeilles reçoivent des cibles toutes différentes, leurs coups
+      visent des cases libres et différentes, et un deuxième appel sur la
+      même position garde toutes les cibles (aucune réaffectation).
+    - Une partie complète avec type_ia="affectation" se termine.
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: IA par affectation")
+
+    from itertools import permutations
+    from ia_affectation import IA_AFFECTATION, RUCHE, affectation_min_cout
+
+    rng = random.Random(3)
+    optimal = True
+    for _ in range(50):
+        n = rng.randint(1, 4)
+        m = rng.randint(n, 6)
+        couts = [[rng.randint(-9, 9) for _ in range(m)] for _ in range(n)]
+        colonnes = affectation_min_cout(couts)
+        meilleur = min(sum(couts[i][p[i]] for i in range(n)) for p in permutations(range(m), n))
+        if len(set(colonnes)) != n or sum(couts[i][colonnes[i]] for i in range(n)) != meilleur:
+            optimal = False
+    ok1 = optimal
+
+    moteur = creer_moteur(graine=4)
+    while moteur.tour < 40 or moteur.phase != "mouvement":
+        moteur.etape()
+    ruche = moteur.ruche_actuelle()
+    ia = IA_AFFECTATION()
+    mouvements = ia.jouer_tour_mouvement(moteur.plateau, ruche, moteur.ruches)
+    cases = [case for _, case in mouvements]
+    fleurs = [cible for cible in ia.cibles.values() if cible != RUCHE]
+    premiere = ia.derniere_affectation
+    ia.jouer_tour_mouvement(moteur.plateau, ruche, moteur.ruches)
+    ok2 = (premiere > 0 and fleurs and len(set(fleurs)) == len(fleurs)
+           and len(set(cases)) == len(cases)
+           and all(moteur.plateau.occupation[x][y] is None for x, y in cases)
+           and ia.derniere_affectation == 0)
+
+    moteur = creer_moteur({"nb_joueurs": 4, "ia": [True] * 4, "type_ia": "affectation"}, graine=4)
+    gagnant, raison = moteur.jouer_jusqu_a_la_fin()
+    ok3 = isinstance(moteur.ias[0], IA_AFFECTATION) and raison in ("timeout", "blitzkrieg", "epuisement")
+
+    ok = ok1 + ok2 + ok3
+    print(f"{ok}/3")
+    return ok == 3
+
+
+def test_instrumentation():
+    """
+    Teste les mesures du déroulement d'une partie (instrumentation.py).
+
+    Vérifie :
+    - Sans collecteur actif, mesure() rend le contexte vide partagé
+    - Avec un collecteur : durées des phases et des décisions d'IA,
+      appels des fonctions chaudes comptés, et partie identique à la même
+      graine jouée sans mesure
+    - Les fonctions d'origine sont remises à la fin (model et moteur)
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: Mesures des phases et des IA")
+
+    import instrumentation
+    import moteur as module_moteur
+    from instrumentation import Collecteur, mesure
+
+    ok1 = mesure("phase.ponte") is mesure("ia.mouvement")
+
+    reference = creer_moteur(graine=5)
+    reference.jouer_jusqu_a_la_fin()
+    collecteur = Collecteur()
+    with collecteur:
+        moteur = creer_moteur(graine=5)
+        moteur.jouer_jusqu_a_la_fin()
+    resume = collecteur.resume()
+    etapes = ("phase.ponte", "phase.mouvement", "phase.butinage", "phase.escarmouche",
+              "phase.nouveau_tour", "phase.fin_de_partie", "ia.mouvement")
+    ok2 = (all(resume["durees"][etape]["nombre"] > 0 for etape in etapes)
+           and resume["durees"]["phase.nouveau_tour"]["nombre"] == moteur.tour - 1
+           and resume["compteurs"]["appels.trouver_opposantes"] > 0
+           and resume["compteurs"]["appels.cartes_ia"] > 0
+           and [r.nectar for r in moteur.ruches] == [r.nectar for r in reference.ruches])
+
+    ok3 = (not hasattr(fleurs_accessibles, "originale")
+           and not hasattr(module_moteur.trouver_opposantes, "originale")
+           and not instrumentation._collecteurs and not instrumentation._originales)
+
+    ok = ok1 + ok2 + ok3
+    print(f"{ok}/3")
+    return ok == 3
+
+
+def test_trace():
+    """
+    Teste la trace Chrome d'une partie (instrumentation.Trace).
+
+    Vérifie :
+    - Un intervalle par tour joué (tour 1 à tour N), puis la marque de fin
+    - Les phases et décisions d'IA sont des intervalles compris dans leur tour
+    - La trace seule ne remplace pas les fonctions du modèle, et s'écrit
+      en JSON
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: Trace Chrome d'une partie")
+
+    import json
+    import model
+    from instrumentation import Trace
+
+    trace = Trace()
+    with trace:
+        moteur = creer_moteur(graine=4)
+        enveloppee = hasattr(model.fleurs_accessibles, "originale")
+        moteur.jouer_jusqu_a_la_fin()
+    evenements = trace.en_json()["traceEvents"]
+
+    tours = [e for e in evenements if e.get("cat") == "tour"]
+    fins = [e for e in evenements if e["name"] == "fin"]
+    ok1 = ([e["name"] for e in tours] == [f"tour {n}" for n in range(1, moteur.tour + 1)]
+           and len(fins) == 1 and fins[0]["args"]["raison"] == moteur.raison)
+
+    intervalles = [e for e in evenements if e["ph"] == "X" and e.get("cat") in ("phase", "ia")]
+    ok2 = bool(intervalles) and all(
+        any(t["ts"] <= e["ts"] and e["ts"] + e["dur"] <= t["ts"] + t["dur"] + 1 for t in tours)
+        for e in intervalles[::50])
+
+    ok3 = not enveloppee and json.loads(json.dumps(trace.en_json()))["displayTimeUnit"] == "ms"
+
+    ok = ok1 + ok2 + ok3
+    print(f"{ok}/3")
+    return ok == 3
+
+
+def test_profileur():
+    """
+    Teste les profils par étape (instrumentation.Profileur).
+
+    Vérifie :
+    - L'escarmouche profile trouver_opposantes, la décision de mouvement
+      de l'IA profile cartes_ia
+    - Une étape imbriquée sort du profil de l'étape englobante (la phase de
+      mouvement ne contient pas cartes_ia)
+    - ecrire() produit un fichier pstats lisible et un résumé par étape
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: Profils par phase et par décision d'IA")
+
+    import os
+    import pstats
+    import tempfile
+    from instrumentation import Profileur
+
+    def fonctions(profileur, nom):
+        return {fonction for _, _, fonction in profileur.statistiques(nom).stats}
+
+    profileur = Profileur()
+    with profileur:
+        creer_moteur(graine=6).jouer_jusqu_a_la_fin()
+
+    ok1 = ("trouver_opposantes" in fonctions(profileur, "phase.escarmouche")
+           and "cartes_ia" in fonctions(profileur, "ia.mouvement"))
+    ok2 = "cartes_ia" not in fonctions(profileur, "phase.mouvement") and not profileur.pile
+
+    with tempfile.TemporaryDirectory() as dossier:
+        chemins = profileur.ecrire(dossier, 5)
+        ok3 = (len(chemins) == len(profileur.profils)
+               and pstats.Stats(os.path.join(dossier, "phase.escarmouche.pstats")).total_calls > 0
+               and "trouver_opposantes" in open(os.path.join(dossier, "phase.escarmouche.txt")).read()
+               and os.path.exists(os.path.join(dossier, "resume.txt")))
+
+    ok = ok1 + ok2 + ok3
+    print(f"{ok}/3")
+    return ok == 3
+
+
+def test_evenements():
+    """
+    Teste le journal des événements (evenements.EcrivainEvenements).
+
+    Vérifie :
+    - Le journal commence par "debut", finit par "fin" (raison de la partie)
+      et contient pontes, mouvements, butinages, esquives et fins de tour
+    - Le nectar des ruches se retrouve avec les dépôts et les pontes
+    - Journaliser ne change pas la partie ; tampon court et .gz relus pareil
+    - Une partie reprise signale son début à son tour et son joueur réels
+    
+    Returns:
+        bool : True si tous les tests passent, False sinon.
+    """
+    print("\nTest: Journal des événements d'une partie")
+
+    import os
+    import tempfile
+    from evenements import EcrivainEvenements, lire_evenements
+
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin = os.path.join(dossier, "partie.jsonl")
+        with EcrivainEvenements(chemin):
+            moteur = creer_moteur(graine=3)
+            moteur.jouer_jusqu_a_la_fin()
+        evenements = list(lire_evenements(chemin))
+
+        chemin_gz = os.path.join(dossier, "partie.jsonl.gz")
+        with EcrivainEvenements(chemin_gz, taille_tampon=7):
+            creer_moteur(graine=3).jouer_jusqu_a_la_fin()
+        evenements_gz = list(lire_evenements(chemin_gz))
+
+        partie = creer_moteur(graine=3)
+        for _ in range(70):
+            partie.etape()
+        chemin_reprise = os.path.join(dossier, "reprise.jsonl")
+        with EcrivainEvenements(chemin_reprise):
+            reprise = charger_moteur(partie.sauvegarder())
+            reprise.etape()
+        debut = next(lire_evenements(chemin_reprise))
+
+    types = {evenement["type"] for evenement in evenements}
+    ok1 = (evenements[0]["type"] == "debut" and evenements[-1]["type"] == "fin"
+           and evenements[-1]["raison"] == moteur.raison
+           and {"ponte", "mouvement", "butinage", "esquive", "fin_tour"} <= types)
+
+    nectars = [NECTAR_INITIAL] * moteur.nb_joueurs
+    for evenement in evenements:
+        if evenement["type"] == "depot":
+            nectars[evenement["abeille"][0]] += evenement["nectar"]
+        elif evenement["type"] == "ponte":
+            nectars[evenement["abeille"][0]] -= COUT_PONTE
+    ok2 = nectars == [ruche.nectar for ruche in moteur.ruches] == evenements[-1]["nectar_ruches"]
+
+    temoin = creer_moteur(graine=3)
+    temoin.jouer_jusqu_a_la_fin()
+    ok3 = (evenements_gz == evenements and temoin.tour == moteur.tour
+           and [r.nectar for r in temoin.ruches] == [r.nectar for r in moteur.ruches])
+    ok4 = (debut["type"] == "debut" and (debut["tour"], debut["joueur"]) == (partie.tour, partie.joueur_actuel)
+           and partie.tour > 1)
+
+    ok = ok1 + ok2 + ok3 + ok4
+    print(f"{ok}/4")
+    return ok == 4
+
+
 # ============================================================================
 # LANCEMENT
 # ============================================================================
@@ -279,7 +1402,30 @@ def lancer_tous_les_tests():
         ("tenter_ponte", test_tenter_ponte()),
         ("tenter_deplacement", test_tenter_deplacement()),
         ("calculer_force_effective", test_calculer_force_effective()),
-        ("fin_de_partie", test_fin_de_partie())
+        ("fin_de_partie", test_fin_de_partie()),
+        ("index_occupation", test_index_occupation()),
+        ("table_fleurs", test_table_fleurs()),
+        ("comptes_nectar", test_comptes_nectar()),
+        ("entites_compat", test_entites_compat()),
+        ("moteur_partie", test_moteur_partie()),
+        ("tables_deplacement", test_tables_deplacement()),
+        ("escarmouche", test_escarmouche()),
+        ("simulateur", test_simulateur()),
+        ("tournoi", test_tournoi()),
+        ("generateur_partie", test_generateur_partie()),
+        ("sauvegarde", test_sauvegarde()),
+        ("journal_coups", test_journal_coups()),
+        ("zobrist", test_zobrist()),
+        ("ia_mcts", test_ia_mcts()),
+        ("mcts_parallele", test_mcts_parallele()),
+        ("cartes_ia", test_cartes_ia()),
+        ("chemins_premove", test_chemins_premove()),
+        ("planification_groupe", test_planification_groupe()),
+        ("ia_affectation", test_ia_affectation()),
+        ("instrumentation", test_instrumentation()),
+        ("trace", test_trace()),
+        ("profileur", test_profileur()),
+        ("evenements", test_evenements())
     ]
 
     reussis = 0
@@ -0,0 +1,177 @@
+# tournoi.py - Tournois IA contre IA pour BZZZ
+"""
+Tournois de parties IA contre IA, réparties sur tous les cœurs.
+
+Chaque partie est jouée par le moteur (moteur.py) sans interface, avec une
+graine : la même graine et les mêmes IA donnent toujours la même partie.
+Chaque place (joueur 0 à 3) peut utiliser une classe d'IA différente,
+IA_BZZZ ou une de ses sous-classes, désignée par "module:Classe".
+
+Les IA MCTS cherchent normalement pendant un temps donné, ce qui dépend de la
+machine : en tournoi, elles cherchent un nombre fixe d'itérations
+(ITERATIONS_MCTS) pour que la graine redonne la même partie. Une recherche
+dure alors ≈ 1,4 s en moyenne et s'allonge avec le nombre d'abeilles : une
+partie avec une IA MCTS prend ≈ 5 minutes (200 tours), contre moins d'une
+seconde entre IA_BZZZ.
+
+Les parties sont jouées par un groupe de processus (ProcessPoolExecutor)
+et les résultats arrivent au fur et à mesure, dans l'ordre des graines.
+
+Exemple:
+    >>> for resultat in lancer_tournoi(range(100), ["ia:IA_BZZZ"] * 4):
+    ...     print(resultat["gagnant"], resultat["raison"])
+
+En ligne de commande : python bzzz.py tournament --parties 100
+"""
+import importlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from evenements import EcrivainEvenements
+from ia import IA_BZZZ
+from ia_mcts import IA_MCTS
+from moteur import MoteurBZZZ
+
+IA_PAR_DEFAUT = "ia:IA_BZZZ"
+ITERATIONS_MCTS = 1000 # itérations par recherche des IA MCTS (≈ 1,4 s en moyenne, plus avec beaucoup d'abeilles)
+
+
+def charger_classe_ia(designation):
+    """
+    Retrouve une classe d'IA à partir de sa désignation "module:Classe".
+
+    Args:
+        designation (str): Module et classe, ex: "ia:IA_BZZZ"
+
+    Returns:
+        type: La classe d'IA
+
+    Raises:
+        ValueError: Si la désignation est mal formée ou si la classe
+                    n'est pas IA_BZZZ ou une sous-classe
+    """
+    module, separateur, nom = designation.partition(":")
+    if not separateur or not module or not nom:
+        raise ValueError(f"IA '{designation}' : format attendu module:Classe (ex: {IA_PAR_DEFAUT})")
+    try:
+        classe = getattr(importlib.import_module(module), nom, None)
+    except ImportError as erreur:
+        raise ValueError(f"IA '{designation}' : module introuvable ({erreur})")
+    if not isinstance(classe, type) or not issubclass(classe, IA_BZZZ):
+        raise ValueError(f"IA '{designation}' : ce n'est pas une classe IA_BZZZ")
+    return classe
+
+
+def creer_ia_tournoi(designation):
+    """
+    Crée l'IA d'une place du tournoi.
+
+    Les IA MCTS reçoivent ITERATIONS_MCTS itérations au lieu d'un temps de
+    recherche : leur partie ne dépend plus de la vitesse de la machine.
+
+    Args:
+        designation (str): Désignation "module:Classe" de l'IA
+
+    Returns:
+        IA_BZZZ: Nouvelle IA
+    """
+    classe = charger_classe_ia(designation)
+    if issubclass(classe, IA_MCTS):
+        return classe(iterations=ITERATIONS_MCTS)
+    return classe()
+
+
+def jouer_partie_tournoi(graine, designations, dossier_evenements=None):
+    """
+    Joue une partie à 4 IA sans interface.
+
+    Args:
+        graine (int): Graine de la partie
+        designations (list): Pour chaque place, la désignation de son IA
+        dossier_evenements (str): Si donné, journal des événements de la
+                                  partie dans DOSSIER/partie_<graine>.jsonl
+
+    Returns:
+        dict: Résultat de la partie {"graine", "ias", "gagnant" (numéro du
+              joueur), "raison", "tours", "nectar_ruches"}
+    """
+    ias = [creer_ia_tournoi(designation) for designation in designations]
+    if dossier_evenements is None:
+        moteur = MoteurBZZZ({"nb_joueurs": 4, "ia": [True] * 4}, ias=ias, graine=graine)
+        gagnant, raison = moteur.jouer_jusqu_a_la_fin()
+    else:
+        with EcrivainEvenements(os.path.join(dossier_evenements, f"partie_{graine}.jsonl")):
+            moteur = MoteurBZZZ({"nb_joueurs": 4, "ia": [True] * 4}, ias=ias, graine=graine)
+            gagnant, raison = moteur.jouer_jusqu_a_la_fin()
+
+    return {
+        "graine": graine,
+        "ias": list(designations),
+        "gagnant": gagnant.joueur,
+        "raison": raison,
+        "tours": moteur.tour,
+        "nectar_ruches": [ruche.nectar for ruche in moteur.ruches]
+    }
+
+
+def lancer_tournoi(graines, designations=None, processus=None, dossier_evenements=None):
+    """
+    Joue une partie par graine et donne les résultats au fur et à mesure.
+
+    Args:
+        graines (iterable): Graines des parties
+        designations (list): Désignation de l'IA de chaque place
+                             (par défaut IA_BZZZ aux 4 places)
+        processus (int): Nombre de processus (None = nombre de cœurs,
+                         1 = tout dans le processus courant)
+        dossier_evenements (str): Si donné, dossier (créé au besoin) où
+                                  journaliser chaque partie (evenements.py)
+
+    Yields:
+        dict: Résultat de chaque partie (voir jouer_partie_tournoi()),
+              dans l'ordre des graines
+
+    Raises:
+        ValueError: Si une désignation d'IA est invalide (vérifiée avant
+                    de lancer les parties)
+    """
+    if designations is None:
+        designations = [IA_PAR_DEFAUT] * 4
+    if len(designations) != 4:
+        raise ValueError("Il faut une IA par place (4 désignations)")
+    for designation in designations:
+        charger_classe_ia(designation)
+
+    graines = list(graines)
+    if dossier_evenements is not None:
+        os.makedirs(dossier_evenements, exist_ok=True)
+    if processus is None:
+        processus = os.cpu_count() or 1
+
+    if processus <= 1:
+        for graine in graines:
+            yield jouer_partie_tournoi(graine, designations, dossier_evenements)
+        return
+
+    paquet = max(1, len(graines) // (processus * 8))
+    with ProcessPoolExecutor(max_workers=processus) as executeur:
+        yield from executeur.map(jouer_partie_tournoi, graines, [designations] * len(graines),
+                                 [dossier_evenements] * len(graines), chunksize=paquet)
+
+
+def bilan_tournoi(resultats):
+    """
+    Compte les victoires de chaque place et les raisons de fin.
+
+    Args:
+        resultats (list): Résultats des parties
+
+    Returns:
+        dict: {"parties", "victoires" (liste par place), "raisons" (dict)}
+    """
+    victoires = [0, 0, 0, 0]
+    raisons = {}
+    for resultat in resultats:
+        victoires[resultat["gagnant"]] += 1
+        raisons[resultat["raison"]] = raisons.get(resultat["raison"], 0) + 1
+    return {"parties": len(resultats), "victoires": victoires, "raisons": raisons}
@@ -0,0 +1,279 @@
+# zobrist.py - Hachage de Zobrist des positions de BZZZ
+"""
+Clé de hachage 64 bits des positions et table de transposition.
+
+Chaque élément de l'état (une abeille de tel joueur et tel rôle sur telle
+case, son nectar, son état KO, le fait qu'elle ait déjà agi, le nectar de
+chaque fleur et de chaque ruche) a une clé aléatoire de 64 bits. La clé d'une
+position est le XOR des clés de ses éléments : quand une abeille change, on
+retire son ancienne clé (XOR) puis on ajoute la nouvelle, sans tout recalculer.
+
+Le hachage est optionnel : model.activer_hachage() tire les clés et calcule
+la clé de la position, puis le modèle la tient à jour dans plateau.cle
+(placer_abeille, tenter_ponte, tenter_deplacement, butiner, deposer_nectar,
+phase_escarmouche, nouveau_tour). Sans activation, une partie ne paie ni les
+clés en mémoire (≈ 230 Mo sur un plateau 256x256) ni leur mise à jour. Deux ordres de coups qui mènent à la même position donnent la
+même clé : une IA retrouve alors la position déjà évaluée dans une
+TableTransposition au lieu de l'évaluer à nouveau.
+
+Les clés sont tirées d'une graine fixe : la clé d'une position est la même
+d'un lancement à l'autre et dans tous les processus.
+"""
+import random
+
+from entites import KO
+
+GRAINE_CLES = 0x425A5A5A # "BZZZ"
+MASQUE_64 = (1 << 64) - 1
+
+_cles_par_dimensions = {} # clés déjà tirées, une fois par jeu de dimensions
+
+
+def _melanger(valeur):
+    """
+    Mélange un entier en une clé de 64 bits (splitmix64).
+
+    Sert pour les valeurs sans borne (nectar des ruches).
+    """
+    valeur = (valeur + 0x9E3779B97F4A7C15) & MASQUE_64
+    valeur = ((valeur ^ (valeur >> 30)) * 0xBF58476D1CE4E5B9) & MASQUE_64
+    valeur = ((valeur ^ (valeur >> 27)) * 0x94D049BB133111EB) & MASQUE_64
+    return valeur ^ (valeur >> 31)
+
+
+class ClesZobrist:
+    """
+    Clés aléatoires de 64 bits de chaque élément d'une position.
+
+    Attributs:
+        abeilles (dict): abeilles[(joueur, role)][x][y] = clé de l'abeille
+        nectar_abeilles (list): nectar_abeilles[x][y][n] = clé du nectar n
+                                porté par l'abeille de la case (x, y)
+        ko (list): ko[x][y][t] = clé d'une abeille KO pour encore t tours
+        a_bouge (list): a_bouge[x][y] = clé d'une abeille qui a déjà agi
+        fleurs (list): fleurs[x][y][n] = clé d'une fleur de nectar n
+
+    Note:
+        Les valeurs au-delà des bornes des tables (nectar posé à la main
+        au-dessus du maximum...) prennent la clé de la borne : la clé reste
+        cohérente, seules ces positions peuvent se confondre.
+    """
+    __slots__ = ("abeilles", "nectar_abeilles", "ko", "a_bouge", "fleurs")
+
+    def __init__(self, taille, roles, max_nectar_fleur, max_nectar_abeille, max_ko):
+        generateur = random.Random(GRAINE_CLES)
+
+        def grille(nb_valeurs):
+            return [[[generateur.getrandbits(64) for _ in range(nb_valeurs)]
+                     for _ in range(taille)] for _ in range(taille)]
+
+        self.abeilles = {}
+        for joueur in range(4):
+            for role in roles:
+                self.abeilles[(joueur, role)] = [[generateur.getrandbits(64) for _ in range(taille)]
+                                                 for _ in range(taille)]
+        self.nectar_abeilles = grille(max_nectar_abeille + 1)
+        self.ko = grille(max_ko + 1)
+        self.a_bouge = [[generateur.getrandbits(64) for _ in range(taille)] for _ in range(taille)]
+        self.fleurs = grille(max_nectar_fleur + 1)
+
+
+def cles_zobrist(taille, roles, max_nectar_fleur, max_nectar_abeille, max_ko):
+    """
+    Retourne les clés de Zobrist de ces dimensions (tirées au premier appel).
+
+    Args:
+        taille (int): Taille du plateau
+        roles (tuple): Rôles possibles des abeilles
+        max_nectar_fleur (int): Nectar maximum d'une fleur
+        max_nectar_abeille (int): Nectar maximum porté par une abeille
+        max_ko (int): Nombre maximum de tours KO
+
+    Returns:
+        ClesZobrist: Clés de ces dimensions
+    """
+    dimensions = (taille, tuple(roles), max_nectar_fleur, max_nectar_abeille, max_ko)
+    cles = _cles_par_dimensions.get(dimensions)
+    if cles is None:
+        cles = ClesZobrist(*dimensions)
+        _cles_par_dimensions[dimensions] = cles
+    return cles
+
+
+def cle_abeille(cles, abeille):
+    """
+    Clé d'une abeille : joueur, rôle, case, nectar, état KO et a_bouge.
+
+    Args:
+        cles (ClesZobrist): Clés du plateau
+        abeille (Abeille): Abeille posée sur le plateau
+
+    Returns:
+        int: Clé de 64 bits
+    """
+    x, y = abeille.position
+    try:
+        cle = cles.abeilles[(abeille.joueur, abeille.role)][x][y] ^ cles.nectar_abeilles[x][y][abeille.nectar]
+        if abeille.etat == KO:
+            cle ^= cles.ko[x][y][abeille.tours_ko_restants]
+    except IndexError: # valeur hors des tables : clé de la borne
+        nectar = cles.nectar_abeilles[x][y]
+        cle = cles.abeilles[(abeille.joueur, abeille.role)][x][y] ^ nectar[min(abeille.nectar, len(nectar) - 1)]
+        if abeille.etat == KO:
+            ko = cles.ko[x][y]
+            cle ^= ko[min(abeille.tours_ko_restants, len(ko) - 1)]
+    if abeille.a_bouge:
+        cle ^= cles.a_bouge[x][y]
+    return cle
+
+
+def cle_fleur(cles, fleur):
+    """
+    Clé d'une fleur : case et nectar restant.
+
+    Args:
+        cles (ClesZobrist): Clés du plateau
+        fleur (Fleur): Fleur placée sur le plateau
+
+    Returns:
+        int: Clé de 64 bits
+    """
+    x, y = fleur.position
+    nectar = cles.fleurs[x][y]
+    if fleur.nectar < len(nectar):
+        return nectar[fleur.nectar]
+    return nectar[-1]
+
+
+def cle_ruche(ruche):
+    """
+    Clé d'une ruche : joueur et nectar stocké (sans borne, donc mélangé).
+
+    Args:
+        ruche (Ruche): Ruche
+
+    Returns:
+        int: Clé de 64 bits
+    """
+    return _melanger(GRAINE_CLES ^ (ruche.joueur << 56) ^ (ruche.nectar & MASQUE_64))
+
+
+def calculer_cle(plateau, ruches):
+    """
+    Calcule entièrement la clé d'une position (sans l'incrémental).
+
+    Args:
+        plateau (Plateau): Plateau de jeu (avec plateau.zobrist)
+        ruches (list): Les 4 ruches
+
+    Returns:
+        int: Clé de 64 bits de la position
+    """
+    cles = plateau.zobrist
+    cle = 0
+    for ruche in ruches:
+        cle ^= cle_ruche(ruche)
+        for abeille in ruche.abeilles:
+            cle ^= cle_abeille(cles, abeille)
+    for ligne in plateau:
+        for case in ligne:
+            for element in case:
+                if element.type == "fleur":
+                    cle ^= cle_fleur(cles, element)
+    return cle
+
+
+class TableTransposition:
+    """
+    Table de transposition de taille bornée, indexée par la clé de Zobrist.
+
+    La table a 2**bits cases ; une position va dans la case cle % 2**bits.
+    Quand la case est déjà prise par une autre position, la nouvelle la
+    remplace si l'ancienne vient d'une recherche précédente ou si la
+    nouvelle a été évaluée au moins aussi profondément (plus de calcul
+    derrière sa valeur). Sinon la nouvelle n'est pas gardée.
+
+    Attributs:
+        bits (int): log2 du nombre de cases
+        entrees (list): Par case, None ou [cle, profondeur, valeur, coup, generation]
+        generation (int): Numéro de la recherche en cours
+        trouvees (int): Nombre de recherches réussies
+        manquees (int): Nombre de recherches sans résultat
+        remplacees (int): Nombre d'entrées écrasées par une autre position
+
+    Exemple:
+        >>> table = TableTransposition(16)
+        >>> table.enregistrer(plateau.cle, 2, 37.5)
+        >>> entree = table.chercher(plateau.cle)  # (profondeur, valeur, coup)
+    """
+    __slots__ = ("bits", "masque", "entrees", "generation", "trouvees", "manquees", "remplacees")
+
+    def __init__(self, bits=16):
+        self.bits = bits
+        self.masque = (1 << bits) - 1
+        self.entrees = [None] * (1 << bits)
+        self.generation = 0
+        self.trouvees = 0
+        self.manquees = 0
+        self.remplacees = 0
+
+    def __len__(self):
+        return sum(1 for entree in self.entrees if entree is not None)
+
+    def chercher(self, cle):
+        """
+        Cherche une position déjà évaluée.
+
+        Args:
+            cle (int): Clé de Zobrist de la position
+
+        Returns:
+            tuple ou None: (profondeur, valeur, coup) si la position est dans
+                           la table, None sinon
+        """
+        entree = self.entrees[cle & self.masque]
+        if entree is not None and entree[0] == cle:
+            self.trouvees += 1
+            entree[4] = self.generation
+            return entree[1], entree[2], entree[3]
+        self.manquees += 1
+        return None
+
+    def enregistrer(self, cle, profondeur, valeur, coup=None):
+        """
+        Enregistre l'évaluation d'une position (selon la règle de remplacement).
+
+        Args:
+            cle (int): Clé de Zobrist de la position
+            profondeur (int): Profondeur de la recherche derrière la valeur
+            valeur (float): Valeur de la position
+            coup: Meilleur coup trouvé depuis cette position (optionnel)
+
+        Returns:
+            bool: True si l'entrée a été gardée
+        """
+        indice = cle & self.masque
+        entree = self.entrees[indice]
+        if entree is not None and entree[0] != cle:
+            if entree[4] == self.generation and entree[1] > profondeur:
+                return False
+            self.remplacees += 1
+        self.entrees[indice] = [cle, profondeur, valeur, coup, self.generation]
+        return True
+
+    def nouvelle_recherche(self):
+        """
+        Commence une nouvelle recherche : les entrées des recherches
+        précédentes restent lisibles mais deviennent remplaçables.
+        """
+        self.generation += 1
+
+    def vider(self):
+        """
+        Efface toutes les entrées et les compteurs.
+        """
+        self.entrees = [None] * (1 << self.bits)
+        self.generation = 0
+        self.trouvees = 0
+        self.manquees = 0
+        self.remplacees = 0